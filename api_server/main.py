@@ -1,5 +1,5 @@
 from contextlib import asynccontextmanager
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
@@ -10,8 +10,12 @@ from sqlalchemy.orm.exc import StaleDataError
 from api_server.exception_handler import (
     custom_validation_error_handler, custom_exception_handler, stale_data_error_handler,
 )
+from api_server.middleware import TracingMiddleware, RequestIdMiddleware, DeadlineMiddleware
 from api_server.router.auth.router import router as auth_router
+from api_server.router.debug.router import router as debug_router
+from api_server.router.export.router import router as export_router
 from api_server.router.floating_ip.router import router as floating_ip_router
+from api_server.router.metrics.router import router as metrics_router
 from api_server.router.network_interface.router import router as network_interface_router
 from api_server.router.project.router import router as project_router
 from api_server.router.security_group.router import router as security_group_router
@@ -21,7 +25,14 @@ from api_server.router.volume.router import router as volume_router
 from common.exception.base_exception import CustomException
 from common.infrastructure.async_client import init_async_client, close_async_client
 from common.util.envs import get_envs, Envs
-from common.util.system_token_manager import refresh_system_keystone_token
+from common.util.loop_monitor import start_loop_monitor, stop_loop_monitor
+from common.util.membership_cache import sync_membership_invalidations
+from common.util.microversion import discover_microversions
+from common.util.password_hasher import init_password_hasher, close_password_hasher
+from common.util.slow_log import flush_slow_logs
+from common.util.structured_logging import init_logging, close_logging
+from common.util.system_token_manager import refresh_system_keystone_token_if_needed
+from common.util.tracing import init_tracing, close_tracing
 
 envs: Envs = get_envs()
 
@@ -30,22 +41,51 @@ scheduler: AsyncIOScheduler = AsyncIOScheduler()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    init_logging()
     init_async_client()
+    init_password_hasher()
+    init_tracing()
+    start_loop_monitor()
 
     scheduler.add_job(
-        func=refresh_system_keystone_token,
-        trigger=IntervalTrigger(seconds=envs.REFRESH_INTERVAL_SECONDS_FOR_SYSTEM_KEYSTONE_TOKEN),
+        func=refresh_system_keystone_token_if_needed,
+        trigger=IntervalTrigger(seconds=envs.SYSTEM_KEYSTONE_TOKEN_CHECK_INTERVAL_SECONDS),
         next_run_time=datetime.now(timezone.utc),
         max_instances=1,
     )
+    # system token 발급(service catalog 조회) 이후에 실행되도록 조금 늦게 시작한다.
+    scheduler.add_job(
+        func=discover_microversions,
+        next_run_time=datetime.now(timezone.utc) + timedelta(seconds=envs.SYSTEM_KEYSTONE_TOKEN_CHECK_INTERVAL_SECONDS),
+    )
+    scheduler.add_job(
+        func=sync_membership_invalidations,
+        trigger=IntervalTrigger(seconds=envs.MEMBERSHIP_INVALIDATION_SYNC_INTERVAL_SECONDS),
+        next_run_time=datetime.now(timezone.utc),
+        max_instances=1,
+    )
+    scheduler.add_job(
+        func=flush_slow_logs,
+        trigger=IntervalTrigger(seconds=envs.SLOW_LOG_WINDOW_SECONDS),
+        max_instances=1,
+    )
     scheduler.start()
 
     yield
 
     scheduler.shutdown()
+    flush_slow_logs(force=True)
+
+    await stop_loop_monitor()
+
+    close_tracing()
+
+    close_password_hasher()
 
     await close_async_client()
 
+    close_logging()
+
 
 app = FastAPI(lifespan=lifespan)
 
@@ -57,6 +97,13 @@ app.include_router(security_group_router)
 app.include_router(floating_ip_router)
 app.include_router(server_router)
 app.include_router(network_interface_router)
+app.include_router(export_router)
+app.include_router(metrics_router)
+app.include_router(debug_router)
+
+app.add_middleware(DeadlineMiddleware)
+app.add_middleware(TracingMiddleware)
+app.add_middleware(RequestIdMiddleware)
 
 app.add_exception_handler(RequestValidationError, custom_validation_error_handler)
 app.add_exception_handler(CustomException, custom_exception_handler)
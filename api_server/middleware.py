@@ -0,0 +1,126 @@
+import uuid
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.routing import Route
+from starlette.types import ASGIApp, Scope, Receive, Send, Message
+
+from common.util.deadline import clear_deadline, use_deadline
+from common.util.envs import get_envs, Envs
+from common.util.structured_logging import use_request_id
+from common.util.tracing import Span, SpanKind, TRACEPARENT_HEADER, is_tracing_enabled, start_span
+
+envs: Envs = get_envs()
+
+REQUEST_ID_HEADER: str = "X-Request-ID"
+REQUEST_TIMEOUT_HEADER: str = "X-Request-Timeout"
+_MAX_REQUEST_ID_LENGTH: int = 128
+
+
+class RequestIdMiddleware:
+    """
+    요청마다 ID를 부여하여 요청 처리 중(BackgroundTasks 포함) 남기는 log에 포함하고, 응답 header로 반환한다.
+    요청에 `X-Request-ID` header가 있다면 그 값을 사용한다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app: ASGIApp = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id: str | None = Headers(scope=scope).get(REQUEST_ID_HEADER)
+        if not request_id or len(request_id) > _MAX_REQUEST_ID_LENGTH:
+            request_id = uuid.uuid4().hex
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
+
+        with use_request_id(request_id):
+            await self.app(scope, receive, send_with_request_id)
+
+
+class TracingMiddleware:
+    """
+    요청 하나를 root span(`{method} {route path}`)으로 기록한다.
+
+    router handler 이후 실행되는 BackgroundTasks도 같은 context에서 실행되므로 root span의 자식으로 기록된다.
+    요청에 `traceparent` header가 있다면 해당 trace에 이어서 기록한다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app: ASGIApp = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not is_tracing_enabled():
+            await self.app(scope, receive, send)
+            return
+
+        with start_span(
+            name=f"{scope['method']} {scope['path']}",
+            kind=SpanKind.SERVER,
+            attributes={"http.method": scope["method"], "http.target": scope["path"]},
+            traceparent=Headers(scope=scope).get(TRACEPARENT_HEADER),
+        ) as span:
+            async def send_with_status(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.status_code", message["status"])
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                _rename_to_route(span, scope)
+
+
+class DeadlineMiddleware:
+    """
+    요청의 처리 제한 시간(`REQUEST_TIMEOUT_SECONDS`)을 설정한다. 요청에 `X-Request-Timeout` header(초)가 있다면 그 값을 사용한다.
+    (최대 `REQUEST_TIMEOUT_MAX_SECONDS`)
+
+    handler 전체를 취소하지 않고 DB session 생성과 OpenStack API 호출에서만 제한 시간을 확인하므로,
+    실패 시 보상 transaction은 끝까지 실행된다. 응답을 시작한 이후(streaming 응답 본문, BackgroundTasks)에는 제한 시간을 적용하지 않는다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app: ASGIApp = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        timeout_seconds: float = _get_timeout_seconds(scope) if scope["type"] == "http" else 0
+        if timeout_seconds <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_and_clear_deadline(message: Message) -> None:
+            # 응답을 시작한 뒤에는 504 응답을 보낼 수 없으므로 streaming 응답 본문과 BackgroundTasks는 제한하지 않는다.
+            if message["type"] == "http.response.start":
+                clear_deadline()
+            await send(message)
+
+        with use_deadline(timeout_seconds):
+            await self.app(scope, receive, send_and_clear_deadline)
+
+
+def _get_timeout_seconds(scope: Scope) -> float:
+    timeout_header: str | None = Headers(scope=scope).get(REQUEST_TIMEOUT_HEADER)
+    try:
+        timeout_seconds: float = float(timeout_header) if timeout_header else 0
+    except ValueError:
+        timeout_seconds = 0
+    # NaN, inf 등 잘못된 값이나 0 이하의 값은 무시한다.
+    if not 0 < timeout_seconds < float("inf"):
+        timeout_seconds = envs.REQUEST_TIMEOUT_SECONDS
+    if envs.REQUEST_TIMEOUT_MAX_SECONDS > 0:
+        timeout_seconds = min(timeout_seconds, envs.REQUEST_TIMEOUT_MAX_SECONDS)
+    return timeout_seconds
+
+
+def _rename_to_route(span: Span, scope: Scope) -> None:
+    # path parameter 값(ex. `/servers/1`)마다 span 이름이 달라지지 않도록 route의 path template을 사용한다.
+    route: Route | None = scope.get("route")
+    if route is not None:
+        span.name = f"{scope['method']} {route.path}"
+        span.set_attribute("http.route", route.path)
@@ -5,3 +5,11 @@ class LoginRequest(BaseModel):
     account_id: str = Field(max_length=15, description="로그인 id", examples=["woody0105"])
     password: str = Field(description="비밀번호", examples=["1q2w3e4r"])
     project_id: int | None = Field(default=None, description="Id of project")
+
+
+class SwitchProjectRequest(BaseModel):
+    project_id: int = Field(description="전환할 프로젝트의 id", examples=[1])
+
+
+class RefreshTokenRequest(BaseModel):
+    refresh_token: str = Field(description="refresh token")
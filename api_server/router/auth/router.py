@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, Body
 
-from api_server.router.auth.request import LoginRequest
-from common.application.auth.response import LoginResponse
+from api_server.router.auth.request import LoginRequest, SwitchProjectRequest, RefreshTokenRequest
+from common.application.auth.response import LoginResponse, TokenResponse
 from common.application.auth.service import AuthService
+from common.util.auth_token_manager import get_current_user
+from common.util.context import CurrentUser
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -13,7 +15,8 @@ router = APIRouter(prefix="/auth", tags=["auth"])
         400: {"description": "유저가 소속된 프로젝트가 없는 경우."},
         401: {"description": "인증 정보가 잘못된 경우"},
         403: {"description": "<code>project_id</code>에 해당하는 프로젝트에 소속되지 않았거나 접근 권한이 없는 경우."},
-        422: {"description": "요청 데이터의 값이나 형식이 잘못된 경우"}
+        422: {"description": "요청 데이터의 값이나 형식이 잘못된 경우"},
+        503: {"description": "비밀번호 처리 요청이 많아 처리할 수 없는 경우"}
     }
 )
 async def login(
@@ -25,3 +28,46 @@ async def login(
         account_id=request.account_id,
         password=request.password,
     )
+
+
+@router.post(
+    path="/switch-project", status_code=200,
+    responses={
+        401: {"description": "access token이 유효하지 않은 경우"},
+        403: {"description": "<code>project_id</code>에 해당하는 프로젝트에 소속되지 않은 경우."},
+        422: {"description": "요청 데이터의 값이나 형식이 잘못된 경우"}
+    }
+)
+async def switch_project(
+    request: SwitchProjectRequest = Body(),
+    current_user: CurrentUser = Depends(get_current_user),
+    auth_service: AuthService = Depends(),
+) -> TokenResponse:
+    return await auth_service.switch_project(current_user=current_user, project_id=request.project_id)
+
+
+@router.post(
+    path="/refresh", status_code=200,
+    responses={
+        401: {"description": "refresh token이 유효하지 않거나, 만료 또는 폐기된 경우"},
+        422: {"description": "요청 데이터의 값이나 형식이 잘못된 경우"}
+    }
+)
+async def refresh(
+    request: RefreshTokenRequest = Body(),
+    auth_service: AuthService = Depends(),
+) -> TokenResponse:
+    return await auth_service.refresh(refresh_token=request.refresh_token)
+
+
+@router.post(
+    path="/logout", status_code=204,
+    responses={
+        422: {"description": "요청 데이터의 값이나 형식이 잘못된 경우"}
+    }
+)
+async def logout(
+    request: RefreshTokenRequest = Body(),
+    auth_service: AuthService = Depends(),
+) -> None:
+    await auth_service.revoke_refresh_token(refresh_token=request.refresh_token)
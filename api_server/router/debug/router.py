@@ -0,0 +1,111 @@
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import Response
+from starlette.status import HTTP_200_OK, HTTP_204_NO_CONTENT
+
+from common.application.debug.response import MemorySnapshotResponse, MemoryObjectsResponse
+from common.application.debug.service import DebugService
+from common.application.metrics.response import MemoryResponse
+from common.util.auth_token_manager import get_current_admin
+from common.util.context import CurrentUser
+from common.util.envs import get_envs, Envs
+from common.util.sampling_profiler import ProfileFormat
+
+envs: Envs = get_envs()
+
+router = APIRouter(prefix="/debug", tags=["debug"])
+
+_MEDIA_TYPES: dict[ProfileFormat, str] = {
+    ProfileFormat.COLLAPSED: "text/plain",
+    ProfileFormat.SPEEDSCOPE: "application/json",
+}
+
+
+@router.get(
+    path="/profile", status_code=HTTP_200_OK,
+    summary="worker process 프로파일링",
+    description="요청을 처리한 worker process의 모든 thread를 지정한 시간 동안 sampling하여 "
+                "collapsed stack 또는 speedscope 형식으로 반환합니다. 관리자만 호출할 수 있습니다.",
+    responses={
+        200: {"content": {"text/plain": {}, "application/json": {}}},
+        401: {"description": "인증 정보가 유효하지 않은 경우"},
+        403: {"description": "관리자가 아닌 경우"},
+        409: {"description": "이미 profiling이 진행 중인 경우"},
+    },
+)
+async def profile(
+    seconds: int = Query(default=10, ge=1, le=envs.PROFILER_MAX_SECONDS, description="profiling 시간(초)"),
+    profile_format: ProfileFormat = Query(default=ProfileFormat.COLLAPSED, alias="format"),
+    current_user: CurrentUser = Depends(get_current_admin),
+    debug_service: DebugService = Depends(),
+) -> Response:
+    content: str = await debug_service.profile(seconds=seconds, profile_format=profile_format)
+    return Response(content=content, media_type=_MEDIA_TYPES[profile_format])
+
+
+@router.post(
+    path="/memory/tracing", status_code=HTTP_200_OK,
+    summary="memory 추적 시작",
+    description="요청을 처리한 worker process의 memory allocation 추적(tracemalloc)을 시작하고 현재 상태를 비교 기준으로 저장합니다. "
+                "이미 추적 중이라면 비교 기준만 다시 저장합니다. 관리자만 호출할 수 있습니다.",
+    responses={
+        401: {"description": "인증 정보가 유효하지 않은 경우"},
+        403: {"description": "관리자가 아닌 경우"},
+    },
+)
+async def start_memory_tracing(
+    frames: int = Query(default=1, ge=1, le=100, description="allocation 별로 저장할 traceback의 frame 수"),
+    current_user: CurrentUser = Depends(get_current_admin),
+    debug_service: DebugService = Depends(),
+) -> MemoryResponse:
+    return debug_service.start_memory_tracing(frames=frames)
+
+
+@router.delete(
+    path="/memory/tracing", status_code=HTTP_204_NO_CONTENT,
+    summary="memory 추적 중지",
+    responses={
+        401: {"description": "인증 정보가 유효하지 않은 경우"},
+        403: {"description": "관리자가 아닌 경우"},
+    },
+)
+async def stop_memory_tracing(
+    current_user: CurrentUser = Depends(get_current_admin),
+    debug_service: DebugService = Depends(),
+) -> None:
+    debug_service.stop_memory_tracing()
+
+
+@router.post(
+    path="/memory/snapshots", status_code=HTTP_200_OK,
+    summary="memory snapshot 비교",
+    description="snapshot을 찍어 이전 snapshot(또는 추적 시작 시점) 이후 memory가 많이 증가한 파일, line을 조회합니다. "
+                "찍은 snapshot은 다음 비교의 기준이 됩니다. 관리자만 호출할 수 있습니다.",
+    responses={
+        401: {"description": "인증 정보가 유효하지 않은 경우"},
+        403: {"description": "관리자가 아닌 경우"},
+        409: {"description": "memory 추적이 시작되지 않은 경우"},
+    },
+)
+async def take_memory_snapshot(
+    limit: int = Query(default=20, ge=1, le=500, description="조회할 allocation 위치 수"),
+    current_user: CurrentUser = Depends(get_current_admin),
+    debug_service: DebugService = Depends(),
+) -> MemorySnapshotResponse:
+    return await debug_service.take_memory_snapshot(limit=limit)
+
+
+@router.get(
+    path="/memory/objects", status_code=HTTP_200_OK,
+    summary="type 별 객체 수 조회",
+    description="요청을 처리한 worker process에서 gc가 추적하는 객체 수를 type 별로 조회합니다. 관리자만 호출할 수 있습니다.",
+    responses={
+        401: {"description": "인증 정보가 유효하지 않은 경우"},
+        403: {"description": "관리자가 아닌 경우"},
+    },
+)
+async def count_objects(
+    limit: int = Query(default=50, ge=1, le=500, description="조회할 type 수"),
+    current_user: CurrentUser = Depends(get_current_admin),
+    debug_service: DebugService = Depends(),
+) -> MemoryObjectsResponse:
+    return debug_service.count_objects(limit=limit)
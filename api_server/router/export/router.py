@@ -0,0 +1,112 @@
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from common.application.floating_ip.response import FloatingIpDetailResponse
+from common.application.floating_ip.service import FloatingIpService
+from common.application.security_group.response import SecurityGroupDetailResponse
+from common.application.security_group.service import SecurityGroupService
+from common.application.server.response import ServerDetailResponse
+from common.application.server.service import ServerService
+from common.application.volume.response import VolumeDetailResponse
+from common.application.volume.service import VolumeService
+from common.util.auth_token_manager import get_current_user
+from common.util.context import CurrentUser
+
+router = APIRouter(prefix="/export", tags=["export"])
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+# 한 줄씩 전송하면 전송 횟수가 너무 많아지므로, 일정 크기만큼 모아서 전송한다.
+_CHUNK_SIZE_BYTES = 64 * 1024
+
+
+def _ndjson_responses(model: type[BaseModel]) -> dict:
+    return {
+        200: {
+            "description": f"한 줄에 하나의 `{model.__name__}` JSON 객체 (NDJSON)",
+            "content": {NDJSON_MEDIA_TYPE: {"schema": {"$ref": f"#/components/schemas/{model.__name__}"}}},
+        },
+        401: {"description": "인증 정보가 유효하지 않은 경우"},
+    }
+
+
+async def _to_ndjson(items: AsyncIterator[BaseModel]) -> AsyncIterator[bytes]:
+    buffer: bytearray = bytearray()
+    async for item in items:
+        buffer += item.__pydantic_serializer__.to_json(item)
+        buffer += b"\n"
+        if len(buffer) >= _CHUNK_SIZE_BYTES:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+@router.get(
+    "/servers", status_code=200,
+    summary="프로젝트의 전체 서버 목록 내보내기 (NDJSON)",
+    response_class=StreamingResponse,
+    responses=_ndjson_responses(ServerDetailResponse),
+)
+async def export_servers(
+    current_user: CurrentUser = Depends(get_current_user),
+    server_service: ServerService = Depends(),
+) -> StreamingResponse:
+    return StreamingResponse(
+        _to_ndjson(server_service.export_servers_details(project_id=current_user.project_id)),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
+
+
+@router.get(
+    "/volumes", status_code=200,
+    summary="프로젝트의 전체 볼륨 목록 내보내기 (NDJSON)",
+    response_class=StreamingResponse,
+    responses=_ndjson_responses(VolumeDetailResponse),
+)
+async def export_volumes(
+    current_user: CurrentUser = Depends(get_current_user),
+    volume_service: VolumeService = Depends(),
+) -> StreamingResponse:
+    return StreamingResponse(
+        _to_ndjson(volume_service.export_volume_details(current_project_id=current_user.project_id)),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
+
+
+@router.get(
+    "/security-groups", status_code=200,
+    summary="프로젝트의 전체 보안 그룹 목록(rule 포함) 내보내기 (NDJSON)",
+    response_class=StreamingResponse,
+    responses=_ndjson_responses(SecurityGroupDetailResponse),
+)
+async def export_security_groups(
+    current_user: CurrentUser = Depends(get_current_user),
+    security_group_service: SecurityGroupService = Depends(),
+) -> StreamingResponse:
+    security_groups: AsyncIterator[SecurityGroupDetailResponse] = (
+        await security_group_service.export_security_groups_details(
+            project_id=current_user.project_id,
+            project_openstack_id=current_user.project_openstack_id,
+            keystone_token=current_user.keystone_token,
+        )
+    )
+    return StreamingResponse(_to_ndjson(security_groups), media_type=NDJSON_MEDIA_TYPE)
+
+
+@router.get(
+    "/floating-ips", status_code=200,
+    summary="프로젝트의 전체 플로팅 IP 목록 내보내기 (NDJSON)",
+    response_class=StreamingResponse,
+    responses=_ndjson_responses(FloatingIpDetailResponse),
+)
+async def export_floating_ips(
+    current_user: CurrentUser = Depends(get_current_user),
+    floating_ip_service: FloatingIpService = Depends(),
+) -> StreamingResponse:
+    return StreamingResponse(
+        _to_ndjson(floating_ip_service.export_floating_ips_details(project_id=current_user.project_id)),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
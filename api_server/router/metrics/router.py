@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends
+
+from common.application.metrics.response import MetricsResponse
+from common.application.metrics.service import MetricsService
+from common.util.auth_token_manager import get_current_admin
+from common.util.context import CurrentUser
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get(
+    path="", status_code=200,
+    summary="운영 지표 조회",
+    description="요청을 처리한 worker process의 event loop 지연 시간, cache 적중률 등의 지표를 조회합니다. "
+                "내부 endpoint, SQL 등이 포함되므로 관리자만 호출할 수 있습니다.",
+    responses={
+        401: {"description": "인증 정보가 유효하지 않은 경우"},
+        403: {"description": "관리자가 아닌 경우"},
+    },
+)
+async def get_metrics(
+    current_user: CurrentUser = Depends(get_current_admin),
+    metrics_service: MetricsService = Depends(),
+) -> MetricsResponse:
+    return metrics_service.get_metrics()
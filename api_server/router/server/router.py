@@ -1,6 +1,6 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Query, Depends, BackgroundTasks
+from fastapi import APIRouter, Query, Depends, BackgroundTasks, Response
 from starlette.status import HTTP_200_OK, HTTP_202_ACCEPTED
 
 from api_server.router.server.request import UpdateServerInfoRequest, CreateServerRequest
@@ -22,6 +22,7 @@ router = APIRouter(prefix="/servers", tags=["server"])
 @router.get(
     "", status_code=HTTP_200_OK,
     summary="서버 목록 조회",
+    response_model=ServerDetailsResponse,
     responses={
         401: {"description": "인증 정보가 유효하지 않은 경우"},
         422: {"description": "쿼리 파라미터 값이나 형식이 잘못된 경우"}
@@ -37,8 +38,8 @@ async def find_servers(
     order: SortOrder = SortOrder.DESC,
     current_user: CurrentUser = Depends(get_current_user),
     server_service: ServerService = Depends()
-) -> ServerDetailsResponse:
-    return await server_service.find_servers_details(
+) -> Response:
+    response: ServerDetailsResponse = await server_service.find_servers_details(
         id_=id_,
         ids_contain=ids_contain,
         ids_exclude=ids_exclude,
@@ -48,6 +49,8 @@ async def find_servers(
         order=order,
         project_id=current_user.project_id,
     )
+    # 서버가 많은 프로젝트에서는 FastAPI의 응답 재검증과 `jsonable_encoder` 변환 비용이 크므로 직접 직렬화한다.
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 @router.get(
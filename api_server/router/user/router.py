@@ -57,7 +57,8 @@ async def get_user(
     summary="유저 생성",
     responses={
         409: {"description": "로그인 id, 이름이 이미 사용중인 경우"},
-        422: {"description": "요청 데이터의 값이나 형식이 잘못된 경우"}
+        422: {"description": "요청 데이터의 값이나 형식이 잘못된 경우"},
+        503: {"description": "비밀번호 처리 요청이 많아 처리할 수 없는 경우"}
     }
 )
 async def create_user(
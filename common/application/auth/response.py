@@ -25,3 +25,9 @@ class UserResponse(BaseModel):
 class LoginResponse(BaseModel):
     user: UserResponse = Field(description="로그인한 유저 정보")
     token: str = Field(description="access token")
+    refresh_token: str = Field(description="access token 재발급에 사용하는 refresh token")
+
+
+class TokenResponse(BaseModel):
+    token: str = Field(description="access token")
+    refresh_token: str = Field(description="access token 재발급에 사용하는 refresh token")
@@ -1,33 +1,44 @@
-import asyncio
+import uuid
+from datetime import datetime
 
-import bcrypt
 from fastapi import Depends
 
-from common.application.auth.response import LoginResponse, UserResponse
+from common.application.auth.response import LoginResponse, UserResponse, TokenResponse
 from common.domain.keystone.model import KeystoneToken
 from common.domain.project.entity import Project
+from common.domain.refresh_token.entity import RefreshToken
 from common.domain.user.entity import User
-from common.exception.auth_exception import InvalidAuthException
+from common.exception.auth_exception import InvalidAuthException, InvalidRefreshTokenException
 from common.exception.project_exception import ProjectAccessDeniedException
 from common.exception.user_exception import UserNotJoinedAnyProjectException
 from common.infrastructure.database import transactional
 from common.infrastructure.keystone.client import KeystoneClient
+from common.infrastructure.project.repository import ProjectRepository
+from common.infrastructure.refresh_token.repository import RefreshTokenRepository
 from common.infrastructure.user.repository import UserRepository
-from common.util.auth_token_manager import create_access_token
+from common.util.auth_token_manager import create_access_token, create_refresh_token, hash_refresh_token, \
+    encrypt_keystone_token, decrypt_keystone_token
+from common.util.context import CurrentUser
 from common.util.envs import Envs, get_envs
+from common.util.membership_cache import is_project_member
+from common.util.password_hasher import check_password
+from common.util.tracing import trace_methods
 
 envs: Envs = get_envs()
 
 
+@trace_methods
 class AuthService:
-    encoding: str = "UTF-8"
-
     def __init__(
         self,
         user_repository: UserRepository = Depends(),
+        project_repository: ProjectRepository = Depends(),
+        refresh_token_repository: RefreshTokenRepository = Depends(),
         keystone_client: KeystoneClient = Depends(),
     ):
         self.user_repository = user_repository
+        self.project_repository = project_repository
+        self.refresh_token_repository = refresh_token_repository
         self.keystone_client = keystone_client
 
     async def login(
@@ -55,31 +66,181 @@ class AuthService:
             user_openstack_id=user.openstack_id,
             project_id=project.id,
             project_openstack_id=project.openstack_id,
-            keystone_token=keystone_token
+            keystone_token=keystone_token,
+            project_region=project.region,
+        )
+        refresh_token: str = await self._issue_refresh_token(
+            user_id=user.id,
+            project_id=project.id,
+            keystone_token=keystone_token,
+        )
+
+        return LoginResponse(user=UserResponse.from_entity(user), token=access_token, refresh_token=refresh_token)
+
+    async def switch_project(
+        self,
+        current_user: CurrentUser,
+        project_id: int,
+    ) -> TokenResponse:
+        """
+        비밀번호 인증 없이, 현재 access token의 keystone token을 다른 프로젝트로 rescope하여 access token을 재발급한다.
+
+        :raise ProjectAccessDeniedException: `project_id`에 해당하는 프로젝트에 소속되지 않은 경우
+        """
+        # 소속 여부 확인 (membership cache)
+        if not await is_project_member(user_id=current_user.user_id, project_id=project_id):
+            raise ProjectAccessDeniedException(project_id=project_id)
+
+        project: Project | None = await self.project_repository.find_by_id(project_id=project_id)
+        if project is None:
+            raise ProjectAccessDeniedException(project_id=project_id)
+
+        # Keystone token rescope
+        keystone_token: KeystoneToken = await self._rescope_keystone_token(
+            keystone_token=current_user.keystone_token,
+            project_openstack_id=project.openstack_id,
+        )
+
+        # Access token, refresh token 발급
+        access_token: str = create_access_token(
+            user_id=current_user.user_id,
+            user_openstack_id=current_user.user_openstack_id,
+            project_id=project.id,
+            project_openstack_id=project.openstack_id,
+            keystone_token=keystone_token,
+            project_region=project.region,
+        )
+        refresh_token: str = await self._issue_refresh_token(
+            user_id=current_user.user_id,
+            project_id=project.id,
+            keystone_token=keystone_token,
+        )
+
+        return TokenResponse(token=access_token, refresh_token=refresh_token)
+
+    async def refresh(self, refresh_token: str) -> TokenResponse:
+        """
+        refresh token으로 access token을 재발급한다. 비밀번호 인증 없이 기존 keystone token을 rescope한다.
+
+        사용된 refresh token은 폐기되고 새 refresh token이 발급된다. (rotation)
+        이미 사용된 refresh token이 다시 사용되면 탈취된 것으로 보고, 같은 family의 refresh token을 모두 폐기한다.
+
+        :raise InvalidRefreshTokenException: refresh token이 없거나, 만료 또는 폐기되었거나, 프로젝트에서 제외된 경우
+        """
+        # 기존 refresh token 폐기 (rotation)
+        stored: RefreshToken | None = await self._consume_refresh_token(refresh_token=refresh_token)
+        if stored is None:
+            raise InvalidRefreshTokenException()
+
+        if not await is_project_member(user_id=stored.user_id, project_id=stored.project_id):
+            raise InvalidRefreshTokenException()
+
+        user: User | None = await self.user_repository.find_by_id(user_id=stored.user_id)
+        project: Project | None = await self.project_repository.find_by_id(project_id=stored.project_id)
+        if user is None or project is None:
+            raise InvalidRefreshTokenException()
+
+        stored_keystone_token: str | None = decrypt_keystone_token(stored.encrypted_keystone_token)
+        if stored_keystone_token is None:
+            raise InvalidRefreshTokenException()
+
+        # Keystone token rescope
+        keystone_token: KeystoneToken = await self._rescope_keystone_token(
+            keystone_token=stored_keystone_token,
+            project_openstack_id=project.openstack_id,
+        )
+
+        # Access token, refresh token 발급
+        access_token: str = create_access_token(
+            user_id=user.id,
+            user_openstack_id=user.openstack_id,
+            project_id=project.id,
+            project_openstack_id=project.openstack_id,
+            keystone_token=keystone_token,
+            project_region=project.region,
+        )
+        new_refresh_token: str = await self._issue_refresh_token(
+            user_id=user.id,
+            project_id=project.id,
+            keystone_token=keystone_token,
+            family_id=stored.family_id,
         )
 
-        return LoginResponse(user=UserResponse.from_entity(user), token=access_token)
+        return TokenResponse(token=access_token, refresh_token=new_refresh_token)
+
+    @transactional
+    async def revoke_refresh_token(self, refresh_token: str) -> None:
+        """
+        refresh token과, 같은 family(같은 로그인에서 rotation으로 발급된)의 refresh token을 모두 폐기한다.
+        존재하지 않는 refresh token이면 아무 작업도 하지 않는다.
+        """
+        stored: RefreshToken | None = await self.refresh_token_repository.find_by_token_hash(
+            token_hash=hash_refresh_token(refresh_token)
+        )
+        if stored is not None:
+            await self.refresh_token_repository.revoke_all_by_family_id(family_id=stored.family_id)
+
+    @transactional
+    async def _consume_refresh_token(self, refresh_token: str) -> RefreshToken | None:
+        """
+        :return: 유효한 refresh token이면 폐기 후 반환하고, 그렇지 않으면 None
+        """
+        stored: RefreshToken | None = await self.refresh_token_repository.find_by_token_hash(
+            token_hash=hash_refresh_token(refresh_token)
+        )
+        if stored is None or stored.is_expired():
+            return None
+
+        if stored.is_revoked or not await self.refresh_token_repository.revoke_if_active(refresh_token_id=stored.id):
+            # 이미 사용된 refresh token의 재사용
+            await self.refresh_token_repository.revoke_all_by_family_id(family_id=stored.family_id)
+            return None
+
+        return stored
 
     @transactional
+    async def _issue_refresh_token(
+        self,
+        user_id: int,
+        project_id: int,
+        keystone_token: KeystoneToken,
+        family_id: str | None = None,
+    ) -> str:
+        refresh_token: str
+        expires_at: datetime
+        refresh_token, expires_at = create_refresh_token(keystone_token=keystone_token)
+        await self.refresh_token_repository.create(
+            refresh_token=RefreshToken.create(
+                user_id=user_id,
+                project_id=project_id,
+                family_id=family_id or uuid.uuid4().hex,
+                token_hash=hash_refresh_token(refresh_token),
+                encrypted_keystone_token=encrypt_keystone_token(keystone_token.token),
+                expires_at=expires_at,
+            )
+        )
+        return refresh_token
+
     async def _authenticate_user(
         self,
         account_id: str,
         password: str,
     ) -> User:
-        user: User | None = await self.user_repository.find_by_account_id(account_id=account_id, with_relations=True)
+        # bcrypt 연산을 기다리는 동안 DB connection을 점유하지 않도록, user 조회 transaction이 끝난 뒤 비밀번호를 검증한다.
+        user: User | None = await self._find_user_by_account_id(account_id=account_id)
         if user is None:
             raise InvalidAuthException()
 
-        is_valid_password: bool = await asyncio.to_thread(
-            bcrypt.checkpw,
-            password=password.encode(self.encoding),
-            hashed_password=user.password.encode(self.encoding)
-        )
+        is_valid_password: bool = await check_password(password=password, hashed_password=user.password)
         if not is_valid_password:
             raise InvalidAuthException()
 
         return user
 
+    @transactional
+    async def _find_user_by_account_id(self, account_id: str) -> User | None:
+        return await self.user_repository.find_by_account_id(account_id=account_id, with_relations=True)
+
     @transactional
     async def _choose_project(
         self,
@@ -114,3 +275,16 @@ class AuthService:
             project_openstack_id=project_openstack_id,
         )
         return KeystoneToken.from_token(token=token, expires_at=expires_at)
+
+    async def _rescope_keystone_token(
+        self,
+        keystone_token: str,
+        project_openstack_id: str,
+    ) -> KeystoneToken:
+        token: str
+        expires_at: str
+        token, expires_at = await self.keystone_client.authenticate_with_token(
+            keystone_token=keystone_token,
+            project_openstack_id=project_openstack_id,
+        )
+        return KeystoneToken.from_token(token=token, expires_at=expires_at)
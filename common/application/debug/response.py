@@ -0,0 +1,29 @@
+from pydantic import BaseModel, Field, ConfigDict
+
+from common.application.metrics.response import MemoryResponse
+
+
+class AllocationDiffResponse(BaseModel):
+    filename: str = Field(description="allocation이 발생한 파일")
+    lineno: int = Field(description="allocation이 발생한 line")
+    size_bytes: int = Field(description="현재 할당된 크기(byte)")
+    size_diff_bytes: int = Field(description="이전 snapshot 대비 증가한 크기(byte)")
+    count: int = Field(description="현재 할당된 memory block 수")
+    count_diff: int = Field(description="이전 snapshot 대비 증가한 memory block 수")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class MemorySnapshotResponse(BaseModel):
+    memory: MemoryResponse = Field(description="process memory 사용량")
+    allocations: list[AllocationDiffResponse] = Field(description="이전 snapshot 대비 증가량이 큰 allocation 위치 목록")
+
+
+class ObjectCountResponse(BaseModel):
+    type: str = Field(description="객체 type", examples=["sqlalchemy.orm.state.InstanceState"])
+    count: int = Field(description="객체 수")
+
+
+class MemoryObjectsResponse(BaseModel):
+    memory: MemoryResponse = Field(description="process memory 사용량")
+    objects: list[ObjectCountResponse] = Field(description="gc가 추적하는 객체 수가 많은 type 목록")
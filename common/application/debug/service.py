@@ -0,0 +1,68 @@
+import json
+import os
+from collections import Counter
+
+from common.application.debug.response import (
+    MemorySnapshotResponse, AllocationDiffResponse, ObjectCountResponse, MemoryObjectsResponse,
+)
+from common.application.metrics.response import MemoryResponse
+from common.util.envs import get_envs, Envs
+from common.util.memory_profiler import (
+    start_memory_tracing, stop_memory_tracing, take_memory_snapshot_diff, count_objects_by_type, get_memory_stats,
+)
+from common.util.sampling_profiler import ProfileFormat, profile, to_collapsed, to_speedscope
+
+envs: Envs = get_envs()
+
+
+class DebugService:
+    async def profile(self, seconds: int, profile_format: ProfileFormat) -> str:
+        """
+        요청을 처리한 worker process를 `seconds` 동안 sampling profiling한다.
+
+        :param seconds: profiling 시간(초)
+        :param profile_format: 결과 file 형식
+        :return: collapsed stack text 또는 speedscope JSON
+        :raise ProfilerBusyException: 이미 다른 profiling이 진행 중인 경우
+        """
+        interval_seconds: float = envs.PROFILER_SAMPLING_INTERVAL_MS / 1000
+        samples: Counter[tuple[str, ...]] = await profile(seconds=seconds, interval_seconds=interval_seconds)
+
+        if profile_format == ProfileFormat.SPEEDSCOPE:
+            return json.dumps(
+                to_speedscope(samples, interval_seconds=interval_seconds, name=f"pid {os.getpid()} ({seconds}s)")
+            )
+        return to_collapsed(samples)
+
+    def start_memory_tracing(self, frames: int) -> MemoryResponse:
+        """
+        요청을 처리한 worker process의 memory allocation 추적(tracemalloc)을 시작하고, 현재 상태를 비교 기준 snapshot으로 저장한다.
+        """
+        start_memory_tracing(frames=frames)
+        return MemoryResponse.model_validate(get_memory_stats())
+
+    def stop_memory_tracing(self) -> None:
+        stop_memory_tracing()
+
+    async def take_memory_snapshot(self, limit: int) -> MemorySnapshotResponse:
+        """
+        이전 snapshot 이후 memory 증가량이 큰 allocation 위치(파일, line)를 조회한다.
+
+        :raise MemoryTracingNotStartedException: memory 추적이 시작되지 않은 경우
+        """
+        allocations: list[AllocationDiffResponse] = [
+            AllocationDiffResponse.model_validate(allocation) for allocation in await take_memory_snapshot_diff(limit)
+        ]
+        return MemorySnapshotResponse(
+            memory=MemoryResponse.model_validate(get_memory_stats()),
+            allocations=allocations,
+        )
+
+    def count_objects(self, limit: int) -> MemoryObjectsResponse:
+        return MemoryObjectsResponse(
+            memory=MemoryResponse.model_validate(get_memory_stats()),
+            objects=[
+                ObjectCountResponse(type=object_type, count=count)
+                for object_type, count in count_objects_by_type(limit)
+            ],
+        )
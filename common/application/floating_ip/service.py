@@ -1,3 +1,5 @@
+from typing import AsyncGenerator
+
 from fastapi import Depends
 
 from common.application.floating_ip.response import FloatingIpDetailsResponse, FloatingIpDetailResponse, \
@@ -11,8 +13,10 @@ from common.infrastructure.database import transactional
 from common.infrastructure.floating_ip.repository import FloatingIpRepository
 from common.infrastructure.neutron.client import NeutronClient
 from common.util.compensating_transaction import CompensationManager
+from common.util.tracing import trace_methods
 
 
+@trace_methods
 class FloatingIpService:
     def __init__(
         self,
@@ -42,6 +46,13 @@ class FloatingIpService:
             floating_ips=[await FloatingIpDetailResponse.from_entity(floating_ip) for floating_ip in floating_ips]
         )
 
+    async def export_floating_ips_details(self, project_id: int) -> AsyncGenerator[FloatingIpDetailResponse, None]:
+        """
+        프로젝트의 모든 플로팅 IP를 DB에서 streaming으로 조회하여 하나씩 응답으로 변환한다.
+        """
+        async for floating_ip in self.floating_ip_repository.stream_all_by_project_id(project_id=project_id):
+            yield await FloatingIpDetailResponse.from_entity(floating_ip)
+
     @transactional
     async def get_floating_ip_detail(
         self,
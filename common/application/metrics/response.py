@@ -0,0 +1,156 @@
+import math
+from datetime import datetime, timezone
+
+from pydantic import BaseModel, Field, ConfigDict
+
+from common.util.circuit_breaker import CircuitBreakerStats
+from common.util.loop_monitor import LoopLagStats, SlowCallback
+from common.util.slow_log import SlowOperationStats
+
+
+class LoopLagBucketResponse(BaseModel):
+    le_ms: float | None = Field(description="bucket 상한(ms). 마지막 bucket(+Inf)은 null")
+    count: int = Field(description="상한 이하로 관측된 누적 횟수")
+
+
+class SlowCallbackResponse(BaseModel):
+    callback: str = Field(description="event loop를 점유한 coroutine 이름과 위치")
+    duration_ms: float = Field(description="점유 시간(ms)")
+    occurred_at: datetime = Field(description="발생 시각")
+
+    @classmethod
+    def from_stats(cls, slow_callback: SlowCallback) -> "SlowCallbackResponse":
+        return cls(
+            callback=slow_callback.callback,
+            duration_ms=slow_callback.duration_ms,
+            occurred_at=datetime.fromtimestamp(slow_callback.occurred_at, tz=timezone.utc),
+        )
+
+
+class LoopLagResponse(BaseModel):
+    buckets: list[LoopLagBucketResponse] = Field(description="event loop 지연 시간 histogram")
+    count: int = Field(description="관측 횟수")
+    sum_ms: float = Field(description="지연 시간 합계(ms)")
+    max_ms: float = Field(description="최대 지연 시간(ms)")
+    slow_callbacks: int = Field(description="기준 시간 이상 event loop를 점유한 callback 수")
+    recent_slow_callbacks: list[SlowCallbackResponse] = Field(description="최근 기록된 느린 callback 목록")
+
+    @classmethod
+    def from_stats(cls, stats: LoopLagStats) -> "LoopLagResponse":
+        return cls(
+            buckets=[
+                LoopLagBucketResponse(le_ms=None if math.isinf(bound) else bound, count=count)
+                for bound, count in stats.buckets
+            ],
+            count=stats.count,
+            sum_ms=stats.sum_ms,
+            max_ms=stats.max_ms,
+            slow_callbacks=stats.slow_callbacks,
+            recent_slow_callbacks=[SlowCallbackResponse.from_stats(callback) for callback in stats.recent_slow_callbacks],
+        )
+
+
+class CacheStatsResponse(BaseModel):
+    hits: int = Field(description="cache hit 횟수")
+    misses: int = Field(description="cache miss 횟수")
+    size: int = Field(description="현재 cache 크기")
+    max_size: int = Field(description="최대 cache 크기")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PasswordHasherStatsResponse(BaseModel):
+    max_workers: int = Field(description="bcrypt 연산 process 수")
+    max_queue_size: int = Field(description="대기 가능한 최대 연산 수")
+    in_flight: int = Field(description="실행 또는 대기 중인 연산 수")
+    completed: int = Field(description="완료된 연산 수")
+    failed: int = Field(description="실패한 연산 수 (잘못된 hash 형식, worker process 종료 등)")
+    rejected: int = Field(description="queue 초과로 거절된 연산 수")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CircuitBreakerResponse(BaseModel):
+    name: str = Field(description="OpenStack endpoint", examples=["http://controller:8774"])
+    state: str = Field(description="circuit 상태 (closed, open, half_open)")
+    consecutive_failures: int = Field(description="연속 실패 횟수")
+    rejected: int = Field(description="circuit이 열려 거절된 요청 수")
+
+    @classmethod
+    def from_stats(cls, stats: CircuitBreakerStats) -> "CircuitBreakerResponse":
+        return cls(
+            name=stats.name,
+            state=stats.state.value,
+            consecutive_failures=stats.consecutive_failures,
+            rejected=stats.rejected,
+        )
+
+
+class MemoryResponse(BaseModel):
+    rss_bytes: int = Field(description="현재 RSS(byte)")
+    peak_rss_bytes: int = Field(description="최대 RSS(byte)")
+    tracing: bool = Field(description="tracemalloc 추적 여부")
+    traced_bytes: int = Field(description="tracemalloc이 추적 중인 memory(byte). 추적 중이 아니면 0")
+    traced_peak_bytes: int = Field(description="tracemalloc이 추적한 최대 memory(byte). 추적 중이 아니면 0")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TracingStatsResponse(BaseModel):
+    enabled: bool = Field(description="span 기록 여부 (`TRACE_EXPORT_PATH` 설정 여부)")
+    exported: int = Field(description="기록한 span 수")
+    dropped: int = Field(description="exporter 종료로 기록하지 못한 span 수")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class LoggingStatsResponse(BaseModel):
+    queue_size: int = Field(description="출력을 기다리는 log 수")
+    dropped: int = Field(description="queue가 가득 차 버린 log 수")
+    sampled_out: int = Field(description="sampling으로 남기지 않은 log 수")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class HedgingStatsResponse(BaseModel):
+    enabled: bool = Field(description="OpenStack 조회 요청 hedging 사용 여부 (`OPENSTACK_HEDGING_ENABLED`)")
+    hedged: int = Field(description="응답이 늦어 추가로 보낸 요청 수")
+    hedge_wins: int = Field(description="추가로 보낸 요청의 응답을 사용한 수")
+    budget_exhausted: int = Field(description="추가 요청 한도를 넘어 추가 요청을 보내지 않은 수")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class SlowOperationResponse(BaseModel):
+    kind: str = Field(description="작업 종류 (query, transaction, openstack_call)")
+    fingerprint: str = Field(description="정규화한 statement의 fingerprint")
+    statement: str = Field(description="정규화한 SQL, `@transactional` 함수 이름 또는 OpenStack API 경로")
+    operation: str | None = Field(description="처음 기록될 때 실행 중이던 service method")
+    count: int = Field(description="현재 집계 구간의 발생 횟수")
+    max_ms: float = Field(description="최대 소요 시간(ms)")
+    avg_ms: float = Field(description="평균 소요 시간(ms)")
+
+    @classmethod
+    def from_stats(cls, stats: SlowOperationStats) -> "SlowOperationResponse":
+        return cls(
+            kind=stats.kind.value,
+            fingerprint=stats.fingerprint,
+            statement=stats.statement,
+            operation=stats.operation,
+            count=stats.count,
+            max_ms=stats.max_ms,
+            avg_ms=stats.total_ms / stats.count,
+        )
+
+
+class MetricsResponse(BaseModel):
+    loop_lag: LoopLagResponse = Field(description="event loop 지연 시간")
+    access_token_cache: CacheStatsResponse = Field(description="검증된 access token cache")
+    membership_cache: CacheStatsResponse = Field(description="프로젝트 membership cache")
+    password_hasher: PasswordHasherStatsResponse = Field(description="bcrypt process pool")
+    circuit_breakers: list[CircuitBreakerResponse] = Field(description="OpenStack endpoint 별 circuit breaker")
+    memory: MemoryResponse = Field(description="process memory 사용량")
+    tracing: TracingStatsResponse = Field(description="span 기록")
+    logging: LoggingStatsResponse = Field(description="log 출력")
+    slow_operations: list[SlowOperationResponse] = Field(description="현재 집계 구간의 느린 SQL, 트랜잭션, OpenStack 호출")
+    hedging: HedgingStatsResponse = Field(description="OpenStack 조회 요청 hedging")
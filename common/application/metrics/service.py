@@ -0,0 +1,34 @@
+from common.application.metrics.response import (
+    MetricsResponse, LoopLagResponse, CacheStatsResponse, PasswordHasherStatsResponse, CircuitBreakerResponse,
+    MemoryResponse, TracingStatsResponse, LoggingStatsResponse, SlowOperationResponse,
+    HedgingStatsResponse,
+)
+from common.util.auth_token_manager import get_access_token_cache_stats
+from common.util.circuit_breaker import get_circuit_breaker_stats
+from common.util.hedging import get_hedging_stats
+from common.util.loop_monitor import get_loop_lag_stats
+from common.util.membership_cache import get_membership_cache_stats
+from common.util.memory_profiler import get_memory_stats
+from common.util.password_hasher import get_password_hasher_stats
+from common.util.slow_log import get_slow_log_stats
+from common.util.structured_logging import get_logging_stats
+from common.util.tracing import get_tracing_stats
+
+
+class MetricsService:
+    def get_metrics(self) -> MetricsResponse:
+        """
+        현재 process(worker)의 event loop 지연 시간과 cache, 외부 호출 관련 지표를 반환한다.
+        """
+        return MetricsResponse(
+            loop_lag=LoopLagResponse.from_stats(get_loop_lag_stats()),
+            access_token_cache=CacheStatsResponse.model_validate(get_access_token_cache_stats()),
+            membership_cache=CacheStatsResponse.model_validate(get_membership_cache_stats()),
+            password_hasher=PasswordHasherStatsResponse.model_validate(get_password_hasher_stats()),
+            circuit_breakers=[CircuitBreakerResponse.from_stats(stats) for stats in get_circuit_breaker_stats()],
+            memory=MemoryResponse.model_validate(get_memory_stats()),
+            tracing=TracingStatsResponse.model_validate(get_tracing_stats()),
+            logging=LoggingStatsResponse.model_validate(get_logging_stats()),
+            slow_operations=[SlowOperationResponse.from_stats(stats) for stats in get_slow_log_stats()],
+            hedging=HedgingStatsResponse.model_validate(get_hedging_stats()),
+        )
@@ -11,8 +11,10 @@ from common.infrastructure.network_interface.repository import NetworkInterfaceR
 from common.infrastructure.neutron.client import NeutronClient
 from common.infrastructure.server.repository import ServerRepository
 from common.util.compensating_transaction import CompensationManager
+from common.util.tracing import trace_methods
 
 
+@trace_methods
 class NetworkInterfaceService:
     def __init__(
         self,
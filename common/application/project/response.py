@@ -43,6 +43,7 @@ class ProjectResponse(BaseModel):
     id: int = Field(description="프로젝트 id", examples=[1])
     openstack_id: str = Field(description="프로젝트 uuid", examples=["779b35a7173444e387a7f34134a56e31"])
     name: str = Field(description="프로젝트 이름")
+    region: str | None = Field(None, description="프로젝트의 OpenStack region (없으면 기본 region)")
     domain_id: int = Field(description="프로젝트가 속한 도메인 정보")
     created_at: datetime = Field(description="생성일")
     updated_at: datetime = Field(description="수정일")
@@ -59,6 +60,7 @@ class ProjectDetailResponse(BaseModel):
     id: int = Field(description="프로젝트 id", examples=[1])
     openstack_id: str = Field(description="프로젝트 uuid", examples=["779b35a7173444e387a7f34134a56e31"])
     name: str = Field(description="프로젝트 이름")
+    region: str | None = Field(None, description="프로젝트의 OpenStack region (없으면 기본 region)")
     domain: DomainResponse = Field(description="프로젝트가 속한 도메인 정보")
     accounts: list[UserResponse] = Field(description="프로젝트에 속한 계정 목록")
     created_at: datetime = Field(description="생성일")
@@ -75,6 +77,7 @@ class ProjectDetailResponse(BaseModel):
             id=project.id,
             openstack_id=project.openstack_id,
             name=project.name,
+            region=project.region,
             domain=DomainResponse.from_entity(domain),
             accounts=[UserResponse.from_entity(user) for user in users],
             created_at=project.created_at,
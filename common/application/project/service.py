@@ -17,11 +17,14 @@ from common.infrastructure.project_user.repository import ProjectUserRepository
 from common.infrastructure.user.repository import UserRepository
 from common.util.compensating_transaction import CompensationManager
 from common.util.envs import Envs, get_envs
+from common.util.membership_cache import invalidate_membership
 from common.util.system_token_manager import get_system_keystone_token
+from common.util.tracing import trace_methods
 
 envs: Envs = get_envs()
 
 
+@trace_methods
 class ProjectService:
     def __init__(
         self,
@@ -146,6 +149,7 @@ class ProjectService:
         await self.project_user_repository.create(
             project_user=ProjectUser(project_id=project_id, user_id=user_id)
         )
+        await invalidate_membership(user_id=user_id, project_id=project_id)
 
         project_openstack_id: str = project.openstack_id
         user_openstack_id: str = user.openstack_id
@@ -192,6 +196,7 @@ class ProjectService:
             raise UserNotInProjectException()
 
         await self.project_user_repository.delete(project_user=project_user)
+        await invalidate_membership(user_id=user_id, project_id=project_id)
 
         project_openstack_id: str = project.openstack_id
         user_openstack_id: str = user.openstack_id
@@ -1,6 +1,7 @@
 import asyncio
 import logging
 from collections import defaultdict
+from typing import AsyncGenerator
 
 import backoff
 from fastapi import Depends
@@ -25,8 +26,10 @@ from common.infrastructure.network_interface_security_group.repository import Ne
 from common.infrastructure.neutron.client import NeutronClient
 from common.infrastructure.security_group.repository import SecurityGroupRepository
 from common.util.compensating_transaction import CompensationManager
+from common.util.tracing import trace_methods
 
 
+@trace_methods
 class SecurityGroupService:
     def __init__(
         self,
@@ -72,6 +75,38 @@ class SecurityGroupService:
 
         return SecurityGroupDetailsResponse(security_groups=response_items)
 
+    async def export_security_groups_details(
+        self,
+        project_id: int,
+        project_openstack_id: str,
+        keystone_token: str,
+    ) -> AsyncGenerator[SecurityGroupDetailResponse, None]:
+        """
+        프로젝트의 모든 보안 그룹을 rule과 함께 하나씩 응답으로 변환한다.
+
+        Rule 목록은 응답 전송(streaming) 전에 조회하므로, OpenStack 요청이 실패하면 일반 API와 동일하게 에러 응답을 반환한다.
+        """
+        rules: list[SecurityGroupRuleDTO] = await self.neutron_client.find_security_group_rules(
+            keystone_token=keystone_token,
+            project_openstack_id=project_openstack_id,
+        )
+        rule_map: dict[str, list[SecurityGroupRuleDTO]] = defaultdict(list)
+        for rule in rules:
+            rule_map[rule.security_group_openstack_id].append(rule)
+
+        return self._stream_security_groups_details(project_id=project_id, rule_map=rule_map)
+
+    async def _stream_security_groups_details(
+        self,
+        project_id: int,
+        rule_map: dict[str, list[SecurityGroupRuleDTO]],
+    ) -> AsyncGenerator[SecurityGroupDetailResponse, None]:
+        async for security_group in self.security_group_repository.stream_all_by_project_id(project_id=project_id):
+            yield await SecurityGroupDetailResponse.from_entity(
+                security_group,
+                rule_map.get(security_group.openstack_id, [])
+            )
+
     @transactional
     async def _find_security_groups_by_project_id(
         self,
@@ -2,7 +2,7 @@ import asyncio
 import logging
 import uuid
 from logging import Logger
-from typing import Coroutine
+from typing import Coroutine, AsyncGenerator
 
 from fastapi import Depends
 
@@ -34,11 +34,13 @@ from common.infrastructure.volume.repository import VolumeRepository
 from common.util.compensating_transaction import CompensationManager
 from common.util.envs import Envs, get_envs
 from common.util.system_token_manager import get_system_keystone_token
+from common.util.tracing import trace_methods
 
 envs: Envs = get_envs()
 logger: Logger = logging.getLogger(__name__)
 
 
+@trace_methods
 class ServerService:
     MAX_CHECK_ATTEMPTS_FOR_VOLUME_DETACHMENT: int = envs.MAX_CHECK_ATTEMPTS_FOR_VOLUME_DETACHMENT
     CHECK_INTERVAL_SECONDS_FOR_VOLUME_DETACHMENT: int = envs.CHECK_INTERVAL_SECONDS_FOR_VOLUME_DETACHMENT
@@ -97,6 +99,13 @@ class ServerService:
         )
         return ServerDetailsResponse(servers=[await ServerDetailResponse.from_entity(server) for server in servers])
 
+    async def export_servers_details(self, project_id: int) -> AsyncGenerator[ServerDetailResponse, None]:
+        """
+        프로젝트의 모든 서버를 DB에서 나누어 조회하여 하나씩 응답으로 변환한다.
+        """
+        async for server in self.server_repository.stream_all_by_project_id(project_id=project_id):
+            yield await ServerDetailResponse.from_entity(server)
+
     @transactional
     async def get_server_detail(
         self,
@@ -1,6 +1,3 @@
-import asyncio
-
-import bcrypt
 from fastapi import Depends
 
 from common.application.user.response import UserDetailResponse, UserResponse
@@ -16,11 +13,15 @@ from common.infrastructure.keystone.client import KeystoneClient
 from common.infrastructure.user.repository import UserRepository
 from common.util.compensating_transaction import CompensationManager
 from common.util.envs import get_envs, Envs
+from common.util.membership_cache import invalidate_membership
+from common.util.password_hasher import hash_password
 from common.util.system_token_manager import get_system_keystone_token
+from common.util.tracing import trace_methods
 
 envs: Envs = get_envs()
 
 
+@trace_methods
 class UserService:
     def __init__(
         self,
@@ -83,6 +84,9 @@ class UserService:
         if is_account_id_exists:
             raise UserAccountIdDuplicateException(account_id=account_id)
 
+        # bcrypt 연산이 거절(503)되더라도 OpenStack 자원이 생성되지 않도록 먼저 hash한다.
+        hashed_password: str = await hash_password(password)
+
         # Create user in OpenStack
         user_openstack_id: str = await self.keystone_client.create_user(
             domain_openstack_id=envs.DEFAULT_DOMAIN_OPENSTACK_ID,
@@ -97,18 +101,13 @@ class UserService:
         )
 
         # Create user in DB
-        hashed_password: bytes = await asyncio.to_thread(
-            bcrypt.hashpw,
-            password.encode("UTF-8"),
-            bcrypt.gensalt()
-        )
         user: User = await self.user_repository.create(
             user=User.create(
                 openstack_id=user_openstack_id,
                 domain_id=envs.DEFAULT_DOMAIN_ID,
                 account_id=account_id,
                 name=name,
-                hashed_password=hashed_password.decode("UTF-8"),
+                hashed_password=hashed_password,
             )
         )
         return UserResponse.from_entity(user)
@@ -151,3 +150,4 @@ class UserService:
         )
 
         await user.delete()
+        await invalidate_membership(user_id=user.id)
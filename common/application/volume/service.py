@@ -1,6 +1,7 @@
 import asyncio
 import logging
 from logging import Logger
+from typing import AsyncGenerator
 
 from fastapi import Depends
 
@@ -17,11 +18,13 @@ from common.infrastructure.database import transactional
 from common.infrastructure.volume.repository import VolumeRepository
 from common.util.envs import Envs, get_envs
 from common.util.system_token_manager import get_system_keystone_token
+from common.util.tracing import trace_methods
 
 envs: Envs = get_envs()
 logger: Logger = logging.getLogger(__name__)
 
 
+@trace_methods
 class VolumeService:
     # 볼륨 생성 시: 최대 MAX_SYNC_ATTEMPTS_FOR_VOLUME_CREATION * SYNC_INTERVAL_SECONDS_FOR_VOLUME_CREATION초 동안 동기화 수행
     MAX_SYNC_ATTEMPTS_FOR_VOLUME_CREATION: int = envs.MAX_SYNC_ATTEMPTS_FOR_VOLUME_CREATION
@@ -56,6 +59,13 @@ class VolumeService:
         )
         return [await VolumeDetailResponse.from_entity(volume) for volume in volumes]
 
+    async def export_volume_details(self, current_project_id: int) -> AsyncGenerator[VolumeDetailResponse, None]:
+        """
+        프로젝트의 모든 볼륨을 DB에서 streaming으로 조회하여 하나씩 응답으로 변환한다.
+        """
+        async for volume in self.volume_repository.stream_all_by_project_id(project_id=current_project_id):
+            yield await VolumeDetailResponse.from_entity(volume)
+
     @transactional
     async def get_volume_detail(
         self,
@@ -0,0 +1,58 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import String, BigInteger, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+from common.domain.entity import BaseEntity
+from common.domain.keystone.model import KeystoneToken
+from common.util.auth_token_manager import decrypt_keystone_token
+
+
+class SystemKeystoneToken(BaseEntity):
+    """
+    모든 worker가 공유하는 system keystone token. (단일 row)
+
+    token 갱신은 lease(`lease_owner`, `lease_expires_at`)를 획득한 하나의 worker만 수행하며,
+    나머지 worker는 갱신된 token을 조회하여 사용한다.
+    cloud admin 권한의 token이므로 암호화하여 저장한다. (`KEYSTONE_TOKEN_ENCRYPTION_KEY`)
+    """
+    __tablename__ = "system_keystone_token"
+
+    ID: int = 1
+
+    id: Mapped[int] = mapped_column("id", BigInteger, primary_key=True, autoincrement=False)
+    token: Mapped[str | None] = mapped_column("token", String(1024), nullable=True)
+    expires_at: Mapped[datetime | None] = mapped_column("expires_at", DateTime, nullable=True)
+    issued_at: Mapped[datetime | None] = mapped_column("issued_at", DateTime, nullable=True)
+    lease_owner: Mapped[str | None] = mapped_column("lease_owner", String(64), nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column("lease_expires_at", DateTime, nullable=True)
+
+    @classmethod
+    def create(cls, lease_owner: str, lease_expires_at: datetime) -> "SystemKeystoneToken":
+        now: datetime = datetime.now(timezone.utc)
+        return cls(
+            id=cls.ID,
+            lease_owner=lease_owner,
+            lease_expires_at=lease_expires_at,
+            created_at=now,
+            updated_at=now,
+        )
+
+    def to_keystone_token(self) -> KeystoneToken | None:
+        """
+        :return: 저장된 token. 저장된 token이 없거나 복호화할 수 없는 경우 None
+        """
+        if self.token is None or self.expires_at is None:
+            return None
+        token: str | None = decrypt_keystone_token(self.token)
+        if token is None:
+            return None
+        return KeystoneToken(token=token, expires_at=_as_utc(self.expires_at))
+
+    def get_issued_at(self) -> datetime | None:
+        return _as_utc(self.issued_at) if self.issued_at is not None else None
+
+
+def _as_utc(value: datetime) -> datetime:
+    # DB에서 조회한 DATETIME 값은 timezone 정보가 없으므로 UTC로 간주한다.
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
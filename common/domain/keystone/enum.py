@@ -0,0 +1,27 @@
+from enum import Enum
+
+
+class OpenStackServiceType(Enum):
+    """
+    keystone service catalog의 service type
+    """
+    IDENTITY = "identity"
+    COMPUTE = "compute"
+    NETWORK = "network"
+    BLOCK_STORAGE = "block-storage"
+
+    @classmethod
+    def from_catalog_type(cls, catalog_type: str) -> "OpenStackServiceType | None":
+        # cinder는 배포 환경에 따라 이전 service type(`volumev3` 등)으로 등록되어 있을 수 있다.
+        if catalog_type in ("volumev3", "volumev2", "volume"):
+            return cls.BLOCK_STORAGE
+        try:
+            return cls(catalog_type)
+        except ValueError:
+            return None
+
+
+class EndpointInterface(Enum):
+    PUBLIC = "public"
+    INTERNAL = "internal"
+    ADMIN = "admin"
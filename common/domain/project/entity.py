@@ -1,3 +1,5 @@
+from datetime import datetime, timezone
+
 from async_property import async_property
 from sqlalchemy import String, ForeignKey, BigInteger, CHAR, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -14,6 +16,8 @@ class Project(SoftDeleteBaseEntity):
     openstack_id: Mapped[str] = mapped_column("openstack_id", CHAR(32), nullable=False)
     domain_id: Mapped[int] = mapped_column("domain_id", BigInteger, ForeignKey("domain.id"), nullable=False)
     name: Mapped[str] = mapped_column("name", String(255), nullable=False)
+    # 프로젝트의 자원이 생성되는 OpenStack region. None이면 기본 region(`OPENSTACK_REGION_NAME`)을 사용한다.
+    region: Mapped[str | None] = mapped_column("region", String(64), nullable=True)
     version: Mapped[int] = mapped_column("version", Integer, nullable=False, default=0)
 
     _domain: Mapped[Domain] = relationship("Domain", lazy="select")
@@ -56,3 +60,21 @@ class ProjectUser(BaseEntity):
     @async_property
     async def project(self) -> Project:
         return await self.awaitable_attrs._project
+
+
+class ProjectUserInvalidation(BaseEntity):
+    """
+    membership cache를 무효화해야 하는 (user, project) 변경 기록.
+    각 worker는 이 table을 주기적으로 조회하여 자신의 cache에서 해당 membership을 제거한다.
+    `project_id`가 None이면 user의 모든 project membership을 무효화한다.
+    """
+    __tablename__ = "project_user_invalidation"
+
+    id: Mapped[int] = mapped_column("id", BigInteger, primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column("user_id", BigInteger, nullable=False)
+    project_id: Mapped[int | None] = mapped_column("project_id", BigInteger, nullable=True)
+
+    @classmethod
+    def create(cls, user_id: int, project_id: int | None) -> "ProjectUserInvalidation":
+        now: datetime = datetime.now(timezone.utc)
+        return cls(user_id=user_id, project_id=project_id, created_at=now, updated_at=now)
@@ -0,0 +1,59 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import String, ForeignKey, BigInteger, CHAR, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+from common.domain.entity import BaseEntity
+
+
+class RefreshToken(BaseEntity):
+    """
+    access token 재발급에 사용하는 refresh token.
+
+    token 원문 대신 SHA-256 hash를 저장하며, 사용(rotation)되거나 폐기되면 `revoked_at`이 기록된다.
+    재발급 시 rescope할 keystone token은 암호화하여 저장한다. (`KEYSTONE_TOKEN_ENCRYPTION_KEY`)
+    같은 로그인에서 rotation으로 이어진 token들은 같은 `family_id`를 가진다.
+    """
+    __tablename__ = "refresh_token"
+
+    id: Mapped[int] = mapped_column("id", BigInteger, primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column("user_id", BigInteger, ForeignKey("user.id"), nullable=False)
+    project_id: Mapped[int] = mapped_column("project_id", BigInteger, ForeignKey("project.id"), nullable=False)
+    family_id: Mapped[str] = mapped_column("family_id", CHAR(32), nullable=False)
+    token_hash: Mapped[str] = mapped_column("token_hash", CHAR(64), nullable=False, unique=True)
+    encrypted_keystone_token: Mapped[str] = mapped_column("encrypted_keystone_token", String(1024), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column("expires_at", DateTime, nullable=False)
+    revoked_at: Mapped[datetime | None] = mapped_column("revoked_at", DateTime, nullable=True)
+
+    @classmethod
+    def create(
+        cls,
+        user_id: int,
+        project_id: int,
+        family_id: str,
+        token_hash: str,
+        encrypted_keystone_token: str,
+        expires_at: datetime,
+    ) -> "RefreshToken":
+        now: datetime = datetime.now(timezone.utc)
+        return cls(
+            user_id=user_id,
+            project_id=project_id,
+            family_id=family_id,
+            token_hash=token_hash,
+            encrypted_keystone_token=encrypted_keystone_token,
+            expires_at=expires_at,
+            created_at=now,
+            updated_at=now,
+        )
+
+    @property
+    def is_revoked(self) -> bool:
+        return self.revoked_at is not None
+
+    def is_expired(self) -> bool:
+        expires_at: datetime = self.expires_at
+        if expires_at.tzinfo is None:
+            # DB에서 조회한 DATETIME 값은 timezone 정보가 없으므로 UTC로 간주한다.
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        return expires_at <= datetime.now(timezone.utc)
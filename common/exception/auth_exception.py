@@ -17,3 +17,21 @@ class InvalidAccessTokenException(CustomException):
             status_code=401,
             message="유효하지 않은 access token입니다."
         )
+
+
+class InvalidRefreshTokenException(CustomException):
+    def __init__(self):
+        super().__init__(
+            code="INVALID_REFRESH_TOKEN",
+            status_code=401,
+            message="유효하지 않은 refresh token입니다. 다시 로그인해주세요."
+        )
+
+
+class AdminPermissionRequiredException(CustomException):
+    def __init__(self):
+        super().__init__(
+            code="ADMIN_PERMISSION_REQUIRED",
+            status_code=403,
+            message="관리자만 사용할 수 있는 기능입니다."
+        )
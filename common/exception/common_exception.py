@@ -8,3 +8,39 @@ class MultipleEntitiesFoundException(CustomException):
             status_code=500,
             message="Multiple entities were found when only one was expected."
         )
+
+
+class PasswordHashingBusyException(CustomException):
+    def __init__(self):
+        super().__init__(
+            code="PASSWORD_HASHING_BUSY",
+            status_code=503,
+            message="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요."
+        )
+
+
+class ProfilerBusyException(CustomException):
+    def __init__(self):
+        super().__init__(
+            code="PROFILER_BUSY",
+            status_code=409,
+            message="이미 profiling이 진행 중입니다. 완료된 후 다시 시도해주세요."
+        )
+
+
+class MemoryTracingNotStartedException(CustomException):
+    def __init__(self):
+        super().__init__(
+            code="MEMORY_TRACING_NOT_STARTED",
+            status_code=409,
+            message="memory 추적이 시작되지 않았습니다. 먼저 memory 추적을 시작해주세요."
+        )
+
+
+class DeadlineExceededException(CustomException):
+    def __init__(self):
+        super().__init__(
+            code="REQUEST_TIMEOUT",
+            status_code=504,
+            message="요청 처리 시간이 초과되었습니다. 잠시 후 다시 시도해주세요."
+        )
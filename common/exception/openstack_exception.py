@@ -15,3 +15,31 @@ class OpenStackException(CustomException):
             message=message
         )
         self.openstack_status_code = openstack_status_code
+
+
+class SystemKeystoneTokenUnavailableException(CustomException):
+    def __init__(self):
+        super().__init__(
+            code="SYSTEM_KEYSTONE_TOKEN_UNAVAILABLE",
+            status_code=503,
+            message="OpenStack 인증 정보를 갱신하는 중입니다. 잠시 후 다시 시도해주세요."
+        )
+
+
+class OpenStackUnavailableException(OpenStackException):
+    def __init__(self):
+        super().__init__(
+            openstack_status_code=503,
+            code="OPEN_STACK_UNAVAILABLE",
+            status_code=503,
+            message="OpenStack API를 일시적으로 사용할 수 없습니다. 잠시 후 다시 시도해주세요."
+        )
+
+
+class OpenStackRegionNotFoundException(CustomException):
+    def __init__(self, region: str):
+        super().__init__(
+            code="OPEN_STACK_REGION_NOT_FOUND",
+            status_code=503,
+            message=f"OpenStack service catalog에서 {region} region의 endpoint를 찾을 수 없습니다."
+        )
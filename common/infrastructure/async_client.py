@@ -1,19 +1,21 @@
-from httpx import AsyncClient
+from httpx import AsyncClient, AsyncBaseTransport
 
 _async_client: AsyncClient | None = None
 
 
-def init_async_client() -> None:
+def init_async_client(transport: AsyncBaseTransport | None = None) -> None:
     global _async_client
     if _async_client is not None:
         raise RuntimeError("Async client is already initialized")
-    _async_client = AsyncClient(verify=False)
+    _async_client = AsyncClient(verify=False, transport=transport)
 
 
 async def close_async_client() -> None:
+    global _async_client
     if _async_client is None:
         raise RuntimeError("Async client has not been initialized")
     await _async_client.aclose()
+    _async_client = None
 
 
 def get_async_client() -> AsyncClient:
@@ -1,18 +1,18 @@
+from typing import AsyncGenerator
+
 from httpx import Response
 
+from common.domain.keystone.enum import OpenStackServiceType
 from common.domain.volume.dto import OsVolumeDto
 from common.domain.volume.enum import VolumeStatus
 from common.exception.openstack_exception import OpenStackException
 from common.infrastructure.openstack_client import OpenStackClient
-from common.util.envs import get_envs, Envs
-
-envs: Envs = get_envs()
+from common.util.tracing import trace_methods
 
 
+@trace_methods
 class CinderClient(OpenStackClient):
-    _OPEN_STACK_URL: str = envs.OPENSTACK_SERVER_URL
-    _CINDER_PORT: int = envs.CINDER_PORT
-    _CINDER_URL: str = f"{_OPEN_STACK_URL}:{_CINDER_PORT}"
+    _SERVICE_TYPE: OpenStackServiceType = OpenStackServiceType.BLOCK_STORAGE
 
     async def get_volume(
         self,
@@ -22,17 +22,28 @@ class CinderClient(OpenStackClient):
     ) -> OsVolumeDto:
         response: Response = await self.request(
             method="GET",
-            url=self._CINDER_URL + f"/v3/{project_openstack_id}/volumes/{volume_openstack_id}",
+            url=self._get_endpoint() + f"/v3/{project_openstack_id}/volumes/{volume_openstack_id}",
             headers={"X-Auth-Token": keystone_token},
+            hedge=True,
         )
-        volume_data: dict = response.json()["volume"]
-        return OsVolumeDto(
-            openstack_id=volume_data["id"],
-            volume_type_name=volume_data["volume_type"],
-            image_openstack_id=(volume_data.get("volume_image_metadata") or {}).get("volume_type"),
-            status=VolumeStatus.parse(volume_data["status"]),
-            size=volume_data["size"],
-        )
+        return _to_os_volume_dto(response.json()["volume"])
+
+    async def iterate_volumes(
+        self,
+        keystone_token: str,
+        project_openstack_id: str,
+        page_size: int | None = None,
+    ) -> AsyncGenerator[OsVolumeDto, None]:
+        """
+        프로젝트의 모든 volume을 page 단위로 조회하여 하나씩 반환한다.
+        """
+        async for volume_data in self.paginate(
+            url=self._get_endpoint() + f"/v3/{project_openstack_id}/volumes/detail",
+            resource_key="volumes",
+            headers={"X-Auth-Token": keystone_token},
+            page_size=page_size,
+        ):
+            yield _to_os_volume_dto(volume_data)
 
     async def get_volume_status(
         self,
@@ -42,7 +53,7 @@ class CinderClient(OpenStackClient):
     ) -> VolumeStatus:
         response: Response = await self.request(
             method="GET",
-            url=self._CINDER_URL + f"/v3/{project_openstack_id}/volumes/{volume_openstack_id}",
+            url=self._get_endpoint() + f"/v3/{project_openstack_id}/volumes/{volume_openstack_id}",
             headers={"X-Auth-Token": keystone_token},
         )
         status: str = response.json().get("volume").get("status")
@@ -57,7 +68,7 @@ class CinderClient(OpenStackClient):
         try:
             await self.request(
                 method="GET",
-                url=self._CINDER_URL + f"/v3/{project_openstack_id}/volumes/{volume_openstack_id}",
+                url=self._get_endpoint() + f"/v3/{project_openstack_id}/volumes/{volume_openstack_id}",
                 headers={"X-Auth-Token": keystone_token},
             )
         except OpenStackException as ex:
@@ -77,7 +88,7 @@ class CinderClient(OpenStackClient):
     ) -> str:
         response: Response = await self.request(
             method="POST",
-            url=self._CINDER_URL + f"/v3/{project_openstack_id}/volumes",
+            url=self._get_endpoint() + f"/v3/{project_openstack_id}/volumes",
             headers={
                 "Content-Type": "application/json",
                 "X-Auth-Token": keystone_token,
@@ -101,7 +112,7 @@ class CinderClient(OpenStackClient):
     ) -> None:
         await self.request(
             method="POST",
-            url=self._CINDER_URL + f"/v3/{project_openstack_id}/volumes/{volume_openstack_id}/action",
+            url=self._get_endpoint() + f"/v3/{project_openstack_id}/volumes/{volume_openstack_id}/action",
             headers={
                 "Content-Type": "application/json",
                 "X-Auth-Token": keystone_token,
@@ -121,6 +132,16 @@ class CinderClient(OpenStackClient):
     ) -> None:
         await self.request(
             method="DELETE",
-            url=self._CINDER_URL + f"/v3/{project_openstack_id}/volumes/{volume_openstack_id}",
+            url=self._get_endpoint() + f"/v3/{project_openstack_id}/volumes/{volume_openstack_id}",
             headers={"X-Auth-Token": keystone_token},
         )
+
+
+def _to_os_volume_dto(volume_data: dict) -> OsVolumeDto:
+    return OsVolumeDto(
+        openstack_id=volume_data["id"],
+        volume_type_name=volume_data["volume_type"],
+        image_openstack_id=(volume_data.get("volume_image_metadata") or {}).get("volume_type"),
+        status=VolumeStatus.parse(volume_data["status"]),
+        size=volume_data["size"],
+    )
@@ -1,25 +1,92 @@
 import inspect
 import logging
+import time
 from contextlib import asynccontextmanager
 from contextvars import ContextVar
 from functools import wraps
 from logging import Logger
 from typing import AsyncGenerator
 
+from sqlalchemy import event, make_url, URL
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, AsyncEngine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
-from common.util.envs import get_envs
+from common.exception.base_exception import CustomException
+from common.util.deadline import check_deadline
+from common.util.envs import get_envs, Envs
+from common.util.slow_log import (
+    SlowOperationKind, is_slow, record_slow_operation, normalize_sql, use_operation,
+)
+from common.util.tracing import start_span
 
 envs = get_envs()
 logger: Logger = logging.getLogger(__name__)
 
-_DATABASE_URL = (
-    "mysql+aiomysql://"
-    f"{envs.DATABASE_USERNAME}:{envs.DATABASE_PASSWORD}@{envs.DATABASE_HOST}:{envs.DATABASE_PORT}"
-    "/cloud"
-)
-_async_engine: AsyncEngine = create_async_engine(_DATABASE_URL, echo=True)
+
+def create_database_url(envs: Envs) -> str:
+    """
+    `DATABASE_URL`이 설정되어 있다면 그대로 사용하고, 그렇지 않다면 MySQL 접속 정보로 URL을 생성한다.
+    """
+    if envs.DATABASE_URL:
+        return envs.DATABASE_URL
+    return (
+        "mysql+aiomysql://"
+        f"{envs.DATABASE_USERNAME}:{envs.DATABASE_PASSWORD}@{envs.DATABASE_HOST}:{envs.DATABASE_PORT}"
+        f"/{envs.DATABASE_NAME}"
+    )
+
+
+def create_database_engine(database_url: str, echo: bool = False) -> AsyncEngine:
+    """
+    Dialect에 맞는 설정으로 async engine을 생성한다.
+
+    SQLite(`sqlite+aiosqlite`)의 경우,
+
+    - in-memory DB(`sqlite+aiosqlite://`)는 모든 session이 하나의 connection을 공유하도록 `StaticPool`을 사용한다.
+    - MySQL과 동일하게 foreign key 제약 조건을 검사하도록 설정한다.
+    """
+    url: URL = make_url(database_url)
+    if url.get_backend_name() != "sqlite":
+        engine: AsyncEngine = create_async_engine(url, echo=echo)
+        _listen_slow_queries(engine)
+        return engine
+
+    options: dict = {"connect_args": {"timeout": 30}}
+    if url.database in (None, "", ":memory:"):
+        options["poolclass"] = StaticPool
+    engine: AsyncEngine = create_async_engine(url, echo=echo, **options)
+    event.listen(engine.sync_engine, "connect", _enable_sqlite_foreign_keys)
+    _listen_slow_queries(engine)
+    return engine
+
+
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+def _listen_slow_queries(engine: AsyncEngine) -> None:
+    # SQL echo 없이 `SLOW_QUERY_THRESHOLD_MS` 이상 걸린 SQL만 log로 남긴다.
+    event.listen(engine.sync_engine, "before_cursor_execute", _start_query_timer)
+    event.listen(engine.sync_engine, "after_cursor_execute", _record_slow_query)
+
+
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+    context.query_started_at = time.perf_counter()
+
+
+def _record_slow_query(conn, cursor, statement, parameters, context, executemany) -> None:
+    duration_ms: float = (time.perf_counter() - context.query_started_at) * 1000
+    if is_slow(SlowOperationKind.QUERY, duration_ms):
+        record_slow_operation(
+            SlowOperationKind.QUERY, normalize_sql(statement), duration_ms,
+            rows=cursor.rowcount if cursor.rowcount >= 0 else None,
+        )
+
+
+_async_engine: AsyncEngine = create_database_engine(create_database_url(envs), echo=envs.DATABASE_ECHO)
 _async_session: ContextVar[AsyncSession | None] = ContextVar("db_session", default=None)
 
 session_maker: sessionmaker[AsyncSession] = \
@@ -34,6 +101,8 @@ async def session_factory() -> AsyncGenerator[AsyncSession, None]:
         yield session
         return
 
+    # 처리 시간이 초과된 요청이 connection pool의 connection을 새로 점유하지 않도록 한다.
+    check_deadline()
     session: AsyncSession = session_maker()
     _async_session.set(session)
     try:
@@ -63,14 +132,26 @@ def transactional(func):
 
     @wraps(func)
     async def wrapper(*args, **kwargs):
+        started_at: float = time.perf_counter()
         async with session_factory():
             try:
-                result = await func(*args, **kwargs)
+                with (
+                    start_span(name="transaction", attributes={"code.function": func.__qualname__}),
+                    use_operation(func.__qualname__),
+                ):
+                    result = await func(*args, **kwargs)
                 return result
+            except CustomException as ex:
+                # 존재하지 않는 resource 조회 등 응답으로 처리되는 예외는 traceback 없이 남긴다.
+                logger.info("[transactional] '%s' 실행 중 예외 발생. code=%s", func.__name__, ex.code)
+                raise
             except Exception as ex:
-                logger.error(msg=f"[transactional] '{func.__name__}' 실행 중 예외 발생", exc_info=ex)
+                logger.error("[transactional] '%s' 실행 중 예외 발생", func.__name__, exc_info=ex)
                 raise
             finally:
                 _async_session.set(None)
+                duration_ms: float = (time.perf_counter() - started_at) * 1000
+                if is_slow(SlowOperationKind.TRANSACTION, duration_ms):
+                    record_slow_operation(SlowOperationKind.TRANSACTION, func.__qualname__, duration_ms)
 
     return wrapper
@@ -1,4 +1,7 @@
+from typing import AsyncGenerator
+
 from sqlalchemy import select, Select, ScalarResult
+from sqlalchemy.ext.asyncio import AsyncScalarResult
 from sqlalchemy.orm import joinedload
 
 from common.domain.enum import SortOrder
@@ -6,8 +9,10 @@ from common.domain.floating_ip.entity import FloatingIp
 from common.domain.floating_ip.enum import FloatingIpSortOption
 from common.domain.network_interface.entity import NetworkInterface
 from common.infrastructure.database import session_factory
+from common.util.tracing import trace_methods
 
 
+@trace_methods
 class FloatingIpRepository:
     async def find_all_by_project_id(
         self,
@@ -40,6 +45,28 @@ class FloatingIpRepository:
 
             return result.all()
 
+    async def stream_all_by_project_id(
+        self,
+        project_id: int,
+        batch_size: int = 1_000,
+    ) -> AsyncGenerator[FloatingIp, None]:
+        """
+        프로젝트의 삭제되지 않은 모든 플로팅 IP를 relation과 함께 id 순으로 하나씩 반환한다.
+
+        Relation이 모두 단일 객체(`joinedload`)이므로 하나의 query 결과를 `batch_size`개씩 읽어온다. (`yield_per`)
+        """
+        async with session_factory() as session:
+            query: Select[tuple[FloatingIp]] = (
+                select(FloatingIp)
+                .where(FloatingIp.project_id == project_id, FloatingIp.deleted_at.is_(None))
+                .options(joinedload(FloatingIp._network_interface).joinedload(NetworkInterface._server))
+                .order_by(FloatingIp.id)
+                .execution_options(yield_per=batch_size)
+            )
+            result: AsyncScalarResult[FloatingIp] = await session.stream_scalars(query)
+            async for floating_ip in result:
+                yield floating_ip
+
     async def find_by_id(
         self,
         floating_ip_id: int,
@@ -2,16 +2,14 @@ import uuid
 
 from httpx import Response
 
+from common.domain.keystone.enum import OpenStackServiceType
 from common.infrastructure.openstack_client import OpenStackClient
-from common.util.envs import get_envs
-
-envs = get_envs()
+from common.util.tracing import trace_methods
 
 
+@trace_methods
 class KeystoneClient(OpenStackClient):
-    _OPEN_STACK_URL: str = envs.OPENSTACK_SERVER_URL
-    _KEYSTONE_PORT: int = envs.KEYSTONE_PORT
-    _KEYSTONE_URL: str = f"{_OPEN_STACK_URL}:{_KEYSTONE_PORT}"
+    _SERVICE_TYPE: OpenStackServiceType = OpenStackServiceType.IDENTITY
 
     async def authenticate_with_scoped_auth(
         self,
@@ -24,7 +22,7 @@ class KeystoneClient(OpenStackClient):
         :return: 생성된 subject token과 token의 만료 시각이 담긴 tuple
         """
         response: Response = await self.request(
-            url=self._KEYSTONE_URL + "/v3/auth/tokens",
+            url=self._get_endpoint() + "/v3/auth/tokens",
             method="POST",
             headers={"Content-Type": "application/json"},
             json={
@@ -54,6 +52,42 @@ class KeystoneClient(OpenStackClient):
         keystone_token_expires_at: str = response.json().get("token").get("expires_at")
         return keystone_token, keystone_token_expires_at
 
+    async def authenticate_with_token(
+        self,
+        keystone_token: str,
+        project_openstack_id: str,
+    ) -> tuple[str, str]:
+        """
+        기존 keystone token을 다른 project로 rescope한 token을 발급받는다. (`token` auth method)
+        새 token의 만료 시각은 기존 token의 만료 시각과 같다.
+
+        :return: 생성된 subject token과 token의 만료 시각이 담긴 tuple
+        """
+        response: Response = await self.request(
+            url=self._get_endpoint() + "/v3/auth/tokens",
+            method="POST",
+            headers={"Content-Type": "application/json"},
+            json={
+                "auth": {
+                    "identity": {
+                        "methods": ["token"],
+                        "token": {
+                            "id": keystone_token,
+                        }
+                    },
+                    "scope": {
+                        "project": {
+                            "id": project_openstack_id
+                        },
+                    },
+                },
+            },
+        )
+
+        rescoped_token: str = response.headers.get("x-subject-token")
+        rescoped_token_expires_at: str = response.json().get("token").get("expires_at")
+        return rescoped_token, rescoped_token_expires_at
+
     async def create_user(
         self,
         keystone_token: str,
@@ -65,7 +99,7 @@ class KeystoneClient(OpenStackClient):
         """
         response: Response = await self.request(
             method="POST",
-            url=self._KEYSTONE_URL + "/v3/users",
+            url=self._get_endpoint() + "/v3/users",
             headers={
                 "Content-Type": "application/json",
                 "X-Auth-Token": keystone_token,
@@ -87,7 +121,7 @@ class KeystoneClient(OpenStackClient):
     ) -> None:
         await self.request(
             method="DELETE",
-            url=self._KEYSTONE_URL + f"/v3/users/{user_openstack_id}",
+            url=self._get_endpoint() + f"/v3/users/{user_openstack_id}",
             headers={"X-Auth-Token": keystone_token},
         )
 
@@ -97,7 +131,7 @@ class KeystoneClient(OpenStackClient):
         name: str,
         keystone_token: str
     ) -> None:
-        url = f"{self._KEYSTONE_URL}/v3/projects/{project_openstack_id}"
+        url = f"{self._get_endpoint()}/v3/projects/{project_openstack_id}"
 
         await self.request(
             url=url,
@@ -122,7 +156,7 @@ class KeystoneClient(OpenStackClient):
     ) -> None:
         await self.request(
             method="PUT",
-            url=self._KEYSTONE_URL + f"/v3/projects/{project_openstack_id}/users/{user_openstack_id}/roles/{role_openstack_id}",
+            url=self._get_endpoint() + f"/v3/projects/{project_openstack_id}/users/{user_openstack_id}/roles/{role_openstack_id}",
             headers={"X-Auth-Token": keystone_token},
         )
 
@@ -135,6 +169,6 @@ class KeystoneClient(OpenStackClient):
     ) -> None:
         await self.request(
             method="DELETE",
-            url=self._KEYSTONE_URL + f"/v3/projects/{project_openstack_id}/users/{user_openstack_id}/roles/{role_openstack_id}",
+            url=self._get_endpoint() + f"/v3/projects/{project_openstack_id}/users/{user_openstack_id}/roles/{role_openstack_id}",
             headers={"X-Auth-Token": keystone_token},
         )
@@ -3,8 +3,10 @@ from sqlalchemy.orm import selectinload
 
 from common.domain.network_interface.entity import NetworkInterface
 from common.infrastructure.database import session_factory
+from common.util.tracing import trace_methods
 
 
+@trace_methods
 class NetworkInterfaceRepository:
     async def find_by_id(
         self,
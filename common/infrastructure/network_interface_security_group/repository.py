@@ -2,8 +2,10 @@ from sqlalchemy import select, exists, Select
 
 from common.domain.security_group.entity import NetworkInterfaceSecurityGroup
 from common.infrastructure.database import session_factory
+from common.util.tracing import trace_methods
 
 
+@trace_methods
 class NetworkInterfaceSecurityGroupRepository:
     async def exists_by_security_group(self, security_group_id: int) -> bool:
         async with session_factory() as session:
@@ -1,19 +1,19 @@
+from typing import AsyncGenerator
+
 from httpx import Response
 
+from common.domain.keystone.enum import OpenStackServiceType
 from common.domain.floating_ip.dto import FloatingIpDTO
 from common.domain.network_interface.dto import OsNetworkInterfaceDto
 from common.domain.security_group.dto import SecurityGroupRuleDTO, SecurityGroupDTO, CreateSecurityGroupRuleDTO
 from common.domain.security_group.enum import SecurityGroupRuleDirection
 from common.infrastructure.openstack_client import OpenStackClient
-from common.util.envs import get_envs
-
-envs = get_envs()
+from common.util.tracing import trace_methods
 
 
+@trace_methods
 class NeutronClient(OpenStackClient):
-    _OPEN_STACK_URL: str = envs.OPENSTACK_SERVER_URL
-    _NEUTRON_PORT: int = envs.NEUTRON_PORT
-    _NEUTRON_URL: str = f"{_OPEN_STACK_URL}:{_NEUTRON_PORT}"
+    _SERVICE_TYPE: OpenStackServiceType = OpenStackServiceType.NETWORK
 
     async def find_security_group_rules(
         self,
@@ -21,33 +21,84 @@ class NeutronClient(OpenStackClient):
         project_openstack_id: str | None = None,
         security_group_openstack_id: str | None = None,
     ) -> list[SecurityGroupRuleDTO]:
-        parameter: dict[str, str] = {}
+        return [
+            rule
+            async for rule in self.iterate_security_group_rules(
+                keystone_token=keystone_token,
+                project_openstack_id=project_openstack_id,
+                security_group_openstack_id=security_group_openstack_id,
+            )
+        ]
+
+    async def iterate_security_group_rules(
+        self,
+        keystone_token: str,
+        project_openstack_id: str | None = None,
+        security_group_openstack_id: str | None = None,
+        page_size: int | None = None,
+    ) -> AsyncGenerator[SecurityGroupRuleDTO, None]:
+        """
+        보안 그룹 규칙을 page 단위로 조회하여 하나씩 반환한다.
+        """
+        params: dict[str, str] = {}
         if project_openstack_id is not None:
-            parameter["project_id"] = project_openstack_id
+            params["project_id"] = project_openstack_id
         if security_group_openstack_id is not None:
-            parameter["security_group_id"] = security_group_openstack_id
+            params["security_group_id"] = security_group_openstack_id
 
-        response: Response = await self.request(
-            method="GET",
-            url=f"{self._NEUTRON_URL}/v2.0/security-group-rules",
+        async for rule in self.paginate(
+            url=f"{self._get_endpoint()}/v2.0/security-group-rules",
+            resource_key="security_group_rules",
             headers={"X-Auth-Token": keystone_token},
-            params=parameter,
-        )
-        rules: list[dict] = response.json().get("security_group_rules", [])
+            params=params,
+            page_size=page_size,
+            hedge=True,
+        ):
+            yield _to_security_group_rule_dto(rule)
 
-        return [
-            SecurityGroupRuleDTO(
-                openstack_id=rule["id"],
-                security_group_openstack_id=rule["security_group_id"],
-                protocol=rule.get("protocol"),
-                ether_type=rule.get("ethertype"),
-                direction=SecurityGroupRuleDirection(rule["direction"]),
-                port_range_min=rule.get("port_range_min"),
-                port_range_max=rule.get("port_range_max"),
-                remote_ip_prefix=rule.get("remote_ip_prefix"),
-            )
-            for rule in rules
-        ]
+    async def iterate_network_interfaces(
+        self,
+        keystone_token: str,
+        project_openstack_id: str | None = None,
+        page_size: int | None = None,
+    ) -> AsyncGenerator[OsNetworkInterfaceDto, None]:
+        """
+        network interface(port)를 page 단위로 조회하여 하나씩 반환한다.
+        """
+        params: dict[str, str] = {}
+        if project_openstack_id is not None:
+            params["project_id"] = project_openstack_id
+
+        async for port in self.paginate(
+            url=f"{self._get_endpoint()}/v2.0/ports",
+            resource_key="ports",
+            headers={"X-Auth-Token": keystone_token},
+            params=params,
+            page_size=page_size,
+        ):
+            yield _to_os_network_interface_dto(port)
+
+    async def iterate_floating_ips(
+        self,
+        keystone_token: str,
+        project_openstack_id: str | None = None,
+        page_size: int | None = None,
+    ) -> AsyncGenerator[FloatingIpDTO, None]:
+        """
+        floating ip를 page 단위로 조회하여 하나씩 반환한다.
+        """
+        params: dict[str, str] = {}
+        if project_openstack_id is not None:
+            params["project_id"] = project_openstack_id
+
+        async for floating_ip in self.paginate(
+            url=f"{self._get_endpoint()}/v2.0/floatingips",
+            resource_key="floatingips",
+            headers={"X-Auth-Token": keystone_token},
+            params=params,
+            page_size=page_size,
+        ):
+            yield _to_floating_ip_dto(floating_ip)
 
     async def create_network_interface(
         self,
@@ -60,7 +111,7 @@ class NeutronClient(OpenStackClient):
             req_port_data["security_groups"] = security_group_openstack_ids
         response: Response = await self.request(
             method="POST",
-            url=f"{self._NEUTRON_URL}/v2.0/ports",
+            url=f"{self._get_endpoint()}/v2.0/ports",
             headers={
                 "Content-Type": "application/json",
                 "X-Auth-Token": keystone_token,
@@ -68,20 +119,7 @@ class NeutronClient(OpenStackClient):
             json={"port": req_port_data}
         )
 
-        port: dict = response.json().get("port", {})
-        fixed_ip_address: str | None = (
-            fixed_ips[0].get("ip_address")
-            if (fixed_ips := port.get("fixed_ips")) is not None and len(fixed_ips) > 0
-            else None
-        )
-        return OsNetworkInterfaceDto(
-            openstack_id=port.get("id"),
-            name=port.get("name"),
-            network_openstack_id=port.get("network_id"),
-            project_openstack_id=port.get("project_id"),
-            status=port.get("status"),
-            fixed_ip_address=fixed_ip_address,
-        )
+        return _to_os_network_interface_dto(response.json().get("port", {}))
 
     async def create_security_group(
         self,
@@ -91,7 +129,7 @@ class NeutronClient(OpenStackClient):
     ) -> SecurityGroupDTO:
         response: Response = await self.request(
             method="POST",
-            url=f"{self._NEUTRON_URL}/v2.0/security-groups",
+            url=f"{self._get_endpoint()}/v2.0/security-groups",
             headers={"X-Auth-Token": keystone_token},
             json={
                 "security_group": {
@@ -133,7 +171,7 @@ class NeutronClient(OpenStackClient):
     ) -> list[SecurityGroupRuleDTO]:
         response: Response = await self.request(
             method="POST",
-            url=f"{self._NEUTRON_URL}/v2.0/security-group-rules",
+            url=f"{self._get_endpoint()}/v2.0/security-group-rules",
             headers={"X-Auth-Token": keystone_token},
             json={
                 "security_group_rules": [
@@ -175,17 +213,11 @@ class NeutronClient(OpenStackClient):
     ) -> FloatingIpDTO:
         response: Response = await self.request(
             method="POST",
-            url=f"{self._NEUTRON_URL}/v2.0/floatingips",
+            url=f"{self._get_endpoint()}/v2.0/floatingips",
             headers={"X-Auth-Token": keystone_token},
             json={"floatingip": {"floating_network_id": floating_network_id}}
         )
-        data = response.json()["floatingip"]
-
-        return FloatingIpDTO(
-            openstack_id=data["id"],
-            status=data["status"],
-            address=data["floating_ip_address"],
-        )
+        return _to_floating_ip_dto(response.json()["floatingip"])
 
     async def update_security_group(
         self,
@@ -195,7 +227,7 @@ class NeutronClient(OpenStackClient):
     ) -> None:
         await self.request(
             method="PUT",
-            url=f"{self._NEUTRON_URL}/v2.0/security-groups/{security_group_openstack_id}",
+            url=f"{self._get_endpoint()}/v2.0/security-groups/{security_group_openstack_id}",
             headers={"X-Auth-Token": keystone_token},
             json={
                 "security_group": {
@@ -212,7 +244,7 @@ class NeutronClient(OpenStackClient):
     ) -> None:
         await self.request(
             method="PUT",
-            url=f"{self._NEUTRON_URL}/v2.0/floatingips/{floating_ip_openstack_id}",
+            url=f"{self._get_endpoint()}/v2.0/floatingips/{floating_ip_openstack_id}",
             headers={"X-Auth-Token": keystone_token},
             json={
                 "floatingip": {
@@ -228,7 +260,7 @@ class NeutronClient(OpenStackClient):
     ) -> None:
         await self.request(
             method="PUT",
-            url=f"{self._NEUTRON_URL}/v2.0/floatingips/{floating_ip_openstack_id}",
+            url=f"{self._get_endpoint()}/v2.0/floatingips/{floating_ip_openstack_id}",
             headers={"X-Auth-Token": keystone_token},
             json={
                 "floatingip": {
@@ -244,7 +276,7 @@ class NeutronClient(OpenStackClient):
     ) -> None:
         await self.request(
             method="DELETE",
-            url=f"{self._NEUTRON_URL}/v2.0/ports/{network_interface_openstack_id}",
+            url=f"{self._get_endpoint()}/v2.0/ports/{network_interface_openstack_id}",
             headers={"X-Auth-Token": keystone_token},
         )
 
@@ -255,7 +287,7 @@ class NeutronClient(OpenStackClient):
     ) -> None:
         await self.request(
             method="DELETE",
-            url=f"{self._NEUTRON_URL}/v2.0/security-groups/{security_group_openstack_id}",
+            url=f"{self._get_endpoint()}/v2.0/security-groups/{security_group_openstack_id}",
             headers={"X-Auth-Token": keystone_token}
         )
 
@@ -266,7 +298,7 @@ class NeutronClient(OpenStackClient):
     ) -> None:
         await self.request(
             method="DELETE",
-            url=f"{self._NEUTRON_URL}/v2.0/security-group-rules/{security_group_rule_openstack_id}",
+            url=f"{self._get_endpoint()}/v2.0/security-group-rules/{security_group_rule_openstack_id}",
             headers={"X-Auth-Token": keystone_token}
         )
 
@@ -277,6 +309,43 @@ class NeutronClient(OpenStackClient):
     ) -> None:
         await self.request(
             method="DELETE",
-            url=f"{self._NEUTRON_URL}/v2.0/floatingips/{floating_ip_openstack_id}",
+            url=f"{self._get_endpoint()}/v2.0/floatingips/{floating_ip_openstack_id}",
             headers={"X-Auth-Token": keystone_token},
         )
+
+
+def _to_security_group_rule_dto(rule: dict) -> SecurityGroupRuleDTO:
+    return SecurityGroupRuleDTO(
+        openstack_id=rule["id"],
+        security_group_openstack_id=rule["security_group_id"],
+        protocol=rule.get("protocol"),
+        ether_type=rule.get("ethertype"),
+        direction=SecurityGroupRuleDirection(rule["direction"]),
+        port_range_min=rule.get("port_range_min"),
+        port_range_max=rule.get("port_range_max"),
+        remote_ip_prefix=rule.get("remote_ip_prefix"),
+    )
+
+
+def _to_os_network_interface_dto(port: dict) -> OsNetworkInterfaceDto:
+    fixed_ip_address: str | None = (
+        fixed_ips[0].get("ip_address")
+        if (fixed_ips := port.get("fixed_ips")) is not None and len(fixed_ips) > 0
+        else None
+    )
+    return OsNetworkInterfaceDto(
+        openstack_id=port.get("id"),
+        name=port.get("name"),
+        network_openstack_id=port.get("network_id"),
+        project_openstack_id=port.get("project_id"),
+        status=port.get("status"),
+        fixed_ip_address=fixed_ip_address,
+    )
+
+
+def _to_floating_ip_dto(floating_ip: dict) -> FloatingIpDTO:
+    return FloatingIpDTO(
+        openstack_id=floating_ip["id"],
+        status=floating_ip["status"],
+        address=floating_ip["floating_ip_address"],
+    )
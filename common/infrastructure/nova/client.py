@@ -1,20 +1,20 @@
 import uuid
+from typing import AsyncGenerator
 
 from httpx import Response
 
+from common.domain.keystone.enum import OpenStackServiceType
 from common.domain.server.dto import OsServerDto
 from common.domain.server.enum import ServerStatus
 from common.exception.openstack_exception import OpenStackException
 from common.infrastructure.openstack_client import OpenStackClient
-from common.util.envs import Envs, get_envs
-
-envs: Envs = get_envs()
+from common.util.microversion import negotiate_microversion, create_microversion_headers
+from common.util.tracing import trace_methods
 
 
+@trace_methods
 class NovaClient(OpenStackClient):
-    _OPEN_STACK_URL: str = envs.OPENSTACK_SERVER_URL
-    _NOVA_PORT: int = envs.NOVA_PORT
-    _NOVA_URL: str = f"{_OPEN_STACK_URL}:{_NOVA_PORT}"
+    _SERVICE_TYPE: OpenStackServiceType = OpenStackServiceType.COMPUTE
 
     async def get_server(
         self,
@@ -23,28 +23,65 @@ class NovaClient(OpenStackClient):
     ) -> OsServerDto:
         response: Response = await self.request(
             method="GET",
-            url=f"{self._NOVA_URL}/v2.1/servers/{server_openstack_id}",
+            url=f"{self._get_endpoint()}/v2.1/servers/{server_openstack_id}",
             headers={"X-Auth-Token": keystone_token},
+            hedge=True,
         )
-        server: dict = response.json().get("server", {})
-        return OsServerDto(
-            openstack_id=server.get("id"),
-            project_openstack_id=server.get("tenant_id"),
-            status=ServerStatus.parse(server.get("status")),
-            volume_openstack_ids=[
-                volume_dict.get("id")
-                for volume_dict in server.get("os-extended-volumes:volumes_attached")
-            ],
-        )
+        return _to_os_server_dto(response.json().get("server", {}))
+
+    async def iterate_servers(
+        self,
+        keystone_token: str,
+        project_openstack_id: str | None = None,
+        page_size: int | None = None,
+    ) -> AsyncGenerator[OsServerDto, None]:
+        """
+        서버 목록을 page 단위로 조회하여 하나씩 반환한다.
+
+        :param project_openstack_id: 지정한 경우 해당 프로젝트의 서버만 조회한다. (token의 프로젝트와 다른 경우 admin 권한 필요)
+        """
+        params: dict[str, str] = {}
+        if project_openstack_id is not None:
+            params["all_tenants"] = "true"
+            params["project_id"] = project_openstack_id
+
+        async for server in self.paginate(
+            url=f"{self._get_endpoint()}/v2.1/servers/detail",
+            resource_key="servers",
+            headers={"X-Auth-Token": keystone_token},
+            params=params,
+            page_size=page_size,
+        ):
+            yield _to_os_server_dto(server)
 
     async def get_vnc_console(
         self,
         keystone_token: str,
         server_openstack_id: str
     ) -> str:
+        # 2.6부터 지원하는 remote console API를 우선 사용하고, 지원하지 않는 경우 기존 action API를 사용한다.
+        microversion: str | None = await negotiate_microversion(self._SERVICE_TYPE, "2.6")
+        if microversion is not None:
+            response: Response = await self.request(
+                method="POST",
+                url=f"{self._get_endpoint()}/v2.1/servers/{server_openstack_id}/remote-consoles",
+                headers={
+                    "Content-Type": "application/json",
+                    "X-Auth-Token": keystone_token,
+                    **create_microversion_headers(self._SERVICE_TYPE, microversion),
+                },
+                json={
+                    "remote_console": {
+                        "protocol": "vnc",
+                        "type": "novnc"
+                    }
+                }
+            )
+            return response.json().get("remote_console").get("url")
+
         response: Response = await self.request(
             method="POST",
-            url=f"{self._NOVA_URL}/v2.1/servers/{server_openstack_id}/action",
+            url=f"{self._get_endpoint()}/v2.1/servers/{server_openstack_id}/action",
             headers={
                 "Content-Type": "application/json",
                 "X-Auth-Token": keystone_token,
@@ -65,7 +102,7 @@ class NovaClient(OpenStackClient):
         try:
             await self.request(
                 method="GET",
-                url=f"{self._NOVA_URL}/v2.1/servers/{server_openstack_id}",
+                url=f"{self._get_endpoint()}/v2.1/servers/{server_openstack_id}",
                 headers={"X-Auth-Token": keystone_token},
             )
         except OpenStackException as ex:
@@ -85,7 +122,7 @@ class NovaClient(OpenStackClient):
     ) -> str:
         response: Response = await self.request(
             method="POST",
-            url=f"{self._NOVA_URL}/v2.1/servers",
+            url=f"{self._get_endpoint()}/v2.1/servers",
             headers={
                 "Content-Type": "application/json",
                 "X-Auth-Token": keystone_token,
@@ -117,7 +154,7 @@ class NovaClient(OpenStackClient):
     ) -> None:
         await self.request(
             method="DELETE",
-            url=f"{self._NOVA_URL}/v2.1/servers/{server_openstack_id}",
+            url=f"{self._get_endpoint()}/v2.1/servers/{server_openstack_id}",
             headers={"X-Auth-Token": keystone_token},
         )
 
@@ -129,7 +166,7 @@ class NovaClient(OpenStackClient):
     ) -> None:
         await self.request(
             method="POST",
-            url=self._NOVA_URL + f"/v2.1/servers/{server_openstack_id}/os-volume_attachments",
+            url=self._get_endpoint() + f"/v2.1/servers/{server_openstack_id}/os-volume_attachments",
             headers={
                 "Content-Type": "application/json",
                 "X-Auth-Token": keystone_token,
@@ -148,7 +185,7 @@ class NovaClient(OpenStackClient):
     ) -> None:
         await self.request(
             method="POST",
-            url=self._NOVA_URL + f"/v2.1/servers/{server_openstack_id}/action",
+            url=self._get_endpoint() + f"/v2.1/servers/{server_openstack_id}/action",
             headers={
                 "Content-Type": "application/json",
                 "X-Auth-Token": keystone_token,
@@ -165,7 +202,7 @@ class NovaClient(OpenStackClient):
     ) -> None:
         await self.request(
             method="POST",
-            url=self._NOVA_URL + f"/v2.1/servers/{server_openstack_id}/action",
+            url=self._get_endpoint() + f"/v2.1/servers/{server_openstack_id}/action",
             headers={
                 "Content-Type": "application/json",
                 "X-Auth-Token": keystone_token,
@@ -183,6 +220,18 @@ class NovaClient(OpenStackClient):
     ) -> None:
         await self.request(
             method="DELETE",
-            url=self._NOVA_URL + f"/v2.1/servers/{server_openstack_id}/os-volume_attachments/{volume_openstack_id}",
+            url=self._get_endpoint() + f"/v2.1/servers/{server_openstack_id}/os-volume_attachments/{volume_openstack_id}",
             headers={"X-Auth-Token": keystone_token},
         )
+
+
+def _to_os_server_dto(server: dict) -> OsServerDto:
+    return OsServerDto(
+        openstack_id=server.get("id"),
+        project_openstack_id=server.get("tenant_id"),
+        status=ServerStatus.parse(server.get("status")),
+        volume_openstack_ids=[
+            volume_dict.get("id")
+            for volume_dict in server.get("os-extended-volumes:volumes_attached")
+        ],
+    )
@@ -1,15 +1,41 @@
+import asyncio
 import logging
-from typing import Any
+import time
+from typing import Any, AsyncGenerator, Awaitable
 
-from httpx import AsyncClient, Response, HTTPStatusError
+from httpx import AsyncClient, Response, HTTPStatusError, TransportError, URL
 
-from common.exception.openstack_exception import OpenStackException
+from common.domain.keystone.enum import OpenStackServiceType
+from common.exception.common_exception import DeadlineExceededException
+from common.exception.openstack_exception import OpenStackException, OpenStackUnavailableException
 from common.infrastructure.async_client import get_async_client
+from common.util.circuit_breaker import CircuitBreaker, get_circuit_breaker
+from common.util.deadline import check_deadline, wait_until_deadline
+from common.util.envs import get_envs, Envs
+from common.util.hedging import hedge as hedge_request, record_latency
+from common.util.json_decoder import decode_response_json
+from common.util.microversion import invalidate_microversions
+from common.util.service_catalog import get_service_endpoint
+from common.util.slow_log import SlowOperationKind, is_slow, record_slow_operation, normalize_openstack_url
+from common.util.system_token_manager import refresh_system_keystone_token_on_unauthorized
+from common.util.tracing import Span, SpanKind, start_span
 
+envs: Envs = get_envs()
 logger = logging.getLogger(__name__)
 
+# 응답을 기다리는 중에 취소해도 OpenStack 자원 상태가 바뀌지 않는 method
+_READ_ONLY_METHODS: frozenset[str] = frozenset({"GET", "HEAD"})
+
 
 class OpenStackClient:
+    _SERVICE_TYPE: OpenStackServiceType
+
+    def _get_endpoint(self) -> str:
+        """
+        :return: service catalog에서 찾은 `_SERVICE_TYPE` service의 endpoint url
+        """
+        return get_service_endpoint(self._SERVICE_TYPE)
+
     async def request(
         self,
         method: str,
@@ -17,29 +43,183 @@ class OpenStackClient:
         json: dict[str, Any] | None = None,
         headers: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
+        hedge: bool = False,
     ) -> Response:
+        """
+        :param hedge: 응답이 늦으면 같은 요청을 한 번 더 보내 먼저 온 응답을 사용한다. (`OPENSTACK_HEDGING_ENABLED`)
+                      여러 번 보내도 안전한 GET 요청에만 적용된다.
+        """
         client: AsyncClient = get_async_client()
         headers = headers or {"Content-Type": "application/json"}
-        response: Response = await client.request(
+        hedge = hedge and method == "GET" and envs.OPENSTACK_HEDGING_ENABLED
+        response: Response = await self._send(
+            client=client,
             method=method,
             url=url,
             headers=headers,
             json=json,
             params=params,
+            hedge=hedge,
         )
 
+        rejected_token: str | None = headers.get("X-Auth-Token")
+        if response.status_code == 401 and rejected_token is not None:
+            # system token이 만료되었거나 교체된 경우 갱신된 token으로 한 번만 재시도한다.
+            refreshed_token: str | None = await refresh_system_keystone_token_on_unauthorized(rejected_token)
+            if refreshed_token is not None:
+                response = await self._send(
+                    client=client,
+                    method=method,
+                    url=url,
+                    headers={**headers, "X-Auth-Token": refreshed_token},
+                    json=json,
+                    params=params,
+                    hedge=hedge,
+                )
+
+        if response.status_code == 406 and "OpenStack-API-Version" in headers:
+            # 요청한 microversion을 지원하지 않는 경우 다음 요청에서 지원 범위를 다시 조회한다.
+            invalidate_microversions(self._SERVICE_TYPE)
+
         try:
             response.raise_for_status()
         except HTTPStatusError:
             status_code: int = response.status_code
-            try:
-                error_message: str = str(response.json())
-            except Exception:
-                error_message: str = response.text
             logger.error(
-                f"Respond errors from OpenStack API. "
-                f"Status code={status_code}, message={error_message}"
+                "Respond errors from OpenStack API. Status code=%d, message=%s", status_code, response.text,
+                extra={"http_url": url},
             )
             raise OpenStackException(openstack_status_code=status_code)
 
         return response
+
+    async def paginate(
+        self,
+        url: str,
+        resource_key: str,
+        headers: dict[str, Any],
+        params: dict[str, Any] | None = None,
+        page_size: int | None = None,
+        hedge: bool = False,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """
+        marker/limit 기반 목록 API를 page 단위로 조회하여 resource를 하나씩 반환한다.
+        한 번에 하나의 page만 메모리에 유지하므로 resource가 많은 프로젝트도 일정한 메모리로 순회할 수 있다.
+
+        응답의 `{resource_key}_links`에 다음 page(`rel=next`) 링크가 있는 경우에만 다음 page를 조회한다.
+        (pagination을 지원하지 않는 경우 전체 목록이 한 번에 반환된다.)
+
+        :param url: 목록 API url
+        :param resource_key: 응답에서 목록이 담긴 key (ex. `servers`, `ports`)
+        :param headers: 요청 header
+        :param params: limit, marker를 제외한 query parameter
+        :param page_size: page 크기. 기본값은 `OPENSTACK_LIST_PAGE_SIZE`
+        :param hedge: page 조회 요청에 hedging을 적용한다. (`request()` 참고)
+        """
+        page_params: dict[str, Any] = {**(params or {}), "limit": page_size or envs.OPENSTACK_LIST_PAGE_SIZE}
+        while True:
+            response: Response = await self.request(
+                method="GET", url=url, headers=headers, params=page_params, hedge=hedge
+            )
+            body: dict[str, Any] = decode_response_json(response)
+            resources: list[dict[str, Any]] = body.get(resource_key, [])
+            for resource in resources:
+                yield resource
+
+            links: list[dict[str, Any]] = body.get(f"{resource_key}_links") or []
+            if not resources or not any(link.get("rel") == "next" for link in links):
+                return
+            # next 링크의 url은 public endpoint일 수 있으므로 현재 endpoint에 marker만 바꾸어 요청한다.
+            page_params = {**page_params, "marker": resources[-1]["id"]}
+
+    @classmethod
+    async def _send(
+        cls,
+        client: AsyncClient,
+        method: str,
+        url: str,
+        headers: dict[str, Any],
+        json: dict[str, Any] | None,
+        params: dict[str, Any] | None,
+        hedge: bool,
+    ) -> Response:
+        if not hedge:
+            return await cls._send_once(client=client, method=method, url=url, headers=headers, json=json, params=params)
+
+        return await hedge_request(
+            endpoint=_get_latency_endpoint(method, URL(url)),
+            send=lambda: cls._send_once(client=client, method=method, url=url, headers=headers, json=json, params=params),
+            # 장애가 발생한 API node의 빠른 5xx 응답이 정상 응답을 기다리던 요청을 취소하지 않도록 한다.
+            is_success=lambda response: response.status_code < 500,
+        )
+
+    @staticmethod
+    async def _send_once(
+        client: AsyncClient,
+        method: str,
+        url: str,
+        headers: dict[str, Any],
+        json: dict[str, Any] | None,
+        params: dict[str, Any] | None,
+    ) -> Response:
+        """
+        endpoint(region) 별 circuit breaker를 거쳐 요청한다.
+        장애가 발생한 region의 endpoint로 요청이 계속 몰려 다른 region의 요청까지 지연되지 않도록 한다.
+
+        :raise OpenStackUnavailableException: endpoint의 circuit이 열려 있는 경우
+        """
+        request_url: URL = URL(url)
+        if method not in _READ_ONLY_METHODS:
+            # 이미 보낸 생성/변경 요청을 취소하면 OpenStack에는 자원이 생성되었는데 service가 기록하거나
+            # 보상 작업을 등록하지 못하므로, deadline은 보내기 전에만 확인하고 응답을 끝까지 기다린다.
+            check_deadline()
+
+        circuit_breaker: CircuitBreaker = get_circuit_breaker(f"{request_url.scheme}://{request_url.netloc.decode()}")
+        if not circuit_breaker.allow_request():
+            raise OpenStackUnavailableException()
+
+        started_at: float = time.perf_counter()
+        try:
+            with start_span(
+                name=f"{method} {request_url.host}:{request_url.port}",
+                kind=SpanKind.CLIENT,
+                attributes={"http.method": method, "http.url": url},
+            ) as span:
+                request: Awaitable[Response] = client.request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    json=json,
+                    params=params,
+                )
+                if method in _READ_ONLY_METHODS:
+                    # 요청의 deadline이 지나면 응답을 기다리지 않고 취소하여 connection과 DB transaction을 빨리 반환한다.
+                    request = wait_until_deadline(request)
+                response: Response = await request
+                span.set_attribute("http.status_code", response.status_code)
+        except TransportError:
+            circuit_breaker.record_failure()
+            raise
+        except (DeadlineExceededException, asyncio.CancelledError):
+            circuit_breaker.record_abandoned()
+            raise
+        finally:
+            duration_ms: float = (time.perf_counter() - started_at) * 1000
+            if is_slow(SlowOperationKind.OPENSTACK_CALL, duration_ms):
+                record_slow_operation(
+                    SlowOperationKind.OPENSTACK_CALL, normalize_openstack_url(method, request_url.path), duration_ms,
+                    host=request_url.netloc.decode(),
+                )
+
+        if response.status_code >= 500:
+            circuit_breaker.record_failure()
+        else:
+            circuit_breaker.record_success()
+            if method == "GET":
+                record_latency(_get_latency_endpoint(method, request_url), duration_ms / 1000)
+        return response
+
+
+def _get_latency_endpoint(method: str, request_url: URL) -> str:
+    # 같은 API라도 endpoint(region) 별로 응답 시간이 다르므로 endpoint 별로 집계한다.
+    return f"{request_url.netloc.decode()} {normalize_openstack_url(method, request_url.path)}"
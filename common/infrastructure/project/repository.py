@@ -5,8 +5,10 @@ from common.domain.enum import SortOrder
 from common.domain.project.entity import Project, ProjectUser
 from common.domain.project.enum import ProjectSortOption
 from common.infrastructure.database import session_factory
+from common.util.tracing import trace_methods
 
 
+@trace_methods
 class ProjectRepository:
     async def find_all(
         self,
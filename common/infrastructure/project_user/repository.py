@@ -1,9 +1,14 @@
-from sqlalchemy import select, exists
+from datetime import datetime
 
-from common.domain.project.entity import ProjectUser
+from sqlalchemy import select, exists, func, delete
+
+from common.domain.project.entity import Project, ProjectUser, ProjectUserInvalidation
+from common.domain.user.entity import User
 from common.infrastructure.database import session_factory
+from common.util.tracing import trace_methods
 
 
+@trace_methods
 class ProjectUserRepository:
     async def exists_by_project_and_user(
         self,
@@ -19,6 +24,27 @@ class ProjectUserRepository:
             result: bool = await session.scalar(stmt)
             return result
 
+    async def exists_active_membership(
+        self,
+        project_id: int,
+        user_id: int
+    ) -> bool:
+        """
+        삭제되지 않은 user가 삭제되지 않은 project에 소속되어 있는지 확인한다.
+        """
+        async with session_factory() as session:
+            stmt = select(exists().where(
+                ProjectUser.project_id == project_id,
+                ProjectUser.user_id == user_id,
+                User.id == ProjectUser.user_id,
+                User.deleted_at.is_(None),
+                Project.id == ProjectUser.project_id,
+                Project.deleted_at.is_(None),
+            ))
+
+            result: bool = await session.scalar(stmt)
+            return result
+
     async def find_by_project_and_user(
         self,
         project_id: int,
@@ -48,3 +74,39 @@ class ProjectUserRepository:
         async with session_factory() as session:
             await session.delete(project_user)
             await session.flush()
+
+    async def create_invalidation(
+        self,
+        invalidation: ProjectUserInvalidation,
+    ) -> None:
+        async with session_factory() as session:
+            session.add(invalidation)
+            await session.flush()
+
+    async def find_invalidations_after(
+        self,
+        invalidation_id: int,
+    ) -> list[ProjectUserInvalidation]:
+        async with session_factory() as session:
+            invalidations: list[ProjectUserInvalidation] = list(
+                await session.scalars(
+                    select(ProjectUserInvalidation)
+                    .where(ProjectUserInvalidation.id > invalidation_id)
+                    .order_by(ProjectUserInvalidation.id)
+                )
+            )
+            return invalidations
+
+    async def find_last_invalidation_id(self) -> int:
+        async with session_factory() as session:
+            last_id: int | None = await session.scalar(select(func.max(ProjectUserInvalidation.id)))
+            return last_id or 0
+
+    async def delete_invalidations_created_before(
+        self,
+        created_at: datetime,
+    ) -> None:
+        async with session_factory() as session:
+            await session.execute(
+                delete(ProjectUserInvalidation).where(ProjectUserInvalidation.created_at < created_at)
+            )
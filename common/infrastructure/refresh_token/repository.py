@@ -0,0 +1,46 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import select, update, CursorResult
+
+from common.domain.refresh_token.entity import RefreshToken
+from common.infrastructure.database import session_factory
+from common.util.tracing import trace_methods
+
+
+@trace_methods
+class RefreshTokenRepository:
+    async def find_by_token_hash(self, token_hash: str) -> RefreshToken | None:
+        async with session_factory() as session:
+            refresh_token: RefreshToken | None = await session.scalar(
+                select(RefreshToken).where(RefreshToken.token_hash == token_hash)
+            )
+            return refresh_token
+
+    async def create(self, refresh_token: RefreshToken) -> RefreshToken:
+        async with session_factory() as session:
+            session.add(refresh_token)
+            await session.flush()
+            return refresh_token
+
+    async def revoke_if_active(self, refresh_token_id: int) -> bool:
+        """
+        아직 폐기되지 않은 경우에만 refresh token을 폐기한다.
+        같은 refresh token으로 동시에 재발급을 요청하더라도 하나의 요청만 성공하도록 조건부 update를 사용한다.
+
+        :return: 폐기에 성공했는지 여부
+        """
+        async with session_factory() as session:
+            result: CursorResult = await session.execute(
+                update(RefreshToken)
+                .where(RefreshToken.id == refresh_token_id, RefreshToken.revoked_at.is_(None))
+                .values(revoked_at=datetime.now(timezone.utc))
+            )
+            return result.rowcount == 1
+
+    async def revoke_all_by_family_id(self, family_id: str) -> None:
+        async with session_factory() as session:
+            await session.execute(
+                update(RefreshToken)
+                .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+                .values(revoked_at=datetime.now(timezone.utc))
+            )
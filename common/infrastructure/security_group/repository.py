@@ -1,3 +1,5 @@
+from typing import AsyncGenerator
+
 from sqlalchemy import select, ScalarResult, Select, exists
 from sqlalchemy.orm import selectinload
 
@@ -6,8 +8,10 @@ from common.domain.network_interface.entity import NetworkInterface
 from common.domain.security_group.entity import SecurityGroup, NetworkInterfaceSecurityGroup
 from common.domain.security_group.enum import SecurityGroupSortOption
 from common.infrastructure.database import session_factory
+from common.util.tracing import trace_methods
 
 
+@trace_methods
 class SecurityGroupRepository:
     async def find_all_by_ids(
         self,
@@ -57,6 +61,42 @@ class SecurityGroupRepository:
             result: ScalarResult[SecurityGroup] = await session.scalars(query)
             return result.all()
 
+    async def stream_all_by_project_id(
+        self,
+        project_id: int,
+        batch_size: int = 500,
+    ) -> AsyncGenerator[SecurityGroup, None]:
+        """
+        프로젝트의 삭제되지 않은 모든 보안 그룹을 relation과 함께 id 순으로 하나씩 반환한다.
+
+        `ServerRepository.stream_all_by_project_id()`와 같은 이유로 `batch_size`개씩 나누어 조회한다.
+        """
+        async with session_factory() as session:
+            last_id: int = 0
+            while True:
+                query: Select[tuple[SecurityGroup]] = (
+                    select(SecurityGroup)
+                    .where(
+                        SecurityGroup.project_id == project_id,
+                        SecurityGroup.deleted_at.is_(None),
+                        SecurityGroup.id > last_id,
+                    )
+                    .options(
+                        selectinload(SecurityGroup._linked_network_interfaces)
+                        .joinedload(NetworkInterfaceSecurityGroup._network_interface)
+                        .joinedload(NetworkInterface._server)
+                    )
+                    .order_by(SecurityGroup.id)
+                    .limit(batch_size)
+                )
+                security_groups: list[SecurityGroup] = (await session.scalars(query)).all()
+                for security_group in security_groups:
+                    yield security_group
+                if len(security_groups) < batch_size:
+                    return
+                last_id = security_groups[-1].id
+                session.expunge_all()
+
     async def find_by_id(
         self,
         security_group_id: int,
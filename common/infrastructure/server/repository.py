@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import AsyncGenerator
 
 from sqlalchemy import select, Select, ScalarResult, exists
 from sqlalchemy.orm import selectinload, InstrumentedAttribute
@@ -9,8 +10,10 @@ from common.domain.security_group.entity import NetworkInterfaceSecurityGroup
 from common.domain.server.entity import Server
 from common.domain.server.enum import ServerSortOption
 from common.infrastructure.database import session_factory
+from common.util.tracing import trace_methods
 
 
+@trace_methods
 class ServerRepository:
     async def find_all_by_project_id(
         self,
@@ -64,6 +67,44 @@ class ServerRepository:
 
             return result.all()
 
+    async def stream_all_by_project_id(
+        self,
+        project_id: int,
+        batch_size: int = 500,
+    ) -> AsyncGenerator[Server, None]:
+        """
+        프로젝트의 삭제되지 않은 모든 서버를 relation과 함께 id 순으로 하나씩 반환한다.
+
+        Collection relation의 `selectinload`는 같은 connection에서 추가 query를 실행하므로 결과를 모두 읽지 않은
+        streaming cursor(`stream_scalars`)와 함께 사용할 수 없다. (MySQL)
+        대신 id 기준으로 `batch_size`개씩 나누어 조회하고, 다음 batch를 조회하기 전 session을 비워 메모리 사용량을 일정하게 유지한다.
+        """
+        async with session_factory() as session:
+            last_id: int = 0
+            while True:
+                query: Select[tuple[Server]] = (
+                    select(Server)
+                    .where(Server.project_id == project_id, Server.deleted_at.is_(None), Server.id > last_id)
+                    .options(
+                        selectinload(Server._linked_volumes),
+
+                        selectinload(Server._linked_network_interfaces).joinedload(NetworkInterface._floating_ip),
+
+                        selectinload(Server._linked_network_interfaces)
+                        .selectinload(NetworkInterface._linked_security_groups)
+                        .joinedload(NetworkInterfaceSecurityGroup._security_group),
+                    )
+                    .order_by(Server.id)
+                    .limit(batch_size)
+                )
+                servers: list[Server] = (await session.scalars(query)).all()
+                for server in servers:
+                    yield server
+                if len(servers) < batch_size:
+                    return
+                last_id = servers[-1].id
+                session.expunge_all()
+
     async def find_by_id(
         self,
         server_id: int,
@@ -0,0 +1,87 @@
+from datetime import datetime, timezone, timedelta
+
+from sqlalchemy import select, update, or_, CursorResult
+from sqlalchemy.exc import IntegrityError
+
+from common.domain.keystone.entity import SystemKeystoneToken
+from common.infrastructure.database import session_factory
+from common.util.auth_token_manager import encrypt_keystone_token
+from common.util.tracing import trace_methods
+
+
+@trace_methods
+class SystemKeystoneTokenRepository:
+    async def find(self) -> SystemKeystoneToken | None:
+        async with session_factory() as session:
+            system_keystone_token: SystemKeystoneToken | None = await session.scalar(
+                select(SystemKeystoneToken).where(SystemKeystoneToken.id == SystemKeystoneToken.ID)
+            )
+            return system_keystone_token
+
+    async def acquire_lease(self, lease_owner: str, lease_seconds: int) -> bool:
+        """
+        token 갱신 lease를 획득한다.
+        lease가 비어있거나 만료된 경우에만 획득할 수 있으며, 여러 worker가 동시에 요청하더라도 하나의 worker만 성공한다.
+
+        :return: lease 획득 여부
+        """
+        now: datetime = datetime.now(timezone.utc)
+        lease_expires_at: datetime = now + timedelta(seconds=lease_seconds)
+
+        async with session_factory() as session:
+            result: CursorResult = await session.execute(
+                update(SystemKeystoneToken)
+                .where(
+                    SystemKeystoneToken.id == SystemKeystoneToken.ID,
+                    or_(
+                        SystemKeystoneToken.lease_owner.is_(None),
+                        SystemKeystoneToken.lease_expires_at <= now,
+                    )
+                )
+                .values(lease_owner=lease_owner, lease_expires_at=lease_expires_at, updated_at=now)
+            )
+            if result.rowcount == 1:
+                return True
+
+        # 최초 실행이라 row가 없는 경우, row를 생성한 worker가 lease를 획득한다.
+        try:
+            async with session_factory() as session:
+                session.add(SystemKeystoneToken.create(lease_owner=lease_owner, lease_expires_at=lease_expires_at))
+        except IntegrityError:
+            return False
+        return True
+
+    async def save_token_and_release_lease(
+        self,
+        lease_owner: str,
+        token: str,
+        expires_at: datetime,
+        issued_at: datetime,
+    ) -> bool:
+        """
+        token은 암호화하여 저장한다.
+
+        :return: 저장 여부. lease가 만료되어 다른 worker가 획득한 경우 저장하지 않는다.
+        """
+        async with session_factory() as session:
+            result: CursorResult = await session.execute(
+                update(SystemKeystoneToken)
+                .where(SystemKeystoneToken.id == SystemKeystoneToken.ID, SystemKeystoneToken.lease_owner == lease_owner)
+                .values(
+                    token=encrypt_keystone_token(token),
+                    expires_at=expires_at,
+                    issued_at=issued_at,
+                    lease_owner=None,
+                    lease_expires_at=None,
+                    updated_at=datetime.now(timezone.utc),
+                )
+            )
+            return result.rowcount == 1
+
+    async def release_lease(self, lease_owner: str) -> None:
+        async with session_factory() as session:
+            await session.execute(
+                update(SystemKeystoneToken)
+                .where(SystemKeystoneToken.id == SystemKeystoneToken.ID, SystemKeystoneToken.lease_owner == lease_owner)
+                .values(lease_owner=None, lease_expires_at=None, updated_at=datetime.now(timezone.utc))
+            )
@@ -10,8 +10,10 @@ from common.domain.user.entity import User
 from common.domain.user.enum import UserSortOption
 from common.exception.common_exception import MultipleEntitiesFoundException
 from common.infrastructure.database import session_factory
+from common.util.tracing import trace_methods
 
 
+@trace_methods
 class UserRepository:
     async def find_all(
         self,
@@ -1,14 +1,18 @@
 from datetime import datetime
+from typing import AsyncGenerator
 
 from sqlalchemy import select, exists, ColumnElement, Select, ScalarResult
+from sqlalchemy.ext.asyncio import AsyncScalarResult
 from sqlalchemy.orm import joinedload, InstrumentedAttribute
 
 from common.domain.enum import SortOrder
 from common.domain.volume.entity import Volume
 from common.domain.volume.enum import VolumeSortOption
 from common.infrastructure.database import session_factory
+from common.util.tracing import trace_methods
 
 
+@trace_methods
 class VolumeRepository:
     async def exists_by_name_and_project(self, name: str, project_id: int) -> bool:
         async with session_factory() as session:
@@ -50,6 +54,31 @@ class VolumeRepository:
             result: ScalarResult = await session.scalars(query)
             return result.all()
 
+    async def stream_all_by_project_id(
+        self,
+        project_id: int,
+        batch_size: int = 1_000,
+    ) -> AsyncGenerator[Volume, None]:
+        """
+        프로젝트의 삭제되지 않은 모든 볼륨을 relation과 함께 id 순으로 하나씩 반환한다.
+
+        Relation이 모두 단일 객체(`joinedload`)이므로 하나의 query 결과를 `batch_size`개씩 읽어온다. (`yield_per`)
+        """
+        async with session_factory() as session:
+            query: Select = (
+                select(Volume)
+                .where(Volume.project_id == project_id, Volume.deleted_at.is_(None))
+                .options(
+                    joinedload(Volume._project),
+                    joinedload(Volume._server),
+                )
+                .order_by(Volume.id)
+                .execution_options(yield_per=batch_size)
+            )
+            result: AsyncScalarResult[Volume] = await session.stream_scalars(query)
+            async for volume in result:
+                yield volume
+
     async def find_by_id(
         self,
         volume_id: int,
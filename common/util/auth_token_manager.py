@@ -1,20 +1,99 @@
+import hashlib
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
+from cryptography.fernet import Fernet, InvalidToken, MultiFernet
 from fastapi import Depends
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
 
 from common.domain.keystone.model import KeystoneToken
-from common.exception.auth_exception import InvalidAccessTokenException
+from common.exception.auth_exception import InvalidAccessTokenException, AdminPermissionRequiredException
 from common.util.context import CurrentUser
 from common.util.envs import get_envs
+from common.util.membership_cache import is_project_member
+from common.util.service_catalog import set_current_region
 
 envs = get_envs()
 
 _JWT_SECRET_KEY = envs.JWT_SECRET
 _JWT_ALGORITHM = "HS256"
 _ACCESS_TOKEN_DURATION_MINUTES = envs.ACCESS_TOKEN_DURATION_MINUTES
+_REFRESH_TOKEN_DURATION_MINUTES = envs.REFRESH_TOKEN_DURATION_MINUTES
+# 첫 번째 key로 암호화하고, 모든 key로 복호화를 시도한다.
+_KEYSTONE_TOKEN_CIPHER: MultiFernet = MultiFernet(
+    [Fernet(key) for key in (envs.KEYSTONE_TOKEN_ENCRYPTION_KEY, *envs.KEYSTONE_TOKEN_PREVIOUS_ENCRYPTION_KEYS)]
+)
+
+
+@dataclass(frozen=True)
+class AccessTokenCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+
+class _VerifiedAccessTokenCache:
+    """
+    서명 검증이 끝난 access token의 `CurrentUser`를 token 만료 시각(`exp`)까지 보관하는 LRU cache.
+
+    token 원문 대신 SHA-256 digest를 key로 사용한다.
+    """
+
+    def __init__(self, max_size: int):
+        self._max_size: int = max_size
+        self._entries: OrderedDict[bytes, tuple[CurrentUser, float]] = OrderedDict()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    def get(self, key: bytes) -> CurrentUser | None:
+        entry: tuple[CurrentUser, float] | None = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        current_user, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return current_user
+
+    def put(self, key: bytes, current_user: CurrentUser, expires_at: float) -> None:
+        if self._max_size <= 0:
+            return
+
+        self._entries[key] = (current_user, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> AccessTokenCacheStats:
+        return AccessTokenCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            size=len(self._entries),
+            max_size=self._max_size,
+        )
+
+
+_verified_access_token_cache = _VerifiedAccessTokenCache(max_size=envs.ACCESS_TOKEN_CACHE_MAX_SIZE)
 
 
 def create_access_token(
@@ -23,6 +102,7 @@ def create_access_token(
     project_id: int,
     project_openstack_id: str,
     keystone_token: KeystoneToken,
+    project_region: str | None = None,
 ) -> str:
     now = datetime.now(tz=timezone.utc)
     issued_at: datetime = now
@@ -42,6 +122,7 @@ def create_access_token(
             "project": {
                 "id": project_id,
                 "openstack_id": project_openstack_id,
+                "region": project_region,
             },
             "keystone": {
                 "token": keystone_token.token,
@@ -55,18 +136,88 @@ def create_access_token(
     )
 
 
-def get_current_user(
+def create_refresh_token(keystone_token: KeystoneToken) -> tuple[str, datetime]:
+    """
+    refresh token은 재발급 시 keystone token을 rescope하므로, keystone token 만료 5분 전까지만 유효하다.
+
+    :return: 생성된 refresh token과 만료 시각이 담긴 tuple
+    """
+    expires_at: datetime = datetime.now(tz=timezone.utc) + timedelta(minutes=_REFRESH_TOKEN_DURATION_MINUTES)
+
+    buffered_exp = keystone_token.expires_at - timedelta(minutes=5)
+    if expires_at > buffered_exp:
+        expires_at = buffered_exp
+
+    return secrets.token_urlsafe(32), expires_at
+
+
+def hash_refresh_token(refresh_token: str) -> str:
+    return hashlib.sha256(refresh_token.encode()).hexdigest()
+
+
+def encrypt_keystone_token(keystone_token: str) -> str:
+    return _KEYSTONE_TOKEN_CIPHER.encrypt(keystone_token.encode()).decode()
+
+
+def decrypt_keystone_token(encrypted_keystone_token: str) -> str | None:
+    """
+    :return: 복호화한 keystone token. 현재 key로 복호화할 수 없다면(ex. 교체된 key로 암호화된 경우) None
+    """
+    try:
+        return _KEYSTONE_TOKEN_CIPHER.decrypt(encrypted_keystone_token.encode()).decode()
+    except InvalidToken:
+        return None
+
+
+async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(HTTPBearer()),
 ) -> CurrentUser:
-    # TODO: 유저, 프로젝트 등 데이터 유효성 검증 로직 추가
-    payload = _decode_access_token(token=credentials.credentials)
-    return CurrentUser(
+    """
+    :raise InvalidAccessTokenException: token이 유효하지 않거나, token의 user가 더 이상 project에 소속되어 있지 않은 경우
+    """
+    current_user: CurrentUser = _verify_access_token(token=credentials.credentials)
+    if not await is_project_member(user_id=current_user.user_id, project_id=current_user.project_id):
+        raise InvalidAccessTokenException()
+    # 요청에서 호출하는 OpenStack API는 프로젝트의 region endpoint를 사용한다.
+    set_current_region(current_user.project_region)
+    return current_user
+
+
+async def get_current_admin(current_user: CurrentUser = Depends(get_current_user)) -> CurrentUser:
+    """
+    :raise AdminPermissionRequiredException: 요청한 user가 `ADMIN_USER_IDS`에 포함되지 않은 경우
+    """
+    if current_user.user_id not in envs.ADMIN_USER_IDS:
+        raise AdminPermissionRequiredException()
+    return current_user
+
+
+def _verify_access_token(token: str) -> CurrentUser:
+    cache_key: bytes = hashlib.sha256(token.encode()).digest()
+    current_user: CurrentUser | None = _verified_access_token_cache.get(cache_key)
+    if current_user is not None:
+        return current_user
+
+    payload = _decode_access_token(token=token)
+    current_user = CurrentUser(
         user_id=int(payload.get("user").get("id")),
         user_openstack_id=payload.get("user").get("openstack_id"),
         project_id=int(payload.get("project").get("id")),
         project_openstack_id=payload.get("project").get("openstack_id"),
         keystone_token=payload.get("keystone").get("token"),
+        project_region=payload.get("project").get("region"),
     )
+    if payload.get("exp") is not None:
+        _verified_access_token_cache.put(cache_key, current_user=current_user, expires_at=payload.get("exp"))
+    return current_user
+
+
+def get_access_token_cache_stats() -> AccessTokenCacheStats:
+    return _verified_access_token_cache.stats()
+
+
+def clear_access_token_cache() -> None:
+    _verified_access_token_cache.clear()
 
 
 def _decode_access_token(token: str) -> dict[str, Any]:
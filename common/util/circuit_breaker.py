@@ -0,0 +1,102 @@
+import time
+from dataclasses import dataclass
+from enum import Enum
+
+from common.util.envs import get_envs, Envs
+
+envs: Envs = get_envs()
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitBreakerStats:
+    name: str
+    state: CircuitState
+    consecutive_failures: int
+    rejected: int
+
+
+class CircuitBreaker:
+    """
+    연속으로 `failure_threshold`번 실패하면 `reset_seconds` 동안 요청을 차단(open)한다.
+    차단 시간이 지나면 하나의 요청만 시험적으로 허용(half-open)하고, 성공하면 다시 요청을 허용(closed)한다.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, reset_seconds: float):
+        self.name: str = name
+        self._failure_threshold: int = failure_threshold
+        self._reset_seconds: float = reset_seconds
+        self._state: CircuitState = CircuitState.CLOSED
+        self._consecutive_failures: int = 0
+        self._opened_at: float = 0.0
+        self._rejected: int = 0
+
+    def allow_request(self) -> bool:
+        if self._state == CircuitState.CLOSED:
+            return True
+
+        if self._state == CircuitState.OPEN and time.monotonic() - self._opened_at >= self._reset_seconds:
+            self._state = CircuitState.HALF_OPEN
+            return True
+
+        # half-open 상태에서는 시험 요청의 결과가 나올 때까지 다른 요청을 차단한다.
+        self._rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+
+    def record_failure(self) -> None:
+        self._consecutive_failures += 1
+        if self._state == CircuitState.HALF_OPEN or self._consecutive_failures >= self._failure_threshold:
+            self._state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+
+    def record_abandoned(self) -> None:
+        """
+        결과를 확인하기 전에 요청이 취소된 경우(deadline 초과 등) 호출한다.
+        half-open 상태의 시험 요청이었다면 다시 차단하여, 시험 요청의 결과를 영원히 기다리지 않도록 한다.
+        """
+        if self._state == CircuitState.HALF_OPEN:
+            self._state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+
+    def stats(self) -> CircuitBreakerStats:
+        return CircuitBreakerStats(
+            name=self.name,
+            state=self._state,
+            consecutive_failures=self._consecutive_failures,
+            rejected=self._rejected,
+        )
+
+
+_circuit_breakers: dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """
+    :param name: 차단 단위 (ex. OpenStack endpoint의 `scheme://host:port`)
+    """
+    circuit_breaker: CircuitBreaker | None = _circuit_breakers.get(name)
+    if circuit_breaker is None:
+        circuit_breaker = CircuitBreaker(
+            name=name,
+            failure_threshold=envs.OPENSTACK_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+            reset_seconds=envs.OPENSTACK_CIRCUIT_BREAKER_RESET_SECONDS,
+        )
+        _circuit_breakers[name] = circuit_breaker
+    return circuit_breaker
+
+
+def get_circuit_breaker_stats() -> list[CircuitBreakerStats]:
+    return [circuit_breaker.stats() for circuit_breaker in _circuit_breakers.values()]
+
+
+def clear_circuit_breakers() -> None:
+    _circuit_breakers.clear()
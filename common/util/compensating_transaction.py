@@ -3,6 +3,8 @@ import logging
 from contextlib import asynccontextmanager
 from typing import Callable, AsyncGenerator
 
+from common.util.deadline import use_deadline
+
 logger = logging.getLogger(__name__)
 
 
@@ -14,6 +16,11 @@ class CompensationManager:
         self._recovery_tasks.append(task)
 
     async def rollback(self) -> None:
+        # 요청의 deadline이 지나 실패한 경우에도 이미 생성한 resource는 정리해야 하므로 deadline 없이 실행한다.
+        with use_deadline(None):
+            await self._run_recovery_tasks()
+
+    async def _run_recovery_tasks(self) -> None:
         for task in reversed(self._recovery_tasks):
             try:
                 result = task()
@@ -1,10 +1,11 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class CurrentUser:
     user_id: int
     user_openstack_id: str
     project_id: int
     project_openstack_id: str
     keystone_token: str
+    project_region: str | None = None
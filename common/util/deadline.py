@@ -0,0 +1,80 @@
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Iterator, TypeVar
+
+from common.exception.common_exception import DeadlineExceededException
+
+T = TypeVar("T")
+
+# 현재 요청을 끝내야 하는 시각(monotonic). None이면 제한이 없다.
+_deadline: ContextVar[float | None] = ContextVar("deadline", default=None)
+
+
+@contextmanager
+def use_deadline(timeout_seconds: float | None) -> Iterator[None]:
+    """
+    block 안에서(이후 생성되는 task 포함) 호출하는 DB, OpenStack API가 `timeout_seconds` 안에 끝나도록 한다.
+    바깥 block에 더 이른 deadline이 있다면 그 deadline을 유지한다.
+
+    :param timeout_seconds: 남은 처리 시간(초). None이면 deadline을 해제한다.
+    """
+    deadline: float | None = None
+    if timeout_seconds is not None:
+        deadline = time.monotonic() + timeout_seconds
+        outer_deadline: float | None = _deadline.get()
+        if outer_deadline is not None:
+            deadline = min(deadline, outer_deadline)
+
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def clear_deadline() -> None:
+    """
+    현재 context의 deadline을 해제한다. 응답을 보낸 뒤 실행되는 BackgroundTasks에는 요청의 deadline을 적용하지 않는다.
+    """
+    _deadline.set(None)
+
+
+def get_remaining_seconds() -> float | None:
+    """
+    :return: deadline까지 남은 시간(초). deadline이 없다면 None
+    """
+    deadline: float | None = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def check_deadline() -> None:
+    """
+    :raise DeadlineExceededException: deadline이 지난 경우
+    """
+    remaining_seconds: float | None = get_remaining_seconds()
+    if remaining_seconds is not None and remaining_seconds <= 0:
+        raise DeadlineExceededException()
+
+
+async def wait_until_deadline(awaitable: Awaitable[T]) -> T:
+    """
+    deadline까지 `awaitable`의 완료를 기다린다. deadline이 지나면 작업을 취소한다.
+
+    :raise DeadlineExceededException: deadline이 이미 지났거나, 기다리는 중에 지난 경우
+    """
+    remaining_seconds: float | None = get_remaining_seconds()
+    if remaining_seconds is None:
+        return await awaitable
+    if remaining_seconds <= 0:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise DeadlineExceededException()
+
+    try:
+        return await asyncio.wait_for(awaitable, timeout=remaining_seconds)
+    except asyncio.TimeoutError:
+        raise DeadlineExceededException()
@@ -10,11 +10,23 @@ class Envs(BaseSettings):
     DATABASE_PORT: str
     DATABASE_USERNAME: str
     DATABASE_PASSWORD: str
+    DATABASE_NAME: str = "cloud"
+    # 설정 시 위의 DATABASE_* 값 대신 사용할 SQLAlchemy async URL (ex. `sqlite+aiosqlite:///./local.db`)
+    DATABASE_URL: str | None = None
+    # 실행하는 SQL을 log로 출력할지 여부
+    DATABASE_ECHO: bool = False
 
     CLOUD_ADMIN_OPENSTACK_ID: str
     CLOUD_ADMIN_PASSWORD: str
     CLOUD_ADMIN_DEFAULT_PROJECT_OPENSTACK_ID: str
     REFRESH_INTERVAL_SECONDS_FOR_SYSTEM_KEYSTONE_TOKEN: int
+    # system keystone token의 만료 여부를 확인하는 주기(초)와, 만료 몇 초 전부터 미리 갱신할지
+    SYSTEM_KEYSTONE_TOKEN_CHECK_INTERVAL_SECONDS: int = 30
+    SYSTEM_KEYSTONE_TOKEN_REFRESH_AHEAD_SECONDS: int = 600
+    # system keystone token 발급 실패(5xx, 네트워크 오류) 시 최대 시도 횟수
+    SYSTEM_KEYSTONE_TOKEN_MAX_REFRESH_TRIES: int = 5
+    # 여러 worker 중 하나만 token을 갱신하도록 하는 lease의 유효 시간(초). 갱신 중인 worker가 종료되면 만료 후 다른 worker가 갱신한다.
+    SYSTEM_KEYSTONE_TOKEN_LEASE_SECONDS: int = 60
 
     DEFAULT_DOMAIN_ID: int
     DEFAULT_DOMAIN_OPENSTACK_ID: str
@@ -22,6 +34,22 @@ class Envs(BaseSettings):
 
     JWT_SECRET: str
     ACCESS_TOKEN_DURATION_MINUTES: int
+    # refresh token 유효 기간. 발급 시점의 keystone token 만료 시각을 넘지 않는다.
+    REFRESH_TOKEN_DURATION_MINUTES: int = 60 * 24
+    # refresh token과 함께 저장하는 keystone token의 암호화 key (Fernet key, `Fernet.generate_key()`)
+    # key 교체 시 이전 key를 `KEYSTONE_TOKEN_PREVIOUS_ENCRYPTION_KEYS`에 남겨두면 이전 key로 암호화된 token도 복호화할 수 있다.
+    KEYSTONE_TOKEN_ENCRYPTION_KEY: str
+    KEYSTONE_TOKEN_PREVIOUS_ENCRYPTION_KEYS: list[str] = []
+    # bcrypt 연산 전용 process 수와, 실행을 기다릴 수 있는 최대 연산 수 (초과 시 503 응답)
+    PASSWORD_HASHER_MAX_WORKERS: int = 2
+    PASSWORD_HASHER_MAX_QUEUE_SIZE: int = 32
+    # 검증된 access token을 보관하는 LRU cache의 최대 크기 (0이면 cache를 사용하지 않는다.)
+    ACCESS_TOKEN_CACHE_MAX_SIZE: int = 10_000
+    # access token의 (user, project) membership 검증 결과를 cache하는 시간(초)과 최대 크기
+    MEMBERSHIP_CACHE_TTL_SECONDS: int = 60
+    MEMBERSHIP_CACHE_MAX_SIZE: int = 10_000
+    # 다른 worker에서 발생한 membership 변경(invalidation)을 반영하는 주기(초)
+    MEMBERSHIP_INVALIDATION_SYNC_INTERVAL_SECONDS: int = 1
 
     MAX_CHECK_ATTEMPTS_FOR_SERVER_CREATION: int
     CHECK_INTERVAL_SECONDS_FOR_SERVER_CREATION: int
@@ -46,6 +74,49 @@ class Envs(BaseSettings):
     CINDER_PORT: int
     NEUTRON_PORT: int
     NOVA_PORT: int
+    # service catalog에서 endpoint를 선택할 region(미설정 시 첫 번째 region)과 interface(public, internal, admin)
+    # catalog에 해당 endpoint가 없다면 위의 OPENSTACK_SERVER_URL과 port로 요청한다.
+    OPENSTACK_REGION_NAME: str | None = None
+    OPENSTACK_ENDPOINT_INTERFACE: str = "public"
+    # OpenStack endpoint(region) 별로 연속 실패 횟수가 기준을 넘으면 일정 시간(초) 동안 요청을 차단한다.
+    OPENSTACK_CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = 5
+    OPENSTACK_CIRCUIT_BREAKER_RESET_SECONDS: int = 30
+    # 조회 API 요청이 endpoint의 최근 p95 응답 시간 안에 끝나지 않으면 같은 요청을 한 번 더 보낸다. (hedging)
+    # 추가 요청 수는 hedging 대상 요청 수의 일정 비율 이하로 제한하며, p95는 응답 시간이 일정 개수 이상 기록된 뒤부터 사용한다.
+    OPENSTACK_HEDGING_ENABLED: bool = False
+    OPENSTACK_HEDGE_BUDGET_RATIO: float = 0.05
+    OPENSTACK_HEDGE_MIN_SAMPLES: int = 20
+    # endpoint 별로 조회한 지원 microversion 범위를 cache하는 시간(초)
+    MICROVERSION_CACHE_TTL_SECONDS: int = 60 * 60
+    # OpenStack 목록 API를 page 단위로 조회할 때의 page 크기(limit)
+    OPENSTACK_LIST_PAGE_SIZE: int = 200
+    # event loop 지연 시간 측정 주기(초)와, 기록할 느린 callback의 기준 시간(ms, 0이면 기록하지 않는다.)
+    LOOP_LAG_MONITOR_INTERVAL_SECONDS: float = 0.5
+    LOOP_SLOW_CALLBACK_THRESHOLD_MS: int = 100
+    # 운영용 debug API(ex. `/debug/profile`)를 호출할 수 있는 관리자 user id 목록 (ex. `[1, 2]`)
+    ADMIN_USER_IDS: list[int] = []
+    # sampling profiler의 stack 수집 주기(ms)와 한 번에 profiling할 수 있는 최대 시간(초)
+    PROFILER_SAMPLING_INTERVAL_MS: int = 5
+    PROFILER_MAX_SECONDS: int = 60
+    # 설정 시 router, service, repository, OpenStack client 구간의 span을 OTLP JSON 형식으로 기록할 파일 (JSONL)
+    TRACE_EXPORT_PATH: str | None = None
+    # 외부에서 전달된 trace(`traceparent` header)가 없는 요청 중 span을 기록할 비율 (0.0 ~ 1.0)
+    TRACE_SAMPLE_RATIO: float = 1.0
+    # root logger level과, 출력을 기다리는 log의 최대 개수 (초과 시 log를 버린다.)
+    LOG_LEVEL: str = "INFO"
+    LOG_QUEUE_MAX_SIZE: int = 10_000
+    # logger 별로 WARNING 미만 log를 남길 비율 (ex. `{"sqlalchemy.engine": 0.01}`)
+    LOG_SAMPLE_RATES: dict[str, float] = {}
+    # SQL 한 건, `@transactional` 한 번, OpenStack API 호출 한 번이 이 시간(ms) 이상 걸리면 log로 남긴다. (0이면 남기지 않는다.)
+    SLOW_QUERY_THRESHOLD_MS: int = 200
+    SLOW_TRANSACTION_THRESHOLD_MS: int = 1000
+    SLOW_OPENSTACK_CALL_THRESHOLD_MS: int = 1000
+    # 같은 SQL, API 경로의 느린 작업은 이 구간(초)마다 처음 한 번만 상세 log를 남기고 나머지는 횟수로 집계한다.
+    SLOW_LOG_WINDOW_SECONDS: int = 60
+    # 요청 하나의 처리 제한 시간(초, 0이면 제한하지 않는다.)과, `X-Request-Timeout` header로 지정할 수 있는 최대 시간(초)
+    # 제한 시간이 지나면 진행 중인 OpenStack 조회(GET) 요청을 취소하고, 새 생성/변경 요청과 DB session을 시작하지 않는다.
+    REQUEST_TIMEOUT_SECONDS: float = 30
+    REQUEST_TIMEOUT_MAX_SECONDS: float = 120
 
 
 @lru_cache
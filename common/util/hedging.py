@@ -0,0 +1,144 @@
+import asyncio
+import contextvars
+import statistics
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Awaitable, Callable, TypeVar
+
+from common.util.envs import get_envs, Envs
+
+envs: Envs = get_envs()
+
+T = TypeVar("T")
+
+# endpoint 별로 p95 계산에 사용하는 최근 응답 시간 수
+_LATENCY_WINDOW_SIZE: int = 200
+# 요청이 적은 동안 쌓아 둘 수 있는 최대 추가 요청 수. 한꺼번에 몰리는 추가 요청을 제한한다.
+_MAX_BUDGET_TOKENS: float = 10.0
+
+
+@dataclass(frozen=True)
+class HedgingStats:
+    enabled: bool
+    hedged: int
+    hedge_wins: int
+    budget_exhausted: int
+
+
+# endpoint(`{host} {method} {정규화한 경로}`) 별 최근 응답 시간(초)
+_latencies: dict[str, deque[float]] = {}
+# 추가 요청을 보낼 수 있는 횟수. hedging 대상 요청마다 `OPENSTACK_HEDGE_BUDGET_RATIO`만큼 늘어나고, 추가 요청마다 1씩 줄어든다.
+_budget_tokens: float = 0.0
+_hedged: int = 0
+_hedge_wins: int = 0
+_budget_exhausted: int = 0
+
+# hedge()가 추가로 보낸 요청에서 실행 중인지 여부
+_hedged_attempt: ContextVar[bool] = ContextVar("hedged_attempt", default=False)
+
+
+def record_latency(endpoint: str, duration_seconds: float) -> None:
+    """
+    endpoint의 응답 시간을 기록한다.
+
+    추가 요청은 느린 첫 번째 요청을 이긴 경우에만 결과가 사용되어 빠른 쪽으로 치우치므로 기록하지 않는다.
+    """
+    if _hedged_attempt.get():
+        return
+    latencies: deque[float] | None = _latencies.get(endpoint)
+    if latencies is None:
+        latencies = deque(maxlen=_LATENCY_WINDOW_SIZE)
+        _latencies[endpoint] = latencies
+    latencies.append(duration_seconds)
+
+
+def get_hedge_delay_seconds(endpoint: str) -> float | None:
+    """
+    :return: 추가 요청을 보내기 전까지 기다릴 시간(endpoint의 최근 p95 응답 시간, 초).
+             응답 시간이 `OPENSTACK_HEDGE_MIN_SAMPLES`개 미만으로 기록되었다면 None
+    """
+    latencies: deque[float] | None = _latencies.get(endpoint)
+    if latencies is None or len(latencies) < max(envs.OPENSTACK_HEDGE_MIN_SAMPLES, 2):
+        return None
+    return statistics.quantiles(latencies, n=20)[-1]
+
+
+async def hedge(
+    endpoint: str,
+    send: Callable[[], Awaitable[T]],
+    is_success: Callable[[T], bool] = lambda result: True,
+) -> T:
+    """
+    `send()`가 endpoint의 p95 응답 시간 안에 끝나지 않으면 `send()`를 한 번 더 실행하고, 먼저 성공한 결과를 반환한다.
+    나머지 요청은 취소한다. 여러 번 실행해도 결과가 같은(idempotent) 조회 요청에만 사용한다.
+
+    API node 중 일부만 느린 경우 tail latency를 줄이기 위한 것으로,
+    추가 요청은 hedging 대상 요청의 `OPENSTACK_HEDGE_BUDGET_RATIO` 비율 이하로 제한한다.
+
+    :param endpoint: 응답 시간을 집계하는 단위 (`record_latency()`에 사용한 값)
+    :param send: 요청을 보내는 함수
+    :param is_success: 예외 없이 끝난 결과가 성공인지 여부. 실패한 결과는 사용하지 않고 나머지 요청을 기다린다.
+    :return: 먼저 성공한 요청의 결과. 모든 요청이 실패한 경우 첫 번째 요청의 결과
+    :raise: 모든 요청이 실패하고 첫 번째 요청이 예외로 끝난 경우 해당 예외
+    """
+    global _budget_tokens, _hedged, _hedge_wins, _budget_exhausted
+    _budget_tokens = min(_budget_tokens + envs.OPENSTACK_HEDGE_BUDGET_RATIO, _MAX_BUDGET_TOKENS)
+    delay_seconds: float | None = get_hedge_delay_seconds(endpoint)
+    if delay_seconds is None:
+        return await send()
+
+    # task는 현재 context(deadline, span 등)를 복사하여 실행된다.
+    started_at: float = time.perf_counter()
+    primary: asyncio.Task[T] = asyncio.create_task(send())
+    tasks: set[asyncio.Task[T]] = {primary}
+    try:
+        done, pending = await asyncio.wait(tasks, timeout=delay_seconds)
+        if not done:
+            if _budget_tokens >= 1:
+                _budget_tokens -= 1
+                _hedged += 1
+                hedged_context: contextvars.Context = contextvars.copy_context()
+                hedged_context.run(_hedged_attempt.set, True)
+                tasks.add(hedged_context.run(asyncio.create_task, send()))
+                pending = set(tasks)
+            else:
+                _budget_exhausted += 1
+
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None and is_success(task.result()):
+                    if task is not primary:
+                        _hedge_wins += 1
+                        if not primary.done():
+                            # 취소하는 첫 번째 요청의 응답 시간은 지금까지 걸린 시간 이상이므로, 이를 하한값으로 기록한다.
+                            # 기록하지 않으면 느린 응답이 빠지면서 p95가 점점 낮아져 추가 요청이 늘어난다.
+                            record_latency(endpoint, time.perf_counter() - started_at)
+                    return task.result()
+        return primary.result()
+    finally:
+        unfinished: list[asyncio.Task[T]] = [task for task in tasks if not task.done()]
+        for task in unfinished:
+            task.cancel()
+        # 취소한 요청의 connection이 반환될 때까지 기다린다.
+        await asyncio.gather(*unfinished, return_exceptions=True)
+
+
+def get_hedging_stats() -> HedgingStats:
+    return HedgingStats(
+        enabled=envs.OPENSTACK_HEDGING_ENABLED,
+        hedged=_hedged,
+        hedge_wins=_hedge_wins,
+        budget_exhausted=_budget_exhausted,
+    )
+
+
+def clear_hedging() -> None:
+    global _budget_tokens, _hedged, _hedge_wins, _budget_exhausted
+    _latencies.clear()
+    _budget_tokens = 0.0
+    _hedged = 0
+    _hedge_wins = 0
+    _budget_exhausted = 0
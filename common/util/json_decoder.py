@@ -0,0 +1,14 @@
+from typing import Any
+
+import orjson
+from httpx import Response
+
+
+def decode_response_json(response: Response) -> Any:
+    """
+    응답 body를 표준 json보다 빠른 orjson으로 decode한다.
+
+    decode는 event loop에서 실행한다. decode 중에는 GIL을 놓지 않으므로 별도 thread로 옮겨도 event loop 지연이 줄지 않는다.
+    큰 목록은 page 단위(`OPENSTACK_LIST_PAGE_SIZE`)로 조회하여 한 번에 decode하는 body의 크기를 제한한다.
+    """
+    return orjson.loads(response.content)
@@ -0,0 +1,160 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from logging import getLogger, Logger
+from typing import Any
+
+from common.util.envs import get_envs, Envs
+
+envs: Envs = get_envs()
+logger: Logger = getLogger(__name__)
+
+# event loop 지연 시간 histogram의 bucket 상한(ms)
+LAG_BUCKETS_MS: tuple[float, ...] = (1, 5, 10, 25, 50, 100, 250, 500, 1000, float("inf"))
+_MAX_RECENT_SLOW_CALLBACKS: int = 20
+
+
+@dataclass(frozen=True)
+class SlowCallback:
+    callback: str
+    duration_ms: float
+    occurred_at: float
+
+
+@dataclass(frozen=True)
+class LoopLagStats:
+    # bucket 상한(ms) 별 누적 관측 횟수
+    buckets: list[tuple[float, int]]
+    count: int
+    sum_ms: float
+    max_ms: float
+    slow_callbacks: int
+    recent_slow_callbacks: list[SlowCallback]
+
+
+class _LagHistogram:
+    def __init__(self, bounds: tuple[float, ...]):
+        self._bounds: tuple[float, ...] = bounds
+        self._counts: list[int] = [0] * len(bounds)
+        self.count: int = 0
+        self.sum_ms: float = 0.0
+        self.max_ms: float = 0.0
+
+    def observe(self, value_ms: float) -> None:
+        for index, bound in enumerate(self._bounds):
+            if value_ms <= bound:
+                self._counts[index] += 1
+                break
+        self.count += 1
+        self.sum_ms += value_ms
+        self.max_ms = max(self.max_ms, value_ms)
+
+    def cumulative_buckets(self) -> list[tuple[float, int]]:
+        buckets: list[tuple[float, int]] = []
+        total: int = 0
+        for bound, count in zip(self._bounds, self._counts):
+            total += count
+            buckets.append((bound, total))
+        return buckets
+
+
+_histogram: _LagHistogram = _LagHistogram(LAG_BUCKETS_MS)
+_slow_callbacks: int = 0
+_recent_slow_callbacks: deque[SlowCallback] = deque(maxlen=_MAX_RECENT_SLOW_CALLBACKS)
+_monitor_task: asyncio.Task | None = None
+_original_handle_run = asyncio.events.Handle._run
+
+
+def start_loop_monitor() -> None:
+    """
+    event loop 지연 시간 측정과 오래 실행된 callback 기록을 시작한다. 실행 중인 event loop 안에서 호출해야 한다.
+
+    - `LOOP_LAG_MONITOR_INTERVAL_SECONDS`마다 sleep 후 예정보다 늦게 깨어난 시간을 지연 시간으로 기록한다.
+    - 하나의 callback(coroutine의 한 단계)이 `LOOP_SLOW_CALLBACK_THRESHOLD_MS` 이상 loop를 점유하면 coroutine 이름과 함께 기록한다.
+    """
+    global _monitor_task
+    if _monitor_task is not None:
+        raise RuntimeError("Loop monitor is already started")
+
+    if envs.LOOP_SLOW_CALLBACK_THRESHOLD_MS > 0:
+        asyncio.events.Handle._run = _timed_handle_run
+    _monitor_task = asyncio.create_task(_monitor_lag(), name="loop-lag-monitor")
+
+
+async def stop_loop_monitor() -> None:
+    global _monitor_task
+    asyncio.events.Handle._run = _original_handle_run
+    if _monitor_task is None:
+        return
+
+    _monitor_task.cancel()
+    try:
+        await _monitor_task
+    except asyncio.CancelledError:
+        pass
+    _monitor_task = None
+
+
+def get_loop_lag_stats() -> LoopLagStats:
+    return LoopLagStats(
+        buckets=_histogram.cumulative_buckets(),
+        count=_histogram.count,
+        sum_ms=_histogram.sum_ms,
+        max_ms=_histogram.max_ms,
+        slow_callbacks=_slow_callbacks,
+        recent_slow_callbacks=list(_recent_slow_callbacks),
+    )
+
+
+def clear_loop_lag_stats() -> None:
+    global _histogram, _slow_callbacks
+    _histogram = _LagHistogram(LAG_BUCKETS_MS)
+    _slow_callbacks = 0
+    _recent_slow_callbacks.clear()
+
+
+async def _monitor_lag() -> None:
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    interval: float = envs.LOOP_LAG_MONITOR_INTERVAL_SECONDS
+    while True:
+        started_at: float = loop.time()
+        await asyncio.sleep(interval)
+        lag_ms: float = max(loop.time() - started_at - interval, 0.0) * 1000
+        _histogram.observe(lag_ms)
+
+
+def _timed_handle_run(handle: asyncio.Handle) -> None:
+    started_at: float = time.perf_counter()
+    _original_handle_run(handle)
+    duration_ms: float = (time.perf_counter() - started_at) * 1000
+    if duration_ms >= envs.LOOP_SLOW_CALLBACK_THRESHOLD_MS:
+        _record_slow_callback(handle, duration_ms)
+
+
+def _record_slow_callback(handle: asyncio.Handle, duration_ms: float) -> None:
+    global _slow_callbacks
+    callback: str = _describe_callback(handle)
+    _slow_callbacks += 1
+    _recent_slow_callbacks.append(SlowCallback(callback=callback, duration_ms=duration_ms, occurred_at=time.time()))
+    logger.warning("Slow callback blocked the event loop. callback=%s, duration_ms=%.1f", callback, duration_ms)
+
+
+def _describe_callback(handle: asyncio.Handle) -> str:
+    """
+    task의 한 단계라면 task의 coroutine 이름과, 현재 멈춰 있는 가장 안쪽 coroutine의 위치를 반환한다.
+    (ex. `get_users <- find_user_details@common/application/user/service.py:120`)
+    """
+    task: Any = getattr(getattr(handle, "_callback", None), "__self__", None)
+    if not isinstance(task, asyncio.Task):
+        return repr(handle)
+
+    coroutine: Any = task.get_coro()
+    name: str = getattr(coroutine, "__qualname__", repr(coroutine))
+    while getattr(coroutine, "cr_await", None) is not None and hasattr(coroutine.cr_await, "cr_frame"):
+        coroutine = coroutine.cr_await
+
+    frame: Any = getattr(coroutine, "cr_frame", None)
+    if frame is None:
+        return name
+    return f"{name} <- {frame.f_code.co_name}@{frame.f_code.co_filename}:{frame.f_lineno}"
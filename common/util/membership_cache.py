@@ -0,0 +1,160 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from logging import getLogger, Logger
+
+from common.domain.project.entity import ProjectUserInvalidation
+from common.infrastructure.project_user.repository import ProjectUserRepository
+from common.util.envs import get_envs, Envs
+
+envs: Envs = get_envs()
+logger: Logger = getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class MembershipCacheStats:
+    hits: int
+    misses: int
+    invalidations: int
+    size: int
+    max_size: int
+
+
+class _MembershipCache:
+    """
+    (user_id, project_id) 별 membership 유효 여부를 TTL 동안 보관하는 LRU cache.
+    유효하지 않은 membership도 함께 cache하여 삭제된 유저의 token으로 반복 요청해도 DB를 조회하지 않는다.
+    """
+
+    def __init__(self, ttl_seconds: int, max_size: int):
+        self._ttl_seconds: int = ttl_seconds
+        self._max_size: int = max_size
+        self._entries: OrderedDict[tuple[int, int], tuple[bool, float]] = OrderedDict()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._invalidations: int = 0
+
+    def get(self, user_id: int, project_id: int) -> bool | None:
+        key: tuple[int, int] = (user_id, project_id)
+        entry: tuple[bool, float] | None = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        is_member, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return is_member
+
+    def put(self, user_id: int, project_id: int, is_member: bool) -> None:
+        if self._max_size <= 0 or self._ttl_seconds <= 0:
+            return
+
+        key: tuple[int, int] = (user_id, project_id)
+        self._entries[key] = (is_member, time.monotonic() + self._ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int, project_id: int | None = None) -> None:
+        """
+        :param project_id: None이면 user의 모든 project membership을 제거한다.
+        """
+        if project_id is not None:
+            keys: list[tuple[int, int]] = [(user_id, project_id)] if (user_id, project_id) in self._entries else []
+        else:
+            keys: list[tuple[int, int]] = [key for key in self._entries if key[0] == user_id]
+        for key in keys:
+            del self._entries[key]
+        self._invalidations += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._hits = self._misses = self._invalidations = 0
+
+    def stats(self) -> MembershipCacheStats:
+        return MembershipCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            invalidations=self._invalidations,
+            size=len(self._entries),
+            max_size=self._max_size,
+        )
+
+
+_membership_cache = _MembershipCache(
+    ttl_seconds=envs.MEMBERSHIP_CACHE_TTL_SECONDS,
+    max_size=envs.MEMBERSHIP_CACHE_MAX_SIZE,
+)
+_last_invalidation_id: int | None = None
+_last_pruned_at: float = 0.0
+
+
+async def is_project_member(user_id: int, project_id: int) -> bool:
+    """
+    삭제되지 않은 user가 삭제되지 않은 project에 소속되어 있는지 확인한다.
+    cache에 없거나 만료된 경우에만 DB를 조회한다.
+    """
+    is_member: bool | None = _membership_cache.get(user_id=user_id, project_id=project_id)
+    if is_member is not None:
+        return is_member
+
+    is_member = await ProjectUserRepository().exists_active_membership(project_id=project_id, user_id=user_id)
+    _membership_cache.put(user_id=user_id, project_id=project_id, is_member=is_member)
+    return is_member
+
+
+async def invalidate_membership(user_id: int, project_id: int | None = None) -> None:
+    """
+    현재 worker의 cache에서 membership을 즉시 제거하고, 다른 worker에도 반영되도록 invalidation을 DB에 기록한다.
+    호출한 쪽의 transaction 안에서 기록되므로 transaction이 rollback되면 기록도 함께 취소된다.
+
+    :param project_id: None이면 user의 모든 project membership을 무효화한다.
+    """
+    _membership_cache.invalidate(user_id=user_id, project_id=project_id)
+    await ProjectUserRepository().create_invalidation(
+        invalidation=ProjectUserInvalidation.create(user_id=user_id, project_id=project_id)
+    )
+
+
+async def sync_membership_invalidations() -> None:
+    """
+    다른 worker(또는 현재 worker)가 기록한 invalidation을 읽어 cache에 반영한다. Scheduler에서 주기적으로 실행한다.
+
+    commit 순서가 id 순서와 달라 놓친 invalidation이 있더라도, 해당 cache는 최대 TTL 이후 만료된다.
+    TTL이 지난 invalidation은 더 이상 필요 없으므로 TTL 주기로 삭제한다.
+    """
+    global _last_invalidation_id, _last_pruned_at
+    repository: ProjectUserRepository = ProjectUserRepository()
+
+    if _last_invalidation_id is None:
+        _last_invalidation_id = await repository.find_last_invalidation_id()
+        _membership_cache.clear()
+        return
+
+    invalidations: list[ProjectUserInvalidation] = await repository.find_invalidations_after(
+        invalidation_id=_last_invalidation_id
+    )
+    for invalidation in invalidations:
+        _membership_cache.invalidate(user_id=invalidation.user_id, project_id=invalidation.project_id)
+        _last_invalidation_id = invalidation.id
+
+    if time.monotonic() - _last_pruned_at >= envs.MEMBERSHIP_CACHE_TTL_SECONDS:
+        _last_pruned_at = time.monotonic()
+        await repository.delete_invalidations_created_before(
+            created_at=datetime.now(timezone.utc) - timedelta(seconds=envs.MEMBERSHIP_CACHE_TTL_SECONDS * 2)
+        )
+
+
+def get_membership_cache_stats() -> MembershipCacheStats:
+    return _membership_cache.stats()
+
+
+def clear_membership_cache() -> None:
+    _membership_cache.clear()
@@ -0,0 +1,135 @@
+import asyncio
+import gc
+import os
+import resource
+import sys
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass
+
+from common.exception.common_exception import MemoryTracingNotStartedException
+
+# snapshot 비교 결과에서 제외할 allocation (tracemalloc 자체와 import 과정에서 발생한 allocation)
+_SNAPSHOT_FILTERS: list[tracemalloc.Filter] = [
+    tracemalloc.Filter(inclusive=False, filename_pattern=tracemalloc.__file__),
+    tracemalloc.Filter(inclusive=False, filename_pattern="<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(inclusive=False, filename_pattern="<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(inclusive=False, filename_pattern="<unknown>"),
+]
+
+
+@dataclass(frozen=True)
+class MemoryStats:
+    rss_bytes: int
+    peak_rss_bytes: int
+    tracing: bool
+    traced_bytes: int
+    traced_peak_bytes: int
+
+
+@dataclass(frozen=True)
+class AllocationDiff:
+    filename: str
+    lineno: int
+    size_bytes: int
+    size_diff_bytes: int
+    count: int
+    count_diff: int
+
+
+# 마지막으로 찍은 snapshot. 다음 snapshot은 이 snapshot과 비교한다.
+_previous_snapshot: tracemalloc.Snapshot | None = None
+
+
+def start_memory_tracing(frames: int) -> None:
+    """
+    tracemalloc을 시작하고 비교 기준이 될 snapshot을 찍는다. 이미 시작된 경우 기준 snapshot만 다시 찍는다.
+
+    :param frames: allocation 별로 저장할 traceback의 frame 수
+    """
+    global _previous_snapshot
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+    _previous_snapshot = _take_snapshot()
+
+
+def stop_memory_tracing() -> None:
+    """
+    tracemalloc을 중지하고 추적에 사용한 memory를 해제한다.
+    """
+    global _previous_snapshot
+    _previous_snapshot = None
+    tracemalloc.stop()
+
+
+async def take_memory_snapshot_diff(limit: int) -> list[AllocationDiff]:
+    """
+    snapshot을 찍어 이전 snapshot 이후 증가한 allocation을 파일, line 별로 반환하고, 찍은 snapshot을 다음 비교 기준으로 사용한다.
+    snapshot 비교는 allocation 수에 비례해 오래 걸리므로 별도 thread에서 실행한다.
+
+    :param limit: 반환할 최대 allocation 위치 수 (증가량이 큰 순서)
+    :raise MemoryTracingNotStartedException: tracemalloc이 시작되지 않은 경우
+    """
+    global _previous_snapshot
+    if not tracemalloc.is_tracing() or _previous_snapshot is None:
+        raise MemoryTracingNotStartedException()
+
+    previous_snapshot: tracemalloc.Snapshot = _previous_snapshot
+    snapshot: tracemalloc.Snapshot = await asyncio.to_thread(_take_snapshot)
+    statistics: list[tracemalloc.StatisticDiff] = await asyncio.to_thread(
+        snapshot.compare_to, previous_snapshot, "lineno"
+    )
+    _previous_snapshot = snapshot
+
+    return [
+        AllocationDiff(
+            filename=statistic.traceback[0].filename,
+            lineno=statistic.traceback[0].lineno,
+            size_bytes=statistic.size,
+            size_diff_bytes=statistic.size_diff,
+            count=statistic.count,
+            count_diff=statistic.count_diff,
+        )
+        for statistic in statistics[:limit]
+    ]
+
+
+def count_objects_by_type(limit: int) -> list[tuple[str, int]]:
+    """
+    gc가 추적하는 객체 수를 type 별로 세어 많은 순서로 반환한다. 모든 객체를 순회하므로 운영 중에는 필요할 때만 호출한다.
+
+    :param limit: 반환할 최대 type 수
+    :return: (`module.qualname` 형식의 type 이름, 객체 수) 목록
+    """
+    counts: Counter[type] = Counter(type(obj) for obj in gc.get_objects())
+    return [(f"{object_type.__module__}.{object_type.__qualname__}", count) for object_type, count in counts.most_common(limit)]
+
+
+def get_memory_stats() -> MemoryStats:
+    traced_bytes, traced_peak_bytes = tracemalloc.get_traced_memory()
+    return MemoryStats(
+        rss_bytes=_get_rss_bytes(),
+        peak_rss_bytes=_get_peak_rss_bytes(),
+        tracing=tracemalloc.is_tracing(),
+        traced_bytes=traced_bytes,
+        traced_peak_bytes=traced_peak_bytes,
+    )
+
+
+def _take_snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+
+
+def _get_rss_bytes() -> int:
+    try:
+        # Linux: `/proc/self/statm`의 두 번째 값이 RSS page 수
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return _get_peak_rss_bytes()
+
+
+def _get_peak_rss_bytes() -> int:
+    max_rss: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 byte, Linux는 KiB 단위로 반환한다.
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
@@ -0,0 +1,131 @@
+import time
+from dataclasses import dataclass
+from logging import getLogger, Logger
+
+from httpx import AsyncClient, Response
+
+from common.domain.keystone.enum import OpenStackServiceType
+from common.infrastructure.async_client import get_async_client
+from common.util.envs import get_envs, Envs
+from common.util.service_catalog import get_service_endpoint
+
+envs: Envs = get_envs()
+logger: Logger = getLogger(__name__)
+
+# microversion을 사용하는 service의 version 문서 경로와 `OpenStack-API-Version` header에 사용하는 service 이름
+# microversion이 필요한 요청이 있는 service만 등록한다. (ex. cinder는 `/v3`, `volume`)
+_VERSION_PATHS: dict[OpenStackServiceType, str] = {
+    OpenStackServiceType.COMPUTE: "/v2.1",
+}
+_HEADER_SERVICE_NAMES: dict[OpenStackServiceType, str] = {
+    OpenStackServiceType.COMPUTE: "compute",
+}
+# version 조회에 실패한 경우 다시 조회하기 전까지 기다리는 시간(초)
+_FAILURE_TTL_SECONDS: int = 60
+
+
+@dataclass(frozen=True, order=True)
+class Microversion:
+    major: int
+    minor: int
+
+    @classmethod
+    def parse(cls, version: str) -> "Microversion":
+        major, minor = version.split(".")
+        return cls(major=int(major), minor=int(minor))
+
+    def __str__(self) -> str:
+        return f"{self.major}.{self.minor}"
+
+
+@dataclass(frozen=True)
+class MicroversionRange:
+    min_version: Microversion
+    max_version: Microversion
+
+    def supports(self, version: Microversion) -> bool:
+        return self.min_version <= version <= self.max_version
+
+
+# (service type, endpoint) 별 지원 microversion 범위와 cache 만료 시각(monotonic). 범위가 None이면 microversion 미지원 또는 조회 실패
+_ranges: dict[tuple[OpenStackServiceType, str], tuple[MicroversionRange | None, float]] = {}
+
+
+async def negotiate_microversion(service_type: OpenStackServiceType, *candidates: str) -> str | None:
+    """
+    현재 region의 endpoint가 지원하는 microversion 중 가장 높은 것을 선택한다.
+
+    :param service_type: service type
+    :param candidates: 사용하려는 microversion 후보 (ex. `"2.6"`)
+    :return: 선택된 microversion. 지원하는 후보가 없다면 None (microversion header 없이 기본 version으로 요청한다.)
+    """
+    microversion_range: MicroversionRange | None = await get_microversion_range(service_type)
+    if microversion_range is None:
+        return None
+
+    supported: list[Microversion] = [
+        version for version in map(Microversion.parse, candidates) if microversion_range.supports(version)
+    ]
+    return str(max(supported)) if supported else None
+
+
+def create_microversion_headers(service_type: OpenStackServiceType, microversion: str | None) -> dict[str, str]:
+    if microversion is None:
+        return {}
+    return {"OpenStack-API-Version": f"{_HEADER_SERVICE_NAMES[service_type]} {microversion}"}
+
+
+async def get_microversion_range(service_type: OpenStackServiceType) -> MicroversionRange | None:
+    """
+    endpoint의 version 문서를 조회하여 지원 microversion 범위를 반환한다. 조회 결과는 `MICROVERSION_CACHE_TTL_SECONDS` 동안 cache한다.
+    """
+    if service_type not in _VERSION_PATHS:
+        return None
+
+    endpoint: str = get_service_endpoint(service_type)
+    cached: tuple[MicroversionRange | None, float] | None = _ranges.get((service_type, endpoint))
+    if cached is not None and cached[1] > time.monotonic():
+        return cached[0]
+
+    microversion_range: MicroversionRange | None = await _discover(endpoint + _VERSION_PATHS[service_type])
+    ttl_seconds: int = envs.MICROVERSION_CACHE_TTL_SECONDS if microversion_range is not None else _FAILURE_TTL_SECONDS
+    _ranges[(service_type, endpoint)] = (microversion_range, time.monotonic() + ttl_seconds)
+    return microversion_range
+
+
+async def discover_microversions() -> None:
+    """
+    microversion을 사용하는 모든 service의 지원 범위를 미리 조회한다. 서버 시작 시 실행한다.
+    """
+    for service_type in _VERSION_PATHS:
+        await get_microversion_range(service_type)
+
+
+def invalidate_microversions(service_type: OpenStackServiceType) -> None:
+    """
+    요청한 microversion이 거절된 경우(ex. upgrade/downgrade 후) 다음 요청에서 지원 범위를 다시 조회하도록 한다.
+    """
+    for key in [key for key in _ranges if key[0] == service_type]:
+        del _ranges[key]
+
+
+def clear_microversions() -> None:
+    _ranges.clear()
+
+
+async def _discover(url: str) -> MicroversionRange | None:
+    try:
+        client: AsyncClient = get_async_client()
+        response: Response = await client.get(url=url)
+        response.raise_for_status()
+        version: dict = response.json()["version"]
+        if not version.get("version"):
+            return None
+        return MicroversionRange(
+            min_version=Microversion.parse(version.get("min_version") or version["version"]),
+            max_version=Microversion.parse(version["version"]),
+        )
+    except Exception as ex:
+        # version 조회 실패가 API 요청 실패로 이어지지 않도록 기본 version을 사용한다.
+        logger.warning("Failed to discover microversions. url=%s, ex=%s", url, ex)
+        return None
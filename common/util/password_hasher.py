@@ -0,0 +1,112 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, TypeVar
+
+import bcrypt
+
+from common.exception.common_exception import PasswordHashingBusyException
+from common.util.envs import get_envs, Envs
+
+envs: Envs = get_envs()
+
+_ENCODING: str = "UTF-8"
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class PasswordHasherStats:
+    max_workers: int
+    max_queue_size: int
+    in_flight: int
+    completed: int
+    failed: int
+    rejected: int
+
+
+_executor: ProcessPoolExecutor | None = None
+_in_flight: int = 0
+_completed: int = 0
+_failed: int = 0
+_rejected: int = 0
+
+
+def init_password_hasher() -> None:
+    """
+    bcrypt 연산 전용 process pool을 생성한다.
+    bcrypt는 CPU를 오래 점유하므로 event loop나 기본 thread pool을 사용하는 다른 작업과 분리한다.
+    """
+    global _executor
+    if _executor is not None:
+        raise RuntimeError("Password hasher is already initialized")
+    _executor = ProcessPoolExecutor(
+        max_workers=envs.PASSWORD_HASHER_MAX_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def close_password_hasher() -> None:
+    global _executor
+    if _executor is None:
+        return
+    _executor.shutdown(wait=False, cancel_futures=True)
+    _executor = None
+
+
+async def hash_password(password: str) -> str:
+    """
+    :raise PasswordHashingBusyException: 대기 중인 bcrypt 연산이 queue 크기를 초과한 경우
+    """
+    hashed_password: bytes = await _submit(_hashpw, password.encode(_ENCODING))
+    return hashed_password.decode(_ENCODING)
+
+
+async def check_password(password: str, hashed_password: str) -> bool:
+    """
+    :raise PasswordHashingBusyException: 대기 중인 bcrypt 연산이 queue 크기를 초과한 경우
+    """
+    return await _submit(_checkpw, password.encode(_ENCODING), hashed_password.encode(_ENCODING))
+
+
+def get_password_hasher_stats() -> PasswordHasherStats:
+    return PasswordHasherStats(
+        max_workers=envs.PASSWORD_HASHER_MAX_WORKERS,
+        max_queue_size=envs.PASSWORD_HASHER_MAX_QUEUE_SIZE,
+        in_flight=_in_flight,
+        completed=_completed,
+        failed=_failed,
+        rejected=_rejected,
+    )
+
+
+async def _submit(func: Callable[..., T], *args) -> T:
+    global _in_flight, _completed, _failed, _rejected
+    # 실행 중인 연산(최대 worker 수)을 제외하고 대기 중인 연산이 queue 크기를 넘으면 즉시 거절한다.
+    if _in_flight >= envs.PASSWORD_HASHER_MAX_WORKERS + envs.PASSWORD_HASHER_MAX_QUEUE_SIZE:
+        _rejected += 1
+        raise PasswordHashingBusyException()
+
+    if _executor is None:
+        init_password_hasher()
+
+    _in_flight += 1
+    try:
+        result: T = await asyncio.get_running_loop().run_in_executor(_executor, func, *args)
+    except BaseException:
+        # 잘못된 hash 형식, worker process 종료(BrokenProcessPool), 요청 취소 등
+        _failed += 1
+        raise
+    finally:
+        _in_flight -= 1
+    _completed += 1
+    return result
+
+
+def _hashpw(password: bytes) -> bytes:
+    return bcrypt.hashpw(password, bcrypt.gensalt())
+
+
+def _checkpw(password: bytes, hashed_password: bytes) -> bool:
+    return bcrypt.checkpw(password, hashed_password)
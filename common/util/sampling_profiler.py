@@ -0,0 +1,111 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from enum import Enum
+from types import FrameType
+
+from common.exception.common_exception import ProfilerBusyException
+
+
+class ProfileFormat(Enum):
+    # `함수;함수;... 횟수` 형식의 text (flamegraph.pl, speedscope 등에서 불러올 수 있다.)
+    COLLAPSED = "collapsed"
+    # https://www.speedscope.app 의 file format
+    SPEEDSCOPE = "speedscope"
+
+
+# 아무 작업도 하지 않고 대기 중인 thread의 가장 안쪽 frame (event loop의 I/O 대기, thread pool worker의 작업 대기)
+_IDLE_FRAMES: frozenset[tuple[str, str]] = frozenset({
+    ("selectors.py", "select"),
+    ("threading.py", "wait"),
+    ("queue.py", "get"),
+})
+_PROJECT_ROOT: str = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) + os.sep
+
+_running: bool = False
+
+
+async def profile(seconds: float, interval_seconds: float) -> Counter[tuple[str, ...]]:
+    """
+    현재 process의 모든 thread의 stack을 `interval_seconds`마다 `seconds` 동안 sampling한다.
+    event loop thread(요청 처리, background task)와 thread pool에서 실행 중인 작업이 모두 포함되며, 대기 중인 stack은 제외한다.
+
+    :return: (thread 이름, 바깥쪽 frame, ..., 안쪽 frame) 별 sample 수
+    :raise ProfilerBusyException: 이미 다른 profiling이 진행 중인 경우
+    """
+    global _running
+    if _running:
+        raise ProfilerBusyException()
+
+    _running = True
+    try:
+        # sampling은 별도 thread에서 실행하므로 event loop는 profiling 중에도 계속 요청을 처리한다.
+        return await asyncio.to_thread(_sample, seconds, interval_seconds)
+    finally:
+        _running = False
+
+
+def to_collapsed(samples: Counter[tuple[str, ...]]) -> str:
+    return "".join(f"{';'.join(stack)} {count}\n" for stack, count in samples.most_common())
+
+
+def to_speedscope(samples: Counter[tuple[str, ...]], interval_seconds: float, name: str) -> dict:
+    frame_indexes: dict[str, int] = {}
+    stacks: list[list[int]] = []
+    weights: list[float] = []
+    for stack, count in samples.items():
+        stacks.append([frame_indexes.setdefault(frame, len(frame_indexes)) for frame in stack])
+        weights.append(count * interval_seconds * 1000)
+
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": name,
+        "exporter": "openstack-cloud-api",
+        "shared": {"frames": [{"name": frame} for frame in frame_indexes]},
+        "profiles": [{
+            "type": "sampled",
+            "name": name,
+            "unit": "milliseconds",
+            "startValue": 0,
+            "endValue": sum(weights),
+            "samples": stacks,
+            "weights": weights,
+        }],
+    }
+
+
+def _sample(seconds: float, interval_seconds: float) -> Counter[tuple[str, ...]]:
+    samples: Counter[tuple[str, ...]] = Counter()
+    sampler_thread_id: int = threading.get_ident()
+    deadline: float = time.monotonic() + seconds
+
+    while time.monotonic() < deadline:
+        thread_names: dict[int, str] = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == sampler_thread_id or _is_idle(frame):
+                continue
+            samples[(thread_names.get(thread_id, str(thread_id)), *_collapse(frame))] += 1
+        time.sleep(interval_seconds)
+
+    return samples
+
+
+def _collapse(frame: FrameType | None) -> list[str]:
+    stack: list[str] = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append(f"{code.co_name} ({_relative_path(code.co_filename)}:{code.co_firstlineno})")
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+def _is_idle(frame: FrameType) -> bool:
+    return (os.path.basename(frame.f_code.co_filename), frame.f_code.co_name) in _IDLE_FRAMES
+
+
+def _relative_path(filename: str) -> str:
+    return filename.removeprefix(_PROJECT_ROOT)
@@ -0,0 +1,145 @@
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from logging import getLogger, Logger
+from typing import Any, Iterator
+
+from common.domain.keystone.enum import OpenStackServiceType, EndpointInterface
+from common.exception.openstack_exception import OpenStackRegionNotFoundException
+from common.util.envs import get_envs, Envs
+
+envs: Envs = get_envs()
+logger: Logger = getLogger(__name__)
+
+# catalog의 endpoint url 끝에 붙은 API version과 그 뒤의 경로 (ex. `/v2.1`, `/v3/{project_id}`)
+_VERSION_SUFFIX_PATTERN: re.Pattern = re.compile(r"/v\d+(\.\d+)?(/.*)?$")
+
+_FALLBACK_PORTS: dict[OpenStackServiceType, int] = {
+    OpenStackServiceType.IDENTITY: envs.KEYSTONE_PORT,
+    OpenStackServiceType.COMPUTE: envs.NOVA_PORT,
+    OpenStackServiceType.NETWORK: envs.NEUTRON_PORT,
+    OpenStackServiceType.BLOCK_STORAGE: envs.CINDER_PORT,
+}
+
+
+@dataclass(frozen=True)
+class ServiceCatalogStats:
+    endpoints: int
+    loaded_from_token: bool
+    fallbacks: int
+
+
+# (service type, region, interface) 별 API version을 제외한 endpoint url
+_endpoints: dict[tuple[OpenStackServiceType, str | None, EndpointInterface], str] = {}
+# 현재 catalog를 조회할 때 사용한 system keystone token
+_catalog_token: str | None = None
+_fallbacks: int = 0
+# 현재 요청이 대상으로 하는 OpenStack region. 설정되지 않았다면 `OPENSTACK_REGION_NAME`을 사용한다.
+_current_region: ContextVar[str | None] = ContextVar("openstack_region", default=None)
+
+
+def update_service_catalog(catalog: list[dict[str, Any]], keystone_token: str) -> None:
+    """
+    keystone token 발급 응답(`token.catalog`) 또는 `GET /v3/auth/catalog` 응답의 catalog로 endpoint cache를 교체한다.
+
+    :param catalog: keystone service catalog
+    :param keystone_token: catalog를 조회할 때 사용한 token
+    """
+    global _endpoints, _catalog_token
+    endpoints: dict[tuple[OpenStackServiceType, str | None, EndpointInterface], str] = {}
+
+    for service in catalog:
+        service_type: OpenStackServiceType | None = OpenStackServiceType.from_catalog_type(service.get("type"))
+        if service_type is None:
+            continue
+
+        for endpoint in service.get("endpoints", []):
+            try:
+                interface: EndpointInterface = EndpointInterface(endpoint.get("interface"))
+            except ValueError:
+                continue
+            url: str = _strip_version(endpoint.get("url"))
+            region: str | None = endpoint.get("region_id") or endpoint.get("region")
+
+            endpoints.setdefault((service_type, region, interface), url)
+            # region을 지정하지 않은 경우 catalog에서 처음 등장한 region의 endpoint를 사용한다.
+            endpoints.setdefault((service_type, None, interface), url)
+
+    # 교체 중에 다른 coroutine이 일부만 채워진 cache를 보지 않도록 새 dict를 만든 뒤 한 번에 교체한다.
+    _endpoints = endpoints
+    _catalog_token = keystone_token
+    logger.info("Service catalog was updated. endpoints=%d", len(endpoints))
+
+
+def get_service_endpoint(service_type: OpenStackServiceType, region: str | None = None) -> str:
+    """
+    region, interface에 해당하는 endpoint url을 반환한다.
+    region을 지정하지 않았고 catalog에 endpoint가 없다면 `OPENSTACK_SERVER_URL`과 service 별 port로 만든 url을 반환한다.
+
+    :param service_type: service type
+    :param region: 대상 region. None이면 현재 요청의 region(`use_region`), 그 다음으로 `OPENSTACK_REGION_NAME`을 사용한다.
+    :return: API version을 제외한 endpoint url (ex. `http://controller:8774`)
+    :raise OpenStackRegionNotFoundException: 지정한 region(인자 또는 `use_region`)의 endpoint가 catalog에 없는 경우
+    """
+    global _fallbacks
+    requested_region: str | None = region or _current_region.get()
+    region = requested_region or envs.OPENSTACK_REGION_NAME
+    url: str | None = _endpoints.get(
+        (service_type, region, EndpointInterface(envs.OPENSTACK_ENDPOINT_INTERFACE))
+    )
+    if url is not None:
+        return url
+
+    if requested_region is not None:
+        # 설정된 url은 기본 region의 endpoint이므로, 다른 region의 자원이 기본 region에 생성되지 않도록 실패 처리한다.
+        raise OpenStackRegionNotFoundException(region=requested_region)
+    _fallbacks += 1
+    return f"{envs.OPENSTACK_SERVER_URL}:{_FALLBACK_PORTS[service_type]}"
+
+
+def get_current_region() -> str | None:
+    return _current_region.get() or envs.OPENSTACK_REGION_NAME
+
+
+def set_current_region(region: str | None) -> None:
+    """
+    현재 context(요청)에서 사용할 region을 설정한다. 이후 생성되는 task에도 전파된다.
+    """
+    _current_region.set(region)
+
+
+@contextmanager
+def use_region(region: str | None) -> Iterator[None]:
+    """
+    block 안에서 호출하는 OpenStack API가 `region`의 endpoint를 사용하도록 한다.
+    """
+    token = _current_region.set(region)
+    try:
+        yield
+    finally:
+        _current_region.reset(token)
+
+
+def get_service_catalog_token() -> str | None:
+    return _catalog_token
+
+
+def get_service_catalog_stats() -> ServiceCatalogStats:
+    return ServiceCatalogStats(
+        endpoints=len(_endpoints),
+        loaded_from_token=_catalog_token is not None,
+        fallbacks=_fallbacks,
+    )
+
+
+def clear_service_catalog() -> None:
+    global _endpoints, _catalog_token, _fallbacks
+    _endpoints = {}
+    _catalog_token = None
+    _fallbacks = 0
+
+
+def _strip_version(url: str) -> str:
+    # client는 API version을 포함한 경로(ex. `/v2.1/servers`)를 직접 붙이므로 catalog url의 version 이하 경로를 제거한다.
+    return _VERSION_SUFFIX_PATTERN.sub("", url.rstrip("/"))
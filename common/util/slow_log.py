@@ -0,0 +1,170 @@
+import hashlib
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import Enum
+from logging import getLogger, Logger
+from typing import Any, Iterator
+
+from common.util.envs import get_envs, Envs
+
+envs: Envs = get_envs()
+logger: Logger = getLogger(__name__)
+
+# SQL 정규화: 문자열/숫자 literal, `IN (?, ?, ...)` 같은 값 목록, 연속된 공백
+_SQL_STRING_PATTERN: re.Pattern = re.compile(r"'(?:[^'\\]|\\.|'')*'")
+_SQL_NUMBER_PATTERN: re.Pattern = re.compile(r"\b\d+(?:\.\d+)?\b")
+_SQL_VALUES_PATTERN: re.Pattern = re.compile(r"\(\s*(?:\?|%s|:\w+)(?:\s*,\s*(?:\?|%s|:\w+))*\s*\)")
+_WHITESPACE_PATTERN: re.Pattern = re.compile(r"\s+")
+# OpenStack url 정규화: UUID(하이픈 유무), 숫자 id 경로
+_URL_ID_PATTERN: re.Pattern = re.compile(
+    r"/(?:[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}|\d+)(?=/|$)"
+)
+_MAX_RECORDED_FINGERPRINTS: int = 1000
+
+
+class SlowOperationKind(Enum):
+    QUERY = "query"
+    TRANSACTION = "transaction"
+    OPENSTACK_CALL = "openstack_call"
+
+
+@dataclass
+class SlowOperationStats:
+    kind: SlowOperationKind
+    fingerprint: str
+    statement: str
+    operation: str | None
+    count: int
+    total_ms: float
+    max_ms: float
+    window_started_at: float
+
+
+# fingerprint 별로 현재 집계 구간(`SLOW_LOG_WINDOW_SECONDS`)에 발생한 느린 작업
+_windows: dict[str, SlowOperationStats] = {}
+# 현재 실행 중인 service method (`@transactional`). SQL, OpenStack 호출 log에 함께 남긴다.
+_current_operation: ContextVar[str | None] = ContextVar("slow_log_operation", default=None)
+
+
+def is_slow(kind: SlowOperationKind, duration_ms: float) -> bool:
+    """
+    :return: `duration_ms`가 작업 종류 별 기준 시간(`SLOW_*_THRESHOLD_MS`, 0이면 기록하지 않음) 이상인지 여부
+    """
+    threshold_ms: int = {
+        SlowOperationKind.QUERY: envs.SLOW_QUERY_THRESHOLD_MS,
+        SlowOperationKind.TRANSACTION: envs.SLOW_TRANSACTION_THRESHOLD_MS,
+        SlowOperationKind.OPENSTACK_CALL: envs.SLOW_OPENSTACK_CALL_THRESHOLD_MS,
+    }[kind]
+    return 0 < threshold_ms <= duration_ms
+
+
+def record_slow_operation(kind: SlowOperationKind, statement: str, duration_ms: float, **details: Any) -> None:
+    """
+    느린 작업을 기록한다. 기준 시간을 넘었는지는 호출하는 쪽에서 `is_slow()`로 먼저 확인한다.
+
+    같은 fingerprint(정규화한 statement)는 집계 구간(`SLOW_LOG_WINDOW_SECONDS`)마다 처음 한 번만 상세 내용을 log로 남기고,
+    이후에는 횟수만 센다. 집계 구간이 끝나면 구간 동안의 횟수, 최대/평균 시간을 log로 남긴다.
+
+    :param kind: 작업 종류
+    :param statement: 정규화한 SQL, `@transactional` 함수 이름 또는 정규화한 OpenStack API 경로
+    :param duration_ms: 소요 시간(ms)
+    :param details: log에 함께 남길 값 (ex. `rows`, `status_code`)
+    """
+    fingerprint: str = hashlib.sha1(f"{kind.value}:{statement}".encode()).hexdigest()[:16]
+    operation: str | None = _current_operation.get()
+    now: float = time.monotonic()
+    stats: SlowOperationStats | None = _windows.get(fingerprint)
+    if stats is not None and now - stats.window_started_at >= envs.SLOW_LOG_WINDOW_SECONDS:
+        _log_summary(_windows.pop(fingerprint))
+        stats = None
+
+    if stats is not None:
+        stats.count += 1
+        stats.total_ms += duration_ms
+        stats.max_ms = max(stats.max_ms, duration_ms)
+        return
+
+    if len(_windows) >= _MAX_RECORDED_FINGERPRINTS:
+        flush_slow_logs(force=True)
+    _windows[fingerprint] = SlowOperationStats(
+        kind=kind, fingerprint=fingerprint, statement=statement, operation=operation,
+        count=1, total_ms=duration_ms, max_ms=duration_ms, window_started_at=now,
+    )
+    logger.warning(
+        "Slow %s. duration_ms=%.1f, statement=%s, operation=%s",
+        kind.value, duration_ms, statement, operation,
+        extra={
+            "slow_kind": kind.value, "fingerprint": fingerprint, "duration_ms": round(duration_ms, 1),
+            "operation": operation, **details,
+        },
+    )
+
+
+def flush_slow_logs(force: bool = False) -> None:
+    """
+    집계 구간이 끝난 fingerprint의 발생 횟수, 최대 시간을 log로 남기고 집계를 초기화한다. scheduler에서 주기적으로 실행한다.
+
+    :param force: 구간이 끝나지 않은 집계도 모두 남긴다.
+    """
+    now: float = time.monotonic()
+    for fingerprint, stats in list(_windows.items()):
+        if force or now - stats.window_started_at >= envs.SLOW_LOG_WINDOW_SECONDS:
+            _log_summary(_windows.pop(fingerprint))
+
+
+def get_slow_log_stats() -> list[SlowOperationStats]:
+    """
+    :return: 현재 집계 구간의 느린 작업 목록 (발생 횟수가 많은 순서)
+    """
+    return sorted(_windows.values(), key=lambda stats: stats.count, reverse=True)
+
+
+def clear_slow_logs() -> None:
+    _windows.clear()
+
+
+@contextmanager
+def use_operation(operation: str) -> Iterator[None]:
+    """
+    block 안에서 발생한 느린 SQL, OpenStack 호출 log에 호출한 service method 이름을 남긴다.
+    """
+    token = _current_operation.set(operation)
+    try:
+        yield
+    finally:
+        _current_operation.reset(token)
+
+
+def normalize_sql(statement: str) -> str:
+    """
+    literal 값과 IN 목록의 길이가 달라도 같은 SQL로 집계되도록 정규화한다.
+    (ex. `SELECT ... WHERE id IN (?, ?, ?) AND name = 'a'` -> `SELECT ... WHERE id IN (?) AND name = ?`)
+    """
+    statement = _SQL_STRING_PATTERN.sub("?", statement)
+    statement = _SQL_NUMBER_PATTERN.sub("?", statement)
+    statement = _SQL_VALUES_PATTERN.sub("(?)", statement)
+    return _WHITESPACE_PATTERN.sub(" ", statement).strip()
+
+
+def normalize_openstack_url(method: str, path: str) -> str:
+    """
+    (ex. `GET`, `/v2.1/servers/0b2f.../action` -> `GET /v2.1/servers/{id}/action`)
+    """
+    return f"{method} {_URL_ID_PATTERN.sub('/{id}', path)}"
+
+
+def _log_summary(stats: SlowOperationStats) -> None:
+    if stats.count <= 1:
+        return
+    logger.warning(
+        "Slow %s repeated. count=%d, max_ms=%.1f, avg_ms=%.1f, statement=%s",
+        stats.kind.value, stats.count, stats.max_ms, stats.total_ms / stats.count, stats.statement,
+        extra={
+            "slow_kind": stats.kind.value, "fingerprint": stats.fingerprint, "count": stats.count,
+            "max_ms": round(stats.max_ms, 1), "avg_ms": round(stats.total_ms / stats.count, 1),
+            "window_seconds": envs.SLOW_LOG_WINDOW_SECONDS, "operation": stats.operation,
+        },
+    )
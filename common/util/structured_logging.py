@@ -0,0 +1,194 @@
+import copy
+import json
+import logging
+import queue
+import random
+import sys
+import traceback
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Iterator
+
+from common.util.envs import get_envs, Envs
+from common.util.tracing import get_current_span, Span
+
+envs: Envs = get_envs()
+
+# 현재 요청의 ID. 요청이 아닌 작업(scheduler job 등)에서는 None
+_request_id: ContextVar[str | None] = ContextVar("request_id", default=None)
+
+# JSON 출력 시 `extra`로 전달된 값을 구분하기 위한 LogRecord 기본 속성 목록
+_RECORD_ATTRIBUTES: frozenset[str] = frozenset(
+    vars(logging.LogRecord("", logging.INFO, "", 0, "", None, None)).keys()
+) | {"message", "asctime", "request_id", "trace_id", "span_id"}
+
+
+@dataclass(frozen=True)
+class LoggingStats:
+    queue_size: int
+    dropped: int
+    sampled_out: int
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    log 하나를 한 줄의 JSON 객체로 출력한다. `extra`로 전달한 값도 함께 출력한다.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        log: dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key in ("request_id", "trace_id", "span_id"):
+            if getattr(record, key, None) is not None:
+                log[key] = getattr(record, key)
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                log[key] = value
+        if record.exc_info:
+            log["exception"] = "".join(traceback.format_exception(*record.exc_info))
+        elif record.exc_text:
+            log["exception"] = record.exc_text
+        return json.dumps(log, ensure_ascii=False, default=str)
+
+
+class _ContextFilter(logging.Filter):
+    # log를 남긴 coroutine의 context(요청 ID, trace)는 listener thread에서 알 수 없으므로 queue에 넣기 전에 기록한다.
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = _request_id.get()
+        span: Span | None = get_current_span()
+        if span is not None and span.sampled:
+            record.trace_id = span.trace_id
+            record.span_id = span.span_id
+        return True
+
+
+class _SamplingFilter(logging.Filter):
+    """
+    `LOG_SAMPLE_RATES`에 지정한 logger(와 하위 logger)의 WARNING 미만 log를 지정한 비율만큼만 남긴다.
+    """
+
+    def __init__(self, sample_rates: dict[str, float]):
+        super().__init__()
+        # 더 구체적인(긴) logger 이름이 먼저 적용되도록 정렬한다.
+        self._sample_rates: list[tuple[str, float]] = sorted(
+            sample_rates.items(), key=lambda item: len(item[0]), reverse=True
+        )
+        self.sampled_out: int = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        for name, rate in self._sample_rates:
+            if record.name == name or record.name.startswith(name + "."):
+                if random.random() < rate:
+                    return True
+                self.sampled_out += 1
+                return False
+        return True
+
+
+class _NonBlockingQueueHandler(QueueHandler):
+    """
+    log를 queue에 넣기만 하고 JSON 변환, 출력은 listener thread에서 처리한다.
+
+    `%` formatting과 traceback 문자열 변환은 log를 남긴 시점의 값으로 queue에 넣기 전에 처리한다.
+    (args로 전달한 객체가 이후에 바뀌거나, ORM 객체의 lazy load가 다른 thread에서 실행되지 않도록)
+    queue가 가득 찬 경우 event loop가 기다리지 않도록 log를 버린다.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped: int = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = "".join(traceback.format_exception(*record.exc_info))
+            # traceback이 참조하는 frame(과 지역 변수)을 listener thread까지 유지하지 않는다.
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+_handler: _NonBlockingQueueHandler | None = None
+_sampling_filter: _SamplingFilter | None = None
+_listener: QueueListener | None = None
+
+
+def init_logging() -> None:
+    """
+    root logger의 출력을 queue를 거쳐 별도 thread에서 JSON 형식으로 stdout에 출력하도록 설정한다.
+    """
+    global _handler, _sampling_filter, _listener
+    if _listener is not None:
+        raise RuntimeError("Logging is already initialized")
+
+    log_queue: queue.Queue = queue.Queue(maxsize=envs.LOG_QUEUE_MAX_SIZE)
+    _sampling_filter = _SamplingFilter(envs.LOG_SAMPLE_RATES)
+    _handler = _NonBlockingQueueHandler(log_queue)
+    _handler.addFilter(_sampling_filter)
+    _handler.addFilter(_ContextFilter())
+
+    stream_handler: logging.StreamHandler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JsonFormatter())
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+    root_logger: logging.Logger = logging.getLogger()
+    root_logger.addHandler(_handler)
+    root_logger.setLevel(envs.LOG_LEVEL)
+
+
+def close_logging() -> None:
+    """
+    queue에 남은 log를 모두 출력한 뒤 listener thread를 종료한다.
+    """
+    global _handler, _sampling_filter, _listener
+    if _listener is None:
+        return
+
+    logging.getLogger().removeHandler(_handler)
+    _listener.stop()
+    _handler = None
+    _sampling_filter = None
+    _listener = None
+
+
+def get_request_id() -> str | None:
+    return _request_id.get()
+
+
+@contextmanager
+def use_request_id(request_id: str) -> Iterator[None]:
+    """
+    block 안에서(이후 생성되는 task 포함) 남기는 log에 요청 ID를 포함한다.
+    """
+    token = _request_id.set(request_id)
+    try:
+        yield
+    finally:
+        _request_id.reset(token)
+
+
+def get_logging_stats() -> LoggingStats:
+    return LoggingStats(
+        queue_size=_handler.queue.qsize() if _handler is not None else 0,
+        dropped=_handler.dropped if _handler is not None else 0,
+        sampled_out=_sampling_filter.sampled_out if _sampling_filter is not None else 0,
+    )
@@ -1,29 +1,254 @@
-from datetime import datetime, timezone
+import asyncio
+import contextvars
+import os
+import socket
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
 from logging import getLogger, Logger
+from typing import Any, Coroutine, TypeVar
 
-from httpx import AsyncClient, Response, HTTPStatusError
+import backoff
+from httpx import AsyncClient, Response, HTTPError, HTTPStatusError
+from sqlalchemy.exc import SQLAlchemyError
 
+from common.domain.keystone.entity import SystemKeystoneToken
 from common.domain.keystone.model import KeystoneToken
+from common.exception.openstack_exception import SystemKeystoneTokenUnavailableException
 from common.infrastructure.async_client import get_async_client
+from common.infrastructure.system_keystone_token.repository import SystemKeystoneTokenRepository
 from common.util.envs import get_envs, Envs
+from common.util.service_catalog import update_service_catalog, get_service_catalog_token
 
 envs: Envs = get_envs()
 logger: Logger = getLogger(__name__)
 
+T = TypeVar("T")
+
+# 공유 token 갱신 lease를 획득할 때 사용하는 worker 식별자
+_LEASE_OWNER: str = f"{socket.gethostname()[:40]}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+_LEASE_POLL_INTERVAL_SECONDS: float = 0.5
+
 _admin_keystone_token: KeystoneToken | None = None
+_admin_keystone_token_issued_at: datetime | None = None
+# 교체되기 직전의 token. 교체 전에 보낸 요청이 401을 받은 경우 다시 갱신하지 않고 현재 token으로 재시도한다.
+_previous_admin_keystone_token: str | None = None
+_refresh_task: asyncio.Task | None = None
+# 실행 중인 background 갱신 task. event loop는 task를 약하게 참조하므로 완료될 때까지 참조를 유지한다.
+_background_tasks: set[asyncio.Task] = set()
 
 
 def get_system_keystone_token() -> str:
-    global _admin_keystone_token
-    if _admin_keystone_token is None:
-        raise ValueError("Admin keystone token is not set")
+    """
+    :raise SystemKeystoneTokenUnavailableException: token이 아직 발급되지 않았거나 만료된 경우
+    """
+    if _admin_keystone_token is None or _admin_keystone_token.expires_at <= datetime.now(timezone.utc):
+        # 만료된 token을 그대로 사용하지 않고, 갱신을 시작한 뒤 실패 응답을 반환한다.
+        _start_refresh_in_background()
+        raise SystemKeystoneTokenUnavailableException()
     return _admin_keystone_token.token
 
 
-async def refresh_system_keystone_token() -> None:
+async def refresh_system_keystone_token() -> str:
+    """
+    현재 system keystone token을 새로운 token으로 교체한다.
+    이미 진행 중인 갱신이 있다면 새로 요청하지 않고 해당 갱신의 결과를 기다린다. (single-flight)
+
+    다른 worker가 이미 갱신한 token이 있다면 keystone에 요청하지 않고 해당 token을 사용한다.
+
+    :return: 갱신된 token
+    """
+    global _refresh_task
+    if _refresh_task is None or _refresh_task.done():
+        rejected_token: str | None = _admin_keystone_token.token if _admin_keystone_token is not None else None
+        _refresh_task = _create_detached_task(_refresh(rejected_token))
+    # 기다리던 caller가 취소되더라도 다른 caller가 기다리는 갱신은 취소되지 않도록 한다.
+    return await asyncio.shield(_refresh_task)
+
+
+async def refresh_system_keystone_token_if_needed() -> None:
+    """
+    token이 없거나, 만료가 임박했거나, 발급 후 `REFRESH_INTERVAL_SECONDS_FOR_SYSTEM_KEYSTONE_TOKEN`이 지난 경우 갱신한다.
+    Scheduler에서 주기적으로 실행한다.
+    """
+    if not _needs_refresh(_admin_keystone_token, _admin_keystone_token_issued_at):
+        return
+
+    try:
+        await refresh_system_keystone_token()
+    except Exception as ex:
+        logger.error(f"Failed to refresh system keystone token. ex={ex}")
+
+
+async def refresh_system_keystone_token_on_unauthorized(rejected_token: str) -> str | None:
+    """
+    OpenStack API 요청이 401로 거절된 경우 호출한다.
+
+    :param rejected_token: 거절된 요청에 사용한 token
+    :return: 재시도에 사용할 system token. `rejected_token`이 system token이 아니라면 None
+    """
+    if _admin_keystone_token is None:
+        return None
+    if rejected_token == _admin_keystone_token.token:
+        return await refresh_system_keystone_token()
+    if rejected_token == _previous_admin_keystone_token:
+        return _admin_keystone_token.token
+    return None
+
+
+def _needs_refresh(keystone_token: KeystoneToken | None, issued_at: datetime | None) -> bool:
+    if keystone_token is None or issued_at is None:
+        return True
+
+    now: datetime = datetime.now(timezone.utc)
+    refresh_ahead: timedelta = timedelta(seconds=envs.SYSTEM_KEYSTONE_TOKEN_REFRESH_AHEAD_SECONDS)
+    max_age: timedelta = timedelta(seconds=envs.REFRESH_INTERVAL_SECONDS_FOR_SYSTEM_KEYSTONE_TOKEN)
+    return keystone_token.expires_at - now <= refresh_ahead or now - issued_at >= max_age
+
+
+def _start_refresh_in_background() -> None:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    if _refresh_task is None or _refresh_task.done():
+        task: asyncio.Task = _create_detached_task(refresh_system_keystone_token_if_needed())
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+
+def _create_detached_task(coro: Coroutine[Any, Any, T]) -> asyncio.Task[T]:
+    """
+    요청의 context(DB session, deadline 등)를 복사하지 않는 빈 context에서 task를 시작한다.
+    갱신은 여러 요청이 공유하므로, 갱신을 시작한 요청의 transaction에 포함되거나 요청의 deadline에 취소되지 않아야 한다.
+    """
+    # task는 생성 시점의 context를 복사하므로, 빈 context 안에서 생성한다. (`create_task(context=...)`는 3.11부터 지원)
+    return contextvars.Context().run(asyncio.create_task, coro)
+
+
+async def _refresh(rejected_token: str | None) -> str:
+    global _admin_keystone_token, _admin_keystone_token_issued_at, _previous_admin_keystone_token
     logger.info(f"Refreshing system keystone token at {datetime.now(timezone.utc)}")
 
-    global _admin_keystone_token
+    try:
+        refreshed: tuple[KeystoneToken, datetime] | None = await _refresh_through_shared_store(rejected_token)
+    except SQLAlchemyError as ex:
+        # 공유 저장소를 사용할 수 없더라도 keystone에서 직접 발급받아 서비스는 계속 동작하도록 한다.
+        logger.error(f"Failed to use shared system keystone token. Issue token without sharing. ex={ex}")
+        refreshed = None
+    if refreshed is None:
+        refreshed = (await _issue_system_keystone_token(), datetime.now(timezone.utc))
+    keystone_token, issued_at = refreshed
+
+    if _admin_keystone_token is not None and _admin_keystone_token.token != keystone_token.token:
+        _previous_admin_keystone_token = _admin_keystone_token.token
+    _admin_keystone_token = keystone_token
+    _admin_keystone_token_issued_at = issued_at
+
+    # 다른 worker가 발급한 token을 사용하는 경우 catalog를 따로 조회한다.
+    if get_service_catalog_token() != keystone_token.token:
+        await _load_service_catalog(keystone_token.token)
+    return keystone_token.token
+
+
+async def _load_service_catalog(keystone_token: str) -> None:
+    client: AsyncClient = get_async_client()
+    try:
+        response: Response = await client.get(
+            url=f"{envs.OPENSTACK_SERVER_URL}:{envs.KEYSTONE_PORT}/v3/auth/catalog",
+            headers={"X-Auth-Token": keystone_token},
+        )
+        response.raise_for_status()
+    except HTTPError as ex:
+        # 이전 catalog(또는 설정된 url)를 계속 사용한다.
+        logger.error(f"Failed to load service catalog. ex={ex}")
+        return
+    update_service_catalog(catalog=response.json().get("catalog", []), keystone_token=keystone_token)
+
+
+async def _refresh_through_shared_store(rejected_token: str | None) -> tuple[KeystoneToken, datetime] | None:
+    """
+    lease를 획득한 worker만 keystone에서 token을 발급받아 공유 저장소에 저장하고,
+    나머지 worker는 저장된 token이 갱신될 때까지 기다렸다가 해당 token을 사용한다.
+
+    :return: 사용할 token과 발급 시각. lease 기간 내에 갱신된 token을 얻지 못한 경우 None
+    """
+    repository: SystemKeystoneTokenRepository = SystemKeystoneTokenRepository()
+    deadline: float = time.monotonic() + envs.SYSTEM_KEYSTONE_TOKEN_LEASE_SECONDS
+
+    while True:
+        shared: tuple[KeystoneToken, datetime] | None = _get_usable_token(await repository.find(), rejected_token)
+        if shared is not None:
+            return shared
+
+        is_leader: bool = await repository.acquire_lease(
+            lease_owner=_LEASE_OWNER,
+            lease_seconds=envs.SYSTEM_KEYSTONE_TOKEN_LEASE_SECONDS,
+        )
+        if is_leader:
+            return await _refresh_as_leader(repository, rejected_token)
+
+        if time.monotonic() >= deadline:
+            logger.warning("Shared system keystone token was not refreshed within the lease. Issue token without sharing.")
+            return None
+        await asyncio.sleep(_LEASE_POLL_INTERVAL_SECONDS)
+
+
+async def _refresh_as_leader(
+    repository: SystemKeystoneTokenRepository,
+    rejected_token: str | None,
+) -> tuple[KeystoneToken, datetime]:
+    try:
+        # lease를 획득하기 직전에 다른 worker가 갱신을 마쳤을 수 있다.
+        shared: tuple[KeystoneToken, datetime] | None = _get_usable_token(await repository.find(), rejected_token)
+        if shared is not None:
+            await repository.release_lease(_LEASE_OWNER)
+            return shared
+
+        keystone_token: KeystoneToken = await _issue_system_keystone_token()
+        issued_at: datetime = datetime.now(timezone.utc)
+    except Exception:
+        await repository.release_lease(_LEASE_OWNER)
+        raise
+
+    is_saved: bool = await repository.save_token_and_release_lease(
+        lease_owner=_LEASE_OWNER,
+        token=keystone_token.token,
+        expires_at=keystone_token.expires_at,
+        issued_at=issued_at,
+    )
+    if not is_saved:
+        logger.warning("Lease for shared system keystone token expired before the refreshed token was saved.")
+    return keystone_token, issued_at
+
+
+def _get_usable_token(
+    system_keystone_token: SystemKeystoneToken | None,
+    rejected_token: str | None,
+) -> tuple[KeystoneToken, datetime] | None:
+    if system_keystone_token is None:
+        return None
+
+    keystone_token: KeystoneToken | None = system_keystone_token.to_keystone_token()
+    issued_at: datetime | None = system_keystone_token.get_issued_at()
+    if keystone_token is None or keystone_token.token == rejected_token or _needs_refresh(keystone_token, issued_at):
+        return None
+    return keystone_token, issued_at
+
+
+def _is_client_error(ex: HTTPError) -> bool:
+    # 인증 정보가 잘못된 경우 등 4xx 응답은 재시도해도 결과가 같다.
+    return isinstance(ex, HTTPStatusError) and ex.response.status_code < 500
+
+
+@backoff.on_exception(
+    backoff.expo,
+    HTTPError,
+    max_tries=lambda: envs.SYSTEM_KEYSTONE_TOKEN_MAX_REFRESH_TRIES,
+    max_value=30,
+    giveup=_is_client_error,
+)
+async def _issue_system_keystone_token() -> KeystoneToken:
     client: AsyncClient = get_async_client()
 
     response: Response = await client.post(
@@ -51,13 +276,12 @@ async def refresh_system_keystone_token() -> None:
             }
         }
     )
-    try:
-        response.raise_for_status()
-    except HTTPStatusError as ex:
-        logger.error(f"Failed to refresh system keystone token. ex={ex}")
-        return
+    response.raise_for_status()
 
-    _admin_keystone_token = KeystoneToken.from_token(
+    token: dict = response.json().get("token")
+    keystone_token: KeystoneToken = KeystoneToken.from_token(
         token=response.headers.get("x-subject-token"),
-        expires_at=response.json().get("token").get("expires_at")
+        expires_at=token.get("expires_at")
     )
+    update_service_catalog(catalog=token.get("catalog", []), keystone_token=keystone_token.token)
+    return keystone_token
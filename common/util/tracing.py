@@ -0,0 +1,261 @@
+import inspect
+import json
+import queue
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import Enum
+from functools import wraps
+from logging import getLogger, Logger
+from typing import Any, Callable, Iterator, TypeVar
+
+from common.util.envs import get_envs, Envs
+
+envs: Envs = get_envs()
+logger: Logger = getLogger(__name__)
+
+T = TypeVar("T")
+
+# W3C Trace Context의 `traceparent` header (ex. `00-{trace id}-{parent span id}-01`)
+TRACEPARENT_HEADER: str = "traceparent"
+
+
+class SpanKind(Enum):
+    # OTLP의 `Span.SpanKind` 값
+    INTERNAL = 1
+    SERVER = 2
+    CLIENT = 3
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: str | None
+    kind: SpanKind
+    sampled: bool
+    start_time_unix_nano: int = 0
+    end_time_unix_nano: int = 0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if self.sampled:
+            self.attributes[key] = value
+
+
+@dataclass(frozen=True)
+class TracingStats:
+    enabled: bool
+    exported: int
+    dropped: int
+
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+# tracing이 비활성화되어 있을 때 반환하는 span. attribute를 기록하지 않는다.
+_NON_RECORDING_SPAN: Span = Span(
+    name="", trace_id="0" * 32, span_id="0" * 16, parent_span_id=None, kind=SpanKind.INTERNAL, sampled=False
+)
+_export_queue: queue.SimpleQueue | None = None
+_writer: threading.Thread | None = None
+_exported: int = 0
+_dropped: int = 0
+
+
+def init_tracing() -> None:
+    """
+    `TRACE_EXPORT_PATH`가 설정되어 있다면 종료된 span을 한 줄에 하나씩 OTLP JSON 형식으로 파일에 기록하기 시작한다.
+    파일 쓰기는 별도 thread에서 실행한다.
+    """
+    global _export_queue, _writer
+    if _writer is not None:
+        raise RuntimeError("Tracing is already initialized")
+    if not envs.TRACE_EXPORT_PATH:
+        return
+
+    _export_queue = queue.SimpleQueue()
+    _writer = threading.Thread(
+        target=_write_spans, args=(envs.TRACE_EXPORT_PATH, _export_queue), name="trace-exporter", daemon=True
+    )
+    _writer.start()
+
+
+def close_tracing() -> None:
+    """
+    아직 기록되지 않은 span을 모두 기록한 뒤 exporter를 종료한다.
+    """
+    global _export_queue, _writer
+    if _writer is None:
+        return
+
+    _export_queue.put(None)
+    _writer.join()
+    _export_queue = None
+    _writer = None
+
+
+def is_tracing_enabled() -> bool:
+    return _export_queue is not None
+
+
+def get_current_span() -> Span | None:
+    return _current_span.get()
+
+
+@contextmanager
+def start_span(
+    name: str,
+    kind: SpanKind = SpanKind.INTERNAL,
+    attributes: dict[str, Any] | None = None,
+    traceparent: str | None = None,
+) -> Iterator[Span]:
+    """
+    block을 span으로 기록한다. block 안에서 시작한 span(이후 생성한 task, BackgroundTasks 포함)은 이 span의 자식이 된다.
+
+    :param name: span 이름
+    :param kind: span 종류
+    :param attributes: span attribute
+    :param traceparent: 부모가 없는 경우 이어서 기록할 외부 trace의 `traceparent` header 값
+    """
+    if not is_tracing_enabled():
+        yield _NON_RECORDING_SPAN
+        return
+
+    span: Span = _create_span(name=name, kind=kind, traceparent=traceparent)
+    if attributes:
+        for key, value in attributes.items():
+            span.set_attribute(key, value)
+
+    token = _current_span.set(span)
+    span.start_time_unix_nano = time.time_ns()
+    try:
+        yield span
+    except BaseException as ex:
+        span.error = f"{type(ex).__name__}: {ex}"
+        raise
+    finally:
+        span.end_time_unix_nano = time.time_ns()
+        _current_span.reset(token)
+        _export(span)
+
+
+def traced(func: Callable[..., T]) -> Callable[..., T]:
+    """
+    비동기 함수(`async def`)의 실행을 `{class 이름}.{함수 이름}` span으로 기록한다. tracing이 비활성화되어 있다면 함수를 그대로 실행한다.
+    """
+    if not inspect.iscoroutinefunction(func):
+        raise TypeError("traced decorator can only be used with async functions")
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        if not is_tracing_enabled():
+            return await func(*args, **kwargs)
+        with start_span(name=func.__qualname__):
+            return await func(*args, **kwargs)
+
+    return wrapper
+
+
+def trace_methods(cls: type[T]) -> type[T]:
+    """
+    class의 모든 public 비동기 method에 `@traced`를 적용한다. (async generator method는 제외한다.)
+    """
+    for name, member in list(vars(cls).items()):
+        if not name.startswith("_") and inspect.iscoroutinefunction(member):
+            setattr(cls, name, traced(member))
+    return cls
+
+
+def get_tracing_stats() -> TracingStats:
+    return TracingStats(enabled=is_tracing_enabled(), exported=_exported, dropped=_dropped)
+
+
+def _create_span(name: str, kind: SpanKind, traceparent: str | None) -> Span:
+    parent: Span | None = _current_span.get()
+    if parent is not None:
+        return Span(
+            name=name, trace_id=parent.trace_id, span_id=_random_id(64), parent_span_id=parent.span_id,
+            kind=kind, sampled=parent.sampled,
+        )
+
+    remote_parent: tuple[str, str, bool] | None = _parse_traceparent(traceparent)
+    if remote_parent is not None:
+        trace_id, parent_span_id, sampled = remote_parent
+    else:
+        trace_id, parent_span_id, sampled = _random_id(128), None, random.random() < envs.TRACE_SAMPLE_RATIO
+    return Span(
+        name=name, trace_id=trace_id, span_id=_random_id(64), parent_span_id=parent_span_id,
+        kind=kind, sampled=sampled,
+    )
+
+
+def _parse_traceparent(traceparent: str | None) -> tuple[str, str, bool] | None:
+    if not traceparent:
+        return None
+    parts: list[str] = traceparent.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    try:
+        return parts[1], parts[2], bool(int(parts[3], 16) & 0x01)
+    except ValueError:
+        return None
+
+
+def _random_id(bits: int) -> str:
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+def _export(span: Span) -> None:
+    global _exported, _dropped
+    export_queue: queue.SimpleQueue | None = _export_queue
+    if not span.sampled:
+        return
+    if export_queue is None:
+        # span 기록 중에 exporter가 종료된 경우
+        _dropped += 1
+        return
+    export_queue.put(span)
+    _exported += 1
+
+
+def _write_spans(path: str, export_queue: queue.SimpleQueue) -> None:
+    with open(path, "a", encoding="utf-8") as file:
+        while (span := export_queue.get()) is not None:
+            try:
+                file.write(json.dumps(_to_otlp(span), default=str))
+                file.write("\n")
+            except Exception as ex:
+                logger.warning("Failed to export span. name=%s, ex=%s", span.name, ex)
+            if export_queue.empty():
+                file.flush()
+
+
+def _to_otlp(span: Span) -> dict[str, Any]:
+    otlp_span: dict[str, Any] = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": span.kind.value,
+        "startTimeUnixNano": str(span.start_time_unix_nano),
+        "endTimeUnixNano": str(span.end_time_unix_nano),
+        "attributes": [{"key": key, "value": _to_otlp_value(value)} for key, value in span.attributes.items()],
+        # OTLP `Status.StatusCode` (1: OK, 2: ERROR)
+        "status": {"code": 2, "message": span.error} if span.error is not None else {"code": 1},
+    }
+    if span.parent_span_id is not None:
+        otlp_span["parentSpanId"] = span.parent_span_id
+    return otlp_span
+
+
+def _to_otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
@@ -15,6 +15,7 @@ CREATE TABLE `project`
     `openstack_id` CHAR(32)     NOT NULL,
     `domain_id`    BIGINT       NOT NULL,
     `name`         VARCHAR(255) NOT NULL,
+    `region`       VARCHAR(64),
     `created_at`   DATETIME     NOT NULL,
     `updated_at`   DATETIME     NOT NULL,
     `deleted_at`   DATETIME,
@@ -50,6 +51,47 @@ CREATE TABLE `project_user`
     FOREIGN KEY (`project_id`) REFERENCES `project` (`id`)
 );
 
+CREATE TABLE `refresh_token`
+(
+    `id`                       BIGINT        NOT NULL AUTO_INCREMENT,
+    `user_id`                  BIGINT        NOT NULL,
+    `project_id`               BIGINT        NOT NULL,
+    `family_id`                CHAR(32)      NOT NULL,
+    `token_hash`               CHAR(64)      NOT NULL,
+    `encrypted_keystone_token` VARCHAR(1024) NOT NULL,
+    `expires_at`               DATETIME      NOT NULL,
+    `revoked_at`               DATETIME,
+    `created_at`               DATETIME      NOT NULL,
+    `updated_at`               DATETIME      NOT NULL,
+    PRIMARY KEY (`id`),
+    UNIQUE (`token_hash`),
+    FOREIGN KEY (`user_id`) REFERENCES `user` (`id`),
+    FOREIGN KEY (`project_id`) REFERENCES `project` (`id`)
+);
+
+CREATE TABLE `project_user_invalidation`
+(
+    `id`         BIGINT   NOT NULL AUTO_INCREMENT,
+    `user_id`    BIGINT   NOT NULL,
+    `project_id` BIGINT,
+    `created_at` DATETIME NOT NULL,
+    `updated_at` DATETIME NOT NULL,
+    PRIMARY KEY (`id`)
+);
+
+CREATE TABLE `system_keystone_token`
+(
+    `id`               BIGINT        NOT NULL,
+    `token`            VARCHAR(1024),
+    `expires_at`       DATETIME,
+    `issued_at`        DATETIME,
+    `lease_owner`      VARCHAR(64),
+    `lease_expires_at` DATETIME,
+    `created_at`       DATETIME      NOT NULL,
+    `updated_at`       DATETIME      NOT NULL,
+    PRIMARY KEY (`id`)
+);
+
 CREATE TABLE `server`
 (
     `id`                  BIGINT       NOT NULL AUTO_INCREMENT,
@@ -0,0 +1,119 @@
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlencode
+
+from test.benchmark.recorder import LatencyRecorder
+
+
+@dataclass
+class BenchmarkResponse:
+    status_code: int
+    body: bytes
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+class BenchmarkClient:
+    """
+    ASGI app을 직접 호출하는 벤치마크용 client.
+
+    `httpx.ASGITransport`는 `BackgroundTasks`가 모두 끝날 때까지 응답을 반환하지 않기 때문에,
+    응답 body가 모두 전송된 시점을 응답 시간으로 기록하고 app 호출은 task로 계속 진행시킨다.
+    (uvicorn 등 실제 ASGI 서버에서 클라이언트가 체감하는 응답 시간과 동일하다.)
+
+    남아있는 background 작업은 `drain()`으로 기다린다.
+    """
+
+    def __init__(self, app, recorder: LatencyRecorder):
+        self.app = app
+        self.recorder = recorder
+        self._pending: set[asyncio.Task] = set()
+
+    async def request(
+        self,
+        endpoint: str,
+        method: str,
+        path: str,
+        json_body: Any = None,
+        params: dict[str, Any] | None = None,
+        access_token: str | None = None,
+        record: bool = True,
+    ) -> BenchmarkResponse:
+        """
+        :param endpoint: 통계 집계에 사용할 endpoint 이름 (ex. `"GET /servers/{server_id}"`)
+        :param record: False인 경우 응답 시간을 기록하지 않는다. (시나리오 준비 단계의 요청 등)
+        """
+        body: bytes = json.dumps(json_body).encode() if json_body is not None else b""
+        headers: list[tuple[bytes, bytes]] = [(b"host", b"benchmark")]
+        if json_body is not None:
+            headers.append((b"content-type", b"application/json"))
+        if access_token is not None:
+            headers.append((b"authorization", f"Bearer {access_token}".encode()))
+        scope: dict = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": urlencode(params or {}, doseq=True).encode(),
+            "root_path": "",
+            "headers": headers,
+            "client": ("127.0.0.1", 0),
+            "server": ("benchmark", 80),
+        }
+
+        status_code: int = 500
+        body_parts: list[bytes] = []
+        response_complete: asyncio.Event = asyncio.Event()
+        request_sent: bool = False
+
+        async def receive() -> dict:
+            nonlocal request_sent
+            if request_sent:
+                await response_complete.wait()
+                return {"type": "http.disconnect"}
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send(message: dict) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                body_parts.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    response_complete.set()
+
+        started_at: float = time.perf_counter()
+        task: asyncio.Task = asyncio.create_task(self._call_app(scope, receive, send, response_complete))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+        await response_complete.wait()
+        elapsed: float = time.perf_counter() - started_at
+
+        if record:
+            self.recorder.record(endpoint=endpoint, elapsed_seconds=elapsed, is_error=status_code >= 400)
+        return BenchmarkResponse(status_code=status_code, body=b"".join(body_parts))
+
+    async def drain(self) -> None:
+        """
+        응답 이후에도 실행 중인 background 작업(`BackgroundTasks`)이 모두 끝날 때까지 대기한다.
+        """
+        while self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+    async def _call_app(self, scope: dict, receive, send, response_complete: asyncio.Event) -> None:
+        try:
+            await self.app(scope, receive, send)
+        except Exception:
+            # 처리되지 않은 예외는 ServerErrorMiddleware가 500 응답을 보낸 뒤 다시 raise 한다.
+            # 응답은 이미 기록되었으므로 여기서는 무시한다.
+            pass
+        finally:
+            response_complete.set()
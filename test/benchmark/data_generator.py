@@ -0,0 +1,358 @@
+"""
+Repository 벤치마크용 대량 데이터 생성기.
+
+`test/util/factory.py`처럼 entity를 하나씩 만들지 않고, 테이블 별로 row를 모아 multi-row `INSERT` 또는
+MySQL `LOAD DATA LOCAL INFILE`로 한 번에 적재한다.
+
+프로젝트 별 서버 수는 Zipf 분포(`skew`)를 따른다. 실제 운영 환경처럼 소수의 큰 프로젝트가 대부분의 서버를 가지고,
+나머지 프로젝트는 서버가 거의 없다.
+"""
+import csv
+import enum
+import os
+import random
+import tempfile
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+from sqlalchemy import Table, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from common.domain.domain.entity import Domain
+from common.domain.floating_ip.entity import FloatingIp
+from common.domain.floating_ip.enum import FloatingIpStatus
+from common.domain.network_interface.entity import NetworkInterface
+from common.domain.project.entity import Project
+from common.domain.security_group.entity import SecurityGroup, NetworkInterfaceSecurityGroup
+from common.domain.server.entity import Server
+from common.domain.server.enum import ServerStatus
+from common.domain.volume.entity import Volume
+from common.domain.volume.enum import VolumeStatus
+from common.util.envs import Envs, get_envs
+
+envs: Envs = get_envs()
+
+# 부모 테이블이 먼저 오도록 정렬된 적재 순서. (foreign key 제약 조건을 끄지 않고 적재한다.)
+TABLES: tuple[Table, ...] = (
+    Project.__table__,
+    SecurityGroup.__table__,
+    Server.__table__,
+    NetworkInterface.__table__,
+    Volume.__table__,
+    NetworkInterfaceSecurityGroup.__table__,
+    FloatingIp.__table__,
+)
+
+INSERT = "insert"
+LOAD_DATA = "load-data"
+METHODS: tuple[str, ...] = (INSERT, LOAD_DATA)
+
+# SQLite(32,766)와 MySQL(65,535)의 statement 당 bind parameter 수 제한보다 작게 유지한다.
+_MAX_BIND_PARAMS_PER_STATEMENT: int = 30_000
+_MAX_ROWS_PER_STATEMENT: int = 1_000
+
+
+@dataclass
+class DatasetSpec:
+    """
+    :param skew: 프로젝트 별 서버 수 분포의 Zipf 지수. 0이면 모든 프로젝트가 같은 수의 서버를 가진다.
+    :param deleted_ratio: soft delete 된 서버(와 하위 자원)의 비율
+    :param data_volume_ratio: 루트 볼륨 외에 데이터 볼륨이 하나 더 연결된 서버의 비율
+    :param floating_ip_ratio: 플로팅 IP가 연결된 서버의 비율
+    :param max_security_groups_per_server: 서버의 NIC에 연결되는 최대 보안 그룹 수
+    """
+    num_of_projects: int = 1_000
+    num_of_servers: int = 1_000_000
+    skew: float = 1.1
+    security_groups_per_project: int = 5
+    deleted_ratio: float = 0.05
+    data_volume_ratio: float = 0.3
+    floating_ip_ratio: float = 0.5
+    max_security_groups_per_server: int = 2
+    seed: int = 0
+
+
+@dataclass
+class GeneratedDataset:
+    """
+    :param project_server_counts: project id 별 생성된 서버 수 (soft delete 된 서버 포함)
+    :param row_counts: 테이블 별 적재된 row 수
+    """
+    project_server_counts: dict[int, int] = field(default_factory=dict)
+    row_counts: dict[str, int] = field(default_factory=dict)
+
+
+def distribute_servers(num_of_servers: int, num_of_projects: int, skew: float) -> list[int]:
+    """
+    서버를 Zipf 분포로 프로젝트에 나누어 할당한다. 반환 값의 합은 항상 `num_of_servers`와 같다.
+
+    :return: 프로젝트 순서대로의 서버 수 (내림차순)
+    """
+    weights: list[float] = [1 / (rank ** skew) for rank in range(1, num_of_projects + 1)]
+    total_weight: float = sum(weights)
+    counts: list[int] = [int(num_of_servers * weight / total_weight) for weight in weights]
+    for index in range(num_of_servers - sum(counts)):
+        counts[index % num_of_projects] += 1
+    return counts
+
+
+class _MultiRowInsertWriter:
+    """
+    `INSERT INTO ... VALUES (...), (...), ...` statement로 적재한다.
+
+    `insert(table).values(rows)`는 row 수만큼 bind parameter를 매번 compile 하므로, statement 문자열을
+    row 수 별로 한 번만 만들고 column type의 bind processor로 변환한 값을 driver에 직접 전달한다.
+    """
+
+    def __init__(self, table: Table):
+        self.columns: list[str] = [column.name for column in table.columns]
+        self.rows_per_statement: int = max(
+            min(_MAX_ROWS_PER_STATEMENT, _MAX_BIND_PARAMS_PER_STATEMENT // len(self.columns)), 1
+        )
+        self._statements: dict[int, str] = {}
+
+    async def write(self, conn: AsyncConnection, table: Table, rows: list[dict[str, Any]]) -> None:
+        processors: list[Callable[[Any], Any] | None] = [
+            table.c[column].type.bind_processor(conn.dialect) for column in self.columns
+        ]
+        for start in range(0, len(rows), self.rows_per_statement):
+            chunk: list[dict[str, Any]] = rows[start:start + self.rows_per_statement]
+            params: list[Any] = [
+                processor(row[column]) if processor is not None else row[column]
+                for row in chunk
+                for column, processor in zip(self.columns, processors)
+            ]
+            await conn.exec_driver_sql(self._statement(conn, table, len(chunk)), tuple(params))
+
+    def _statement(self, conn: AsyncConnection, table: Table, num_of_rows: int) -> str:
+        if num_of_rows not in self._statements:
+            quote: Callable[[str], str] = conn.dialect.identifier_preparer.quote
+            placeholder: str = "?" if conn.dialect.paramstyle == "qmark" else "%s"
+            values: str = f"({', '.join([placeholder] * len(self.columns))})"
+            self._statements[num_of_rows] = (
+                f"INSERT INTO {quote(table.name)} ({', '.join(quote(column) for column in self.columns)}) "
+                f"VALUES {', '.join([values] * num_of_rows)}"
+            )
+        return self._statements[num_of_rows]
+
+
+class _LoadDataWriter:
+    """
+    Row를 임시 CSV 파일로 저장한 뒤 `LOAD DATA LOCAL INFILE`로 적재한다. (MySQL 전용)
+
+    Engine은 `connect_args={"local_infile": True}`로 생성되어야 하며, MySQL 서버에 `local_infile=ON`이 설정되어 있어야 한다.
+    """
+
+    def __init__(self, table: Table):
+        self.columns: list[str] = [column.name for column in table.columns]
+
+    async def write(self, conn: AsyncConnection, table: Table, rows: list[dict[str, Any]]) -> None:
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", newline="", delete=False) as file:
+            writer = csv.writer(file, lineterminator="\n", escapechar="\\", doublequote=False)
+            writer.writerows([[_to_csv_value(row[column]) for column in self.columns] for row in rows])
+        try:
+            path: str = file.name.replace("\\", "/")
+            await conn.exec_driver_sql(
+                f"LOAD DATA LOCAL INFILE '{path}' INTO TABLE `{table.name}` "
+                "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '\\\\' "
+                "LINES TERMINATED BY '\\n' "
+                f"({', '.join(f'`{column}`' for column in self.columns)})"
+            )
+        finally:
+            os.remove(file.name)
+
+
+def _to_csv_value(value: Any) -> Any:
+    if value is None:
+        return "\\N"
+    if isinstance(value, enum.Enum):
+        # `Enum(native_enum=False)` column에는 member name이 저장된다.
+        return value.name
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S.%f")
+    return value
+
+
+class DatasetGenerator:
+    """
+    `DatasetSpec`에 맞는 프로젝트, 보안 그룹, 서버, NIC, 볼륨, 플로팅 IP를 생성하여 적재한다.
+
+    Row id는 테이블의 현재 최대 id 이후로 직접 부여하므로, 부모 row를 적재한 뒤 id를 조회하는 왕복 없이
+    하위 자원의 foreign key를 채울 수 있다. 메모리 사용량을 제한하기 위해 어느 한 테이블의 row가
+    `chunk_size`만큼 쌓이면 모든 테이블의 row를 부모 테이블부터 순서대로 적재한다.
+    """
+
+    def __init__(self, spec: DatasetSpec, method: str = INSERT, chunk_size: int | None = None):
+        if method not in METHODS:
+            raise ValueError(f"Unknown load method: {method}")
+        self.spec = spec
+        self.method = method
+        self.chunk_size: int = chunk_size or (100_000 if method == LOAD_DATA else 10_000)
+        self._random: random.Random = random.Random(spec.seed)
+        self._now: datetime = datetime.now(timezone.utc).replace(tzinfo=None)
+        self._buffers: dict[str, list[dict[str, Any]]] = {table.name: [] for table in TABLES}
+        self._writers: dict[str, _MultiRowInsertWriter | _LoadDataWriter] = {
+            table.name: (_LoadDataWriter if method == LOAD_DATA else _MultiRowInsertWriter)(table)
+            for table in TABLES
+        }
+        self._next_ids: dict[str, int] = {}
+        self._dataset: GeneratedDataset = GeneratedDataset(row_counts={table.name: 0 for table in TABLES})
+
+    async def generate(self, engine: AsyncEngine) -> GeneratedDataset:
+        if self.method == LOAD_DATA and engine.dialect.name != "mysql":
+            raise ValueError("LOAD DATA is only supported on MySQL.")
+
+        server_counts: list[int] = distribute_servers(
+            num_of_servers=self.spec.num_of_servers,
+            num_of_projects=self.spec.num_of_projects,
+            skew=self.spec.skew,
+        )
+        async with engine.begin() as conn:
+            await self._prepare(conn)
+            for num_of_servers in server_counts:
+                project_id, security_group_ids = self._add_project(num_of_servers)
+                for index in range(num_of_servers):
+                    self._add_server(project_id, index, security_group_ids)
+                    if max(map(len, self._buffers.values())) >= self.chunk_size:
+                        await self._flush(conn)
+            await self._flush(conn)
+        return self._dataset
+
+    async def _prepare(self, conn: AsyncConnection) -> None:
+        for table in TABLES:
+            max_id: int = await conn.scalar(select(func.coalesce(func.max(table.c.id), 0)))
+            self._next_ids[table.name] = max_id + 1
+
+        domain_exists: bool = await conn.scalar(
+            select(func.count()).select_from(Domain.__table__).where(Domain.__table__.c.id == envs.DEFAULT_DOMAIN_ID)
+        ) > 0
+        if not domain_exists:
+            await conn.execute(
+                insert(Domain.__table__).values(
+                    id=envs.DEFAULT_DOMAIN_ID,
+                    openstack_id=envs.DEFAULT_DOMAIN_OPENSTACK_ID,
+                    name="benchmark",
+                    created_at=self._now,
+                    updated_at=self._now,
+                )
+            )
+
+    async def _flush(self, conn: AsyncConnection) -> None:
+        for table in TABLES:
+            rows: list[dict[str, Any]] = self._buffers[table.name]
+            if rows:
+                await self._writers[table.name].write(conn, table, rows)
+                self._dataset.row_counts[table.name] += len(rows)
+                self._buffers[table.name] = []
+
+    def _add_row(self, table: Table, **values: Any) -> int:
+        row_id: int = self._next_ids[table.name]
+        self._next_ids[table.name] += 1
+        self._buffers[table.name].append({"id": row_id, **values})
+        return row_id
+
+    def _timestamps(self, deleted: bool = False) -> dict[str, datetime | None]:
+        created_at: datetime = self._now - timedelta(seconds=self._random.randrange(365 * 24 * 3600))
+        return {
+            "created_at": created_at,
+            "updated_at": created_at,
+            "deleted_at": created_at + timedelta(days=1) if deleted else None,
+        }
+
+    def _add_project(self, num_of_servers: int) -> tuple[int, list[int]]:
+        spec: DatasetSpec = self.spec
+        project_id: int = self._add_row(
+            Project.__table__,
+            openstack_id=uuid.uuid4().hex,
+            domain_id=envs.DEFAULT_DOMAIN_ID,
+            name=f"project_{self._next_ids[Project.__table__.name]}",
+            # 기본 region(`OPENSTACK_REGION_NAME`)을 사용한다.
+            region=None,
+            version=0,
+            **self._timestamps(),
+        )
+        self._dataset.project_server_counts[project_id] = num_of_servers
+
+        security_group_ids: list[int] = [
+            self._add_row(
+                SecurityGroup.__table__,
+                openstack_id=str(uuid.uuid4()),
+                project_id=project_id,
+                name=f"sg_{index}",
+                description="",
+                version=0,
+                **self._timestamps(),
+            )
+            for index in range(spec.security_groups_per_project)
+        ]
+        return project_id, security_group_ids
+
+    def _add_server(self, project_id: int, index: int, security_group_ids: list[int]) -> None:
+        spec: DatasetSpec = self.spec
+        deleted: bool = self._random.random() < spec.deleted_ratio
+        timestamps: dict[str, datetime | None] = self._timestamps(deleted=deleted)
+
+        server_id: int = self._add_row(
+            Server.__table__,
+            openstack_id=str(uuid.uuid4()),
+            project_id=project_id,
+            flavor_openstack_id=str(uuid.uuid4()),
+            name=f"server_{index}",
+            description="",
+            status=ServerStatus.DELETED if deleted else ServerStatus.ACTIVE,
+            **timestamps,
+        )
+        network_interface_id: int = self._add_row(
+            NetworkInterface.__table__,
+            openstack_id=str(uuid.uuid4()),
+            project_id=project_id,
+            server_id=server_id,
+            fixed_ip_address=f"10.{index // 65536 % 256}.{index // 256 % 256}.{index % 256}",
+            **timestamps,
+        )
+
+        num_of_volumes: int = 2 if self._random.random() < spec.data_volume_ratio else 1
+        for volume_index in range(num_of_volumes):
+            is_root_volume: bool = volume_index == 0
+            self._add_row(
+                Volume.__table__,
+                openstack_id=str(uuid.uuid4()),
+                project_id=project_id,
+                server_id=server_id,
+                volume_type_openstack_id=str(uuid.uuid4()),
+                image_openstack_id=str(uuid.uuid4()) if is_root_volume else None,
+                name=f"volume_{index}_{volume_index}",
+                description="",
+                status=VolumeStatus.DELETING if deleted else VolumeStatus.IN_USE,
+                size=self._random.choice((10, 20, 50, 100)),
+                is_root_volume=is_root_volume,
+                **timestamps,
+            )
+
+        if security_group_ids:
+            num_of_security_groups: int = self._random.randint(
+                1, min(spec.max_security_groups_per_server, len(security_group_ids))
+            )
+            for security_group_id in self._random.sample(security_group_ids, num_of_security_groups):
+                self._add_row(
+                    NetworkInterfaceSecurityGroup.__table__,
+                    network_interface_id=network_interface_id,
+                    security_group_id=security_group_id,
+                    created_at=timestamps["created_at"],
+                    updated_at=timestamps["updated_at"],
+                )
+
+        if not deleted and self._random.random() < spec.floating_ip_ratio:
+            self._add_row(
+                FloatingIp.__table__,
+                openstack_id=str(uuid.uuid4()),
+                project_id=project_id,
+                network_interface_id=network_interface_id,
+                status=FloatingIpStatus.ACTIVE,
+                address=f"172.{16 + index // 65536 % 16}.{index // 256 % 256}.{index % 256}",
+                **timestamps,
+            )
@@ -0,0 +1,318 @@
+import asyncio
+import json
+import re
+import uuid
+from datetime import datetime, timezone, timedelta
+from typing import Any, Callable
+
+from httpx import MockTransport, Request, Response
+
+Handler = Callable[[Request, re.Match], Response]
+
+
+class OpenStackSimulator:
+    """
+    벤치마크용 in-memory OpenStack(Keystone, Nova, Neutron, Cinder) API simulator.
+
+    `httpx.MockTransport`로 동작하며, API 서버의 OpenStack client가 호출하는 endpoint만 흉내낸다.
+    서버, 볼륨 등의 자원은 생성 즉시 완료(ACTIVE, available) 상태가 된다.
+
+    :param latency_seconds: 모든 응답에 추가할 지연 시간. 실제 OpenStack API의 네트워크 지연을 흉내낼 때 사용한다.
+    """
+
+    TOKEN_DURATION: timedelta = timedelta(hours=1)
+
+    def __init__(self, latency_seconds: float = 0.0):
+        self.latency_seconds = latency_seconds
+        self.servers: dict[str, dict] = {}
+        self.volumes: dict[str, dict] = {}
+        self.ports: dict[str, dict] = {}
+        self.security_groups: dict[str, dict] = {}
+        self.security_group_rules: dict[str, dict] = {}
+        self.floating_ips: dict[str, dict] = {}
+        self.tokens: dict[str, str | None] = {}
+        self.request_count: int = 0
+        self._routes: list[tuple[str, re.Pattern, Handler]] = [
+            ("POST", re.compile(r"^/v3/auth/tokens$"), self._issue_token),
+            ("POST", re.compile(r"^/v3/users$"), self._create_user),
+            ("DELETE", re.compile(r"^/v3/users/[^/]+$"), self._no_content),
+            ("PATCH", re.compile(r"^/v3/projects/[^/]+$"), self._no_content),
+            ("PUT", re.compile(r"^/v3/projects/[^/]+/users/[^/]+/roles/[^/]+$"), self._no_content),
+            ("DELETE", re.compile(r"^/v3/projects/[^/]+/users/[^/]+/roles/[^/]+$"), self._no_content),
+            ("POST", re.compile(r"^/v2\.1/servers$"), self._create_server),
+            ("GET", re.compile(r"^/v2\.1/servers/(?P<id>[^/]+)$"), self._get_server),
+            ("DELETE", re.compile(r"^/v2\.1/servers/(?P<id>[^/]+)$"), self._delete_server),
+            ("POST", re.compile(r"^/v2\.1/servers/(?P<id>[^/]+)/action$"), self._server_action),
+            ("POST", re.compile(r"^/v2\.1/servers/[^/]+/os-volume_attachments$"), self._no_content),
+            ("DELETE", re.compile(r"^/v2\.1/servers/[^/]+/os-volume_attachments/[^/]+$"), self._no_content),
+            ("POST", re.compile(r"^/v2\.0/ports$"), self._create_port),
+            ("DELETE", re.compile(r"^/v2\.0/ports/(?P<id>[^/]+)$"), self._delete_port),
+            ("POST", re.compile(r"^/v2\.0/security-groups$"), self._create_security_group),
+            ("PUT", re.compile(r"^/v2\.0/security-groups/(?P<id>[^/]+)$"), self._update_security_group),
+            ("DELETE", re.compile(r"^/v2\.0/security-groups/(?P<id>[^/]+)$"), self._delete_security_group),
+            ("GET", re.compile(r"^/v2\.0/security-group-rules$"), self._find_security_group_rules),
+            ("POST", re.compile(r"^/v2\.0/security-group-rules$"), self._create_security_group_rules),
+            ("DELETE", re.compile(r"^/v2\.0/security-group-rules/(?P<id>[^/]+)$"), self._delete_security_group_rule),
+            ("POST", re.compile(r"^/v2\.0/floatingips$"), self._create_floating_ip),
+            ("PUT", re.compile(r"^/v2\.0/floatingips/(?P<id>[^/]+)$"), self._update_floating_ip),
+            ("DELETE", re.compile(r"^/v2\.0/floatingips/(?P<id>[^/]+)$"), self._delete_floating_ip),
+            ("GET", re.compile(r"^/v3/(?P<project>[^/]+)/volumes/(?P<id>[^/]+)$"), self._get_volume),
+            ("POST", re.compile(r"^/v3/(?P<project>[^/]+)/volumes$"), self._create_volume),
+            ("POST", re.compile(r"^/v3/[^/]+/volumes/(?P<id>[^/]+)/action$"), self._volume_action),
+            ("DELETE", re.compile(r"^/v3/[^/]+/volumes/(?P<id>[^/]+)$"), self._delete_volume),
+        ]
+
+    @property
+    def transport(self) -> MockTransport:
+        return MockTransport(self.handle)
+
+    def add_security_group(self, project_openstack_id: str, num_of_rules: int = 2) -> str:
+        """
+        미리 생성된 보안 그룹을 simulator에 등록한다.
+
+        :return: 등록된 보안 그룹의 openstack id
+        """
+        security_group_id: str = str(uuid.uuid4())
+        self.security_groups[security_group_id] = {
+            "id": security_group_id,
+            "project_id": project_openstack_id,
+            "name": f"sg_{security_group_id}",
+            "description": "",
+        }
+        for port in range(num_of_rules):
+            self._add_rule(
+                security_group_id=security_group_id,
+                project_openstack_id=project_openstack_id,
+                rule={
+                    "protocol": "tcp",
+                    "ethertype": "IPv4",
+                    "direction": "ingress",
+                    "port_range_min": 1000 + port,
+                    "port_range_max": 1000 + port,
+                    "remote_ip_prefix": "0.0.0.0/0",
+                },
+            )
+        return security_group_id
+
+    async def handle(self, request: Request) -> Response:
+        self.request_count += 1
+        if self.latency_seconds > 0:
+            await asyncio.sleep(self.latency_seconds)
+
+        for method, pattern, handler in self._routes:
+            if request.method != method:
+                continue
+            match: re.Match | None = pattern.match(request.url.path)
+            if match is not None:
+                return handler(request, match)
+        return Response(404, json={"NotFound": {"message": f"{request.method} {request.url.path}"}})
+
+    @staticmethod
+    def _body(request: Request) -> dict[str, Any]:
+        return json.loads(request.content) if request.content else {}
+
+    @staticmethod
+    def _no_content(request: Request, match: re.Match) -> Response:
+        return Response(204)
+
+    def _project_of(self, request: Request) -> str | None:
+        return self.tokens.get(request.headers.get("X-Auth-Token"))
+
+    def _issue_token(self, request: Request, match: re.Match) -> Response:
+        token: str = uuid.uuid4().hex
+        scope: dict = self._body(request)["auth"].get("scope", {})
+        self.tokens[token] = scope.get("project", {}).get("id")
+        expires_at: datetime = datetime.now(timezone.utc) + self.TOKEN_DURATION
+        return Response(
+            201,
+            headers={"x-subject-token": token},
+            json={"token": {"expires_at": expires_at.strftime("%Y-%m-%dT%H:%M:%S.%fZ")}},
+        )
+
+    @staticmethod
+    def _create_user(request: Request, match: re.Match) -> Response:
+        return Response(201, json={"user": {"id": uuid.uuid4().hex}})
+
+    def _create_server(self, request: Request, match: re.Match) -> Response:
+        server_id: str = str(uuid.uuid4())
+        root_volume_id: str = str(uuid.uuid4())
+        self.servers[server_id] = {
+            "id": server_id,
+            "tenant_id": self._project_of(request),
+            "status": "ACTIVE",
+            "os-extended-volumes:volumes_attached": [{"id": root_volume_id}],
+        }
+        self.volumes[root_volume_id] = {
+            "id": root_volume_id,
+            "volume_type": "__DEFAULT__",
+            "status": "in-use",
+            "size": self._body(request)["server"]["block_device_mapping_v2"][0]["volume_size"],
+        }
+        return Response(202, json={"server": {"id": server_id}})
+
+    def _get_server(self, request: Request, match: re.Match) -> Response:
+        server: dict | None = self.servers.get(match["id"])
+        if server is None:
+            return Response(404, json={"itemNotFound": {"message": "server not found"}})
+        return Response(200, json={"server": server})
+
+    def _delete_server(self, request: Request, match: re.Match) -> Response:
+        self.servers.pop(match["id"], None)
+        return Response(204)
+
+    def _server_action(self, request: Request, match: re.Match) -> Response:
+        server: dict | None = self.servers.get(match["id"])
+        if server is None:
+            return Response(404, json={"itemNotFound": {"message": "server not found"}})
+        action: dict = self._body(request)
+        if "os-start" in action:
+            server["status"] = "ACTIVE"
+        elif "os-stop" in action:
+            server["status"] = "SHUTOFF"
+        elif "os-getVNCConsole" in action:
+            return Response(200, json={"console": {"url": f"http://vnc.local/{match['id']}"}})
+        return Response(202)
+
+    def _create_port(self, request: Request, match: re.Match) -> Response:
+        port_id: str = str(uuid.uuid4())
+        port_data: dict = self._body(request)["port"]
+        port: dict = {
+            "id": port_id,
+            "name": "",
+            "network_id": port_data["network_id"],
+            "project_id": self._project_of(request),
+            "status": "DOWN",
+            "fixed_ips": [{"ip_address": f"10.{len(self.ports) // 65536 % 256}."
+                                         f"{len(self.ports) // 256 % 256}.{len(self.ports) % 256}"}],
+            "security_groups": port_data.get("security_groups", []),
+        }
+        self.ports[port_id] = port
+        return Response(201, json={"port": port})
+
+    def _delete_port(self, request: Request, match: re.Match) -> Response:
+        self.ports.pop(match["id"], None)
+        return Response(204)
+
+    def _add_rule(self, security_group_id: str, project_openstack_id: str | None, rule: dict) -> dict:
+        rule_id: str = str(uuid.uuid4())
+        created: dict = {
+            "id": rule_id,
+            "security_group_id": security_group_id,
+            "project_id": project_openstack_id,
+            "protocol": rule.get("protocol"),
+            "ethertype": rule.get("ethertype", "IPv4"),
+            "direction": rule["direction"],
+            "port_range_min": rule.get("port_range_min"),
+            "port_range_max": rule.get("port_range_max"),
+            "remote_ip_prefix": rule.get("remote_ip_prefix"),
+        }
+        self.security_group_rules[rule_id] = created
+        return created
+
+    def _create_security_group(self, request: Request, match: re.Match) -> Response:
+        security_group_id: str = str(uuid.uuid4())
+        data: dict = self._body(request)["security_group"]
+        security_group: dict = {
+            "id": security_group_id,
+            "project_id": self._project_of(request),
+            "name": data["name"],
+            "description": data.get("description"),
+        }
+        self.security_groups[security_group_id] = security_group
+        egress_rule: dict = self._add_rule(
+            security_group_id=security_group_id,
+            project_openstack_id=security_group["project_id"],
+            rule={"direction": "egress", "ethertype": "IPv4"},
+        )
+        return Response(201, json={"security_group": {**security_group, "security_group_rules": [egress_rule]}})
+
+    def _update_security_group(self, request: Request, match: re.Match) -> Response:
+        security_group: dict | None = self.security_groups.get(match["id"])
+        if security_group is None:
+            return Response(404, json={"NeutronError": {"message": "security group not found"}})
+        security_group.update(self._body(request)["security_group"])
+        return Response(200, json={"security_group": security_group})
+
+    def _delete_security_group(self, request: Request, match: re.Match) -> Response:
+        self.security_groups.pop(match["id"], None)
+        return Response(204)
+
+    def _find_security_group_rules(self, request: Request, match: re.Match) -> Response:
+        project_id: str | None = request.url.params.get("project_id")
+        security_group_id: str | None = request.url.params.get("security_group_id")
+        rules: list[dict] = [
+            rule for rule in self.security_group_rules.values()
+            if (project_id is None or rule["project_id"] == project_id)
+            and (security_group_id is None or rule["security_group_id"] == security_group_id)
+        ]
+        return Response(200, json={"security_group_rules": rules})
+
+    def _create_security_group_rules(self, request: Request, match: re.Match) -> Response:
+        created: list[dict] = []
+        for rule in self._body(request)["security_group_rules"]:
+            security_group: dict = self.security_groups.get(rule["security_group_id"], {})
+            created.append(
+                self._add_rule(
+                    security_group_id=rule["security_group_id"],
+                    project_openstack_id=security_group.get("project_id"),
+                    rule=rule,
+                )
+            )
+        return Response(201, json={"security_group_rules": created})
+
+    def _delete_security_group_rule(self, request: Request, match: re.Match) -> Response:
+        if self.security_group_rules.pop(match["id"], None) is None:
+            return Response(404, json={"NeutronError": {"message": "security group rule not found"}})
+        return Response(204)
+
+    def _create_floating_ip(self, request: Request, match: re.Match) -> Response:
+        floating_ip_id: str = str(uuid.uuid4())
+        floating_ip: dict = {
+            "id": floating_ip_id,
+            "status": "DOWN",
+            "floating_ip_address": f"172.24.{len(self.floating_ips) // 256 % 256}.{len(self.floating_ips) % 256}",
+            "port_id": None,
+        }
+        self.floating_ips[floating_ip_id] = floating_ip
+        return Response(201, json={"floatingip": floating_ip})
+
+    def _update_floating_ip(self, request: Request, match: re.Match) -> Response:
+        floating_ip: dict | None = self.floating_ips.get(match["id"])
+        if floating_ip is None:
+            return Response(404, json={"NeutronError": {"message": "floating ip not found"}})
+        floating_ip.update(self._body(request)["floatingip"])
+        return Response(200, json={"floatingip": floating_ip})
+
+    def _delete_floating_ip(self, request: Request, match: re.Match) -> Response:
+        self.floating_ips.pop(match["id"], None)
+        return Response(204)
+
+    def _get_volume(self, request: Request, match: re.Match) -> Response:
+        volume: dict | None = self.volumes.get(match["id"])
+        if volume is None:
+            return Response(404, json={"itemNotFound": {"message": "volume not found"}})
+        return Response(200, json={"volume": volume})
+
+    def _create_volume(self, request: Request, match: re.Match) -> Response:
+        volume_id: str = str(uuid.uuid4())
+        data: dict = self._body(request)["volume"]
+        self.volumes[volume_id] = {
+            "id": volume_id,
+            "volume_type": data.get("volume_type"),
+            "status": "available",
+            "size": data["size"],
+        }
+        return Response(202, json={"volume": {"id": volume_id}})
+
+    def _volume_action(self, request: Request, match: re.Match) -> Response:
+        volume: dict | None = self.volumes.get(match["id"])
+        if volume is None:
+            return Response(404, json={"itemNotFound": {"message": "volume not found"}})
+        action: dict = self._body(request)
+        if "os-extend" in action:
+            volume["size"] = action["os-extend"]["new_size"]
+        return Response(202)
+
+    def _delete_volume(self, request: Request, match: re.Match) -> Response:
+        self.volumes.pop(match["id"], None)
+        return Response(202)
@@ -0,0 +1,85 @@
+import math
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """
+    Nearest-rank 방식으로 백분위 값을 계산한다.
+
+    :param sorted_values: 오름차순으로 정렬된 값 목록
+    :param q: 0 ~ 100 사이의 백분위
+    """
+    if not sorted_values:
+        return 0.0
+    rank: int = max(math.ceil(q / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+@dataclass
+class EndpointStats:
+    count: int
+    errors: int
+    throughput_rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "throughput_rps": round(self.throughput_rps, 2),
+            "p50_ms": round(self.p50_ms, 3),
+            "p95_ms": round(self.p95_ms, 3),
+            "p99_ms": round(self.p99_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+@dataclass
+class LatencyRecorder:
+    """
+    Endpoint(`"{METHOD} {route template}"`) 별 응답 시간을 기록한다.
+    """
+    latencies: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    errors: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    started_at: float = field(default_factory=time.perf_counter)
+    finished_at: float | None = None
+
+    def record(self, endpoint: str, elapsed_seconds: float, is_error: bool) -> None:
+        self.latencies[endpoint].append(elapsed_seconds)
+        if is_error:
+            self.errors[endpoint] += 1
+
+    def finish(self) -> None:
+        self.finished_at = time.perf_counter()
+
+    @property
+    def duration_seconds(self) -> float:
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    def summarize(self) -> dict:
+        duration: float = self.duration_seconds
+        endpoints: dict[str, dict] = {}
+        for endpoint, values in sorted(self.latencies.items()):
+            sorted_ms: list[float] = sorted(value * 1000 for value in values)
+            endpoints[endpoint] = EndpointStats(
+                count=len(sorted_ms),
+                errors=self.errors.get(endpoint, 0),
+                throughput_rps=len(sorted_ms) / duration if duration > 0 else 0.0,
+                p50_ms=percentile(sorted_ms, 50),
+                p95_ms=percentile(sorted_ms, 95),
+                p99_ms=percentile(sorted_ms, 99),
+                max_ms=sorted_ms[-1],
+            ).to_dict()
+
+        num_of_requests: int = sum(len(values) for values in self.latencies.values())
+        return {
+            "duration_seconds": round(duration, 3),
+            "requests": num_of_requests,
+            "throughput_rps": round(num_of_requests / duration, 2) if duration > 0 else 0.0,
+            "endpoints": endpoints,
+        }
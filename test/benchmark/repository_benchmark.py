@@ -0,0 +1,137 @@
+"""
+운영 규모의 데이터에서 repository 목록 조회 query의 응답 시간을 측정한다.
+
+`data_generator`로 적재한 DB에서 서버 수 기준 가장 큰 / 중간 / 가장 작은 프로젝트를 골라 각 목록 조회를 반복 실행한다.
+결과는 `LatencyRecorder` 형식이므로 `python -m test.benchmark.run compare`로 baseline과 비교할 수 있다.
+"""
+import sys
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from sqlalchemy import Row, func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from common.domain.enum import SortOrder
+from common.domain.floating_ip.enum import FloatingIpSortOption
+from common.domain.security_group.enum import SecurityGroupSortOption
+from common.domain.server.entity import Server
+from common.domain.server.enum import ServerSortOption
+from common.domain.volume.enum import VolumeSortOption
+from common.infrastructure import database
+from common.infrastructure.floating_ip.repository import FloatingIpRepository
+from common.infrastructure.security_group.repository import SecurityGroupRepository
+from common.infrastructure.server.repository import ServerRepository
+from common.infrastructure.volume.repository import VolumeRepository
+from test.benchmark.recorder import LatencyRecorder
+
+
+@dataclass
+class TargetProject:
+    label: str
+    project_id: int
+    num_of_servers: int
+
+
+def _list_queries(project_id: int) -> dict[str, Callable[[], Awaitable[list]]]:
+    server_repository: ServerRepository = ServerRepository()
+    volume_repository: VolumeRepository = VolumeRepository()
+    security_group_repository: SecurityGroupRepository = SecurityGroupRepository()
+    floating_ip_repository: FloatingIpRepository = FloatingIpRepository()
+
+    def find_servers(with_relations: bool) -> Callable[[], Awaitable[list]]:
+        return lambda: server_repository.find_all_by_project_id(
+            id_=None,
+            ids_contain=None,
+            ids_exclude=None,
+            name_eq=None,
+            name_like=None,
+            sort_by=ServerSortOption.CREATED_AT,
+            order=SortOrder.ASC,
+            project_id=project_id,
+            with_relations=with_relations,
+        )
+
+    return {
+        "ServerRepository.find_all_by_project_id": find_servers(with_relations=False),
+        "ServerRepository.find_all_by_project_id(with_relations)": find_servers(with_relations=True),
+        "VolumeRepository.find_all_by_project(with_relations)": lambda: volume_repository.find_all_by_project(
+            project_id=project_id,
+            sort_by=VolumeSortOption.CREATED_AT,
+            sort_order=SortOrder.ASC,
+            with_relations=True,
+        ),
+        "SecurityGroupRepository.find_all_by_project_id(with_relations)":
+            lambda: security_group_repository.find_all_by_project_id(
+                project_id=project_id,
+                sort_by=SecurityGroupSortOption.CREATED_AT,
+                order=SortOrder.ASC,
+                with_relations=True,
+            ),
+        "FloatingIpRepository.find_all_by_project_id(with_relations)":
+            lambda: floating_ip_repository.find_all_by_project_id(
+                project_id=project_id,
+                sort_by=FloatingIpSortOption.CREATED_AT,
+                order=SortOrder.ASC,
+                with_relations=True,
+            ),
+    }
+
+
+async def find_target_projects(session_maker: sessionmaker[AsyncSession]) -> list[TargetProject]:
+    """
+    서버 수 기준으로 가장 큰(largest), 중간(median), 가장 작은(smallest) 프로젝트를 찾는다.
+    """
+    async with session_maker() as session:
+        rows: list[Row] = (
+            await session.execute(
+                select(Server.project_id, func.count())
+                .where(Server.deleted_at.is_(None))
+                .group_by(Server.project_id)
+                .order_by(func.count().desc(), Server.project_id)
+            )
+        ).all()
+    if not rows:
+        raise RuntimeError("No server found. Seed the database first. (python -m test.benchmark.run seed ...)")
+
+    targets: list[TargetProject] = []
+    for label, row in (("largest", rows[0]), ("median", rows[len(rows) // 2]), ("smallest", rows[-1])):
+        targets.append(TargetProject(label=label, project_id=row[0], num_of_servers=row[1]))
+    return targets
+
+
+async def run_repository_benchmark(engine: AsyncEngine, repeat: int) -> dict:
+    """
+    :param repeat: 프로젝트 / query 별 반복 실행 횟수 (첫 실행은 warm-up으로 기록하지 않는다.)
+    :return: `{"targets": [...], "scenarios": {"<label> project": <LatencyRecorder 요약>}}`
+    """
+    session_maker: sessionmaker[AsyncSession] = sessionmaker(
+        bind=engine, class_=AsyncSession, autocommit=False, autoflush=False, expire_on_commit=False
+    )
+    database.session_maker = session_maker
+
+    targets: list[TargetProject] = await find_target_projects(session_maker)
+    results: dict[str, dict] = {}
+    for target in targets:
+        print(
+            f"[benchmark] project {target.project_id} ({target.label}, {target.num_of_servers} servers) ...",
+            file=sys.stderr,
+        )
+        recorder: LatencyRecorder = LatencyRecorder()
+        for name, query in _list_queries(target.project_id).items():
+            await query()
+            for _ in range(repeat):
+                started_at: float = time.perf_counter()
+                await query()
+                recorder.record(endpoint=name, elapsed_seconds=time.perf_counter() - started_at, is_error=False)
+        recorder.finish()
+        results[f"{target.label} project"] = recorder.summarize()
+
+    return {
+        "targets": [
+            {"label": target.label, "project_id": target.project_id, "num_of_servers": target.num_of_servers}
+            for target in targets
+        ],
+        "scenarios": results,
+    }
@@ -0,0 +1,197 @@
+"""
+응답 모델 생성 / 직렬화 microbenchmark.
+
+DB 없이 relation이 모두 로딩된 entity를 메모리에 만들고, 한 페이지(기본 10,000개) 분량의 응답 모델 생성과
+FastAPI 응답 직렬화에 걸리는 시간을 측정한다.
+결과는 `LatencyRecorder` 형식이므로 `python -m test.benchmark.run compare`로 baseline과 비교할 수 있다.
+"""
+import gc
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from common.application.server.response import ServerResponse, ServerDetailResponse, ServerDetailsResponse
+from common.domain.floating_ip.entity import FloatingIp
+from common.domain.floating_ip.enum import FloatingIpStatus
+from common.domain.network_interface.entity import NetworkInterface
+from common.domain.security_group.entity import SecurityGroup, NetworkInterfaceSecurityGroup
+from common.domain.server.entity import Server
+from common.domain.server.enum import ServerStatus
+from common.domain.volume.entity import Volume
+from common.domain.volume.enum import VolumeStatus
+from test.benchmark.recorder import LatencyRecorder
+
+
+def create_servers(num_of_servers: int, num_of_security_groups: int = 5) -> list[Server]:
+    """
+    `ServerRepository.find_all_by_project_id(with_relations=True)`의 결과처럼 relation이 모두 로딩된 서버 목록을 만든다.
+
+    서버마다 루트 볼륨, NIC 1개(보안 그룹 2개 연결)를 가지며, 짝수 번째 서버에는 데이터 볼륨과 플로팅 IP가 연결된다.
+    """
+    now: datetime = datetime.now(timezone.utc)
+    security_groups: list[SecurityGroup] = [
+        SecurityGroup(
+            id=index + 1, openstack_id=str(uuid.uuid4()), project_id=1, name=f"sg_{index}", description="",
+            created_at=now, updated_at=now, deleted_at=None,
+        )
+        for index in range(num_of_security_groups)
+    ]
+
+    servers: list[Server] = []
+    for index in range(num_of_servers):
+        server_id: int = index + 1
+        network_interface: NetworkInterface = NetworkInterface(
+            id=server_id,
+            openstack_id=str(uuid.uuid4()),
+            project_id=1,
+            server_id=server_id,
+            fixed_ip_address=f"10.{index // 65536 % 256}.{index // 256 % 256}.{index % 256}",
+            created_at=now,
+            updated_at=now,
+            deleted_at=None,
+            _linked_security_groups=[
+                NetworkInterfaceSecurityGroup(
+                    network_interface_id=server_id,
+                    security_group_id=security_group.id,
+                    _security_group=security_group,
+                )
+                for security_group in (
+                    security_groups[index % num_of_security_groups],
+                    security_groups[(index + 1) % num_of_security_groups],
+                )
+            ],
+            _floating_ip=FloatingIp(
+                id=server_id,
+                openstack_id=str(uuid.uuid4()),
+                project_id=1,
+                network_interface_id=server_id,
+                status=FloatingIpStatus.ACTIVE,
+                address=f"172.{16 + index // 65536 % 16}.{index // 256 % 256}.{index % 256}",
+                created_at=now,
+                updated_at=now,
+                deleted_at=None,
+            ) if index % 2 == 0 else None,
+        )
+        volumes: list[Volume] = [
+            Volume(
+                id=server_id * 2 + volume_index,
+                openstack_id=str(uuid.uuid4()),
+                project_id=1,
+                server_id=server_id,
+                volume_type_openstack_id=str(uuid.uuid4()),
+                image_openstack_id=str(uuid.uuid4()) if volume_index == 0 else None,
+                name=f"volume_{index}_{volume_index}",
+                description="",
+                status=VolumeStatus.IN_USE,
+                size=10,
+                is_root_volume=volume_index == 0,
+                created_at=now,
+                updated_at=now,
+                deleted_at=None,
+            )
+            for volume_index in range(2 if index % 2 == 0 else 1)
+        ]
+        servers.append(
+            Server(
+                id=server_id,
+                openstack_id=str(uuid.uuid4()),
+                project_id=1,
+                flavor_openstack_id=str(uuid.uuid4()),
+                name=f"server_{index}",
+                description="",
+                status=ServerStatus.ACTIVE,
+                created_at=now - timedelta(minutes=index),
+                updated_at=now,
+                deleted_at=None,
+                _linked_volumes=volumes,
+                _linked_network_interfaces=[network_interface],
+            )
+        )
+    return servers
+
+
+def _find_route(path: str, method: str) -> APIRoute:
+    from api_server.main import app
+
+    return next(
+        route for route in app.routes
+        if isinstance(route, APIRoute) and route.path == path and method in route.methods
+    )
+
+
+def _benchmarks(servers: list[Server]) -> dict[str, Callable[[], Awaitable]]:
+    """
+    응답 모델 생성과 직렬화 경로 별 소요 시간을 측정한다.
+
+    `model_construct`는 검증을 생략하지만 Python으로 구현되어 있어 pydantic-core의 검증보다 느리므로,
+    비교를 위해 `ServerResponse`에 대해서만 측정한다.
+    """
+    list_route: APIRoute = _find_route("/servers", "GET")
+    server_details: ServerDetailsResponse = ServerDetailsResponse(servers=[])
+
+    async def build_server_responses() -> None:
+        for server in servers:
+            ServerResponse.from_entity(server)
+
+    async def construct_server_responses() -> None:
+        for server in servers:
+            ServerResponse.model_construct(
+                id=server.id,
+                openstack_id=server.openstack_id,
+                project_id=server.project_id,
+                flavor_openstack_id=server.flavor_openstack_id,
+                name=server.name,
+                description=server.description,
+                status=server.status,
+                created_at=server.created_at,
+                updated_at=server.updated_at,
+                deleted_at=server.deleted_at,
+            )
+
+    async def build_server_detail_responses() -> None:
+        nonlocal server_details
+        server_details = ServerDetailsResponse(
+            servers=[await ServerDetailResponse.from_entity(server) for server in servers]
+        )
+
+    async def serialize_with_fastapi() -> None:
+        # `response_model`이 지정된 endpoint에서 FastAPI가 수행하는 재검증 + `jsonable_encoder` 변환 + JSON 인코딩
+        content = await serialize_response(
+            field=list_route.response_field, response_content=server_details, is_coroutine=True
+        )
+        JSONResponse(content)
+
+    async def serialize_with_model_dump_json() -> None:
+        server_details.model_dump_json()
+
+    return {
+        "ServerResponse.from_entity": build_server_responses,
+        "ServerResponse.model_construct": construct_server_responses,
+        "ServerDetailResponse.from_entity": build_server_detail_responses,
+        "serialize ServerDetailsResponse (FastAPI response_model)": serialize_with_fastapi,
+        "serialize ServerDetailsResponse (model_dump_json)": serialize_with_model_dump_json,
+    }
+
+
+async def run_response_benchmark(num_of_entities: int, repeat: int) -> dict:
+    """
+    :param num_of_entities: 한 페이지의 entity 수
+    :param repeat: 항목 별 반복 횟수 (첫 실행은 warm-up으로 기록하지 않는다.)
+    :return: `{"scenarios": {"<N> entities": <LatencyRecorder 요약>}}`
+    """
+    servers: list[Server] = create_servers(num_of_entities)
+    recorder: LatencyRecorder = LatencyRecorder()
+    for name, benchmark in _benchmarks(servers).items():
+        await benchmark()
+        for _ in range(repeat):
+            # 이전 반복에서 생성된 객체의 GC 비용이 측정 구간에 섞이지 않도록 미리 수집한다.
+            gc.collect()
+            started_at: float = time.perf_counter()
+            await benchmark()
+            recorder.record(endpoint=name, elapsed_seconds=time.perf_counter() - started_at, is_error=False)
+    recorder.finish()
+    return {"scenarios": {f"{num_of_entities} entities": recorder.summarize()}}
@@ -0,0 +1,343 @@
+import asyncio
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Iterable
+
+import bcrypt
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from common.domain.domain.entity import Domain
+from common.domain.floating_ip.entity import FloatingIp
+from common.domain.floating_ip.enum import FloatingIpStatus
+from common.domain.network_interface.entity import NetworkInterface
+from common.domain.project.entity import Project, ProjectUser
+from common.domain.security_group.entity import SecurityGroup, NetworkInterfaceSecurityGroup
+from common.domain.server.entity import Server
+from common.domain.server.enum import ServerStatus
+from common.domain.user.entity import User
+from common.domain.volume.entity import Volume
+from common.domain.volume.enum import VolumeStatus
+from common.util.envs import Envs, get_envs
+from test.benchmark.client import BenchmarkClient, BenchmarkResponse
+from test.benchmark.openstack_simulator import OpenStackSimulator
+
+envs: Envs = get_envs()
+
+BENCHMARK_PASSWORD: str = "benchmark-password"
+IMAGE_OPENSTACK_ID: str = "1abc7a2f-8eec-49a2-b9ef-be16e0959cdb"
+
+
+@dataclass
+class SeededProject:
+    project_id: int
+    project_openstack_id: str
+    account_ids: list[str] = field(default_factory=list)
+    security_group_ids: list[int] = field(default_factory=list)
+    server_ids: list[int] = field(default_factory=list)
+
+
+@dataclass
+class ScenarioContext:
+    client: BenchmarkClient
+    simulator: OpenStackSimulator
+    session_maker: sessionmaker[AsyncSession]
+    scale: float = 1.0
+    concurrency: int = 50
+
+    def scaled(self, value: int) -> int:
+        return max(int(value * self.scale), 1)
+
+
+async def run_concurrently(jobs: Iterable[Callable[[], Awaitable]], concurrency: int) -> None:
+    semaphore: asyncio.Semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(job: Callable[[], Awaitable]) -> None:
+        async with semaphore:
+            await job()
+
+    await asyncio.gather(*(run(job) for job in jobs))
+
+
+async def seed_project(
+    context: ScenarioContext,
+    num_of_users: int,
+    num_of_servers: int = 0,
+    num_of_security_groups: int = 1,
+) -> SeededProject:
+    """
+    벤치마크용 프로젝트와 유저, 보안 그룹, 서버(루트 볼륨, NIC, 플로팅 IP 포함)를 DB와 simulator에 생성한다.
+
+    bcrypt 해싱 비용을 줄이기 위해 모든 유저는 같은 password hash를 공유한다.
+    """
+    hashed_password: str = bcrypt.hashpw(BENCHMARK_PASSWORD.encode("UTF-8"), bcrypt.gensalt()).decode("UTF-8")
+    now: datetime = datetime.now(timezone.utc)
+
+    async with context.session_maker() as session:
+        domain: Domain | None = await session.get(Domain, envs.DEFAULT_DOMAIN_ID)
+        if domain is None:
+            session.add(
+                Domain(
+                    id=envs.DEFAULT_DOMAIN_ID,
+                    openstack_id=envs.DEFAULT_DOMAIN_OPENSTACK_ID,
+                    name="benchmark",
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
+
+        project: Project = Project(
+            domain_id=envs.DEFAULT_DOMAIN_ID,
+            openstack_id=uuid.uuid4().hex,
+            name=f"project_{uuid.uuid4().hex[:8]}",
+            created_at=now,
+            updated_at=now,
+        )
+        session.add(project)
+        await session.flush()
+        seeded: SeededProject = SeededProject(project_id=project.id, project_openstack_id=project.openstack_id)
+
+        users: list[User] = [
+            User(
+                openstack_id=uuid.uuid4().hex,
+                domain_id=envs.DEFAULT_DOMAIN_ID,
+                account_id=f"b{uuid.uuid4().hex[:12]}",
+                name="bench",
+                password=hashed_password,
+                created_at=now,
+                updated_at=now,
+            )
+            for _ in range(num_of_users)
+        ]
+        session.add_all(users)
+        await session.flush()
+        session.add_all(
+            [ProjectUser(user_id=user.id, project_id=project.id, created_at=now, updated_at=now) for user in users]
+        )
+        seeded.account_ids = [user.account_id for user in users]
+
+        security_groups: list[SecurityGroup] = [
+            SecurityGroup(
+                openstack_id=context.simulator.add_security_group(project_openstack_id=project.openstack_id),
+                project_id=project.id,
+                name=f"sg_{index}",
+                description="",
+                created_at=now,
+                updated_at=now,
+            )
+            for index in range(num_of_security_groups)
+        ]
+        session.add_all(security_groups)
+        await session.flush()
+        seeded.security_group_ids = [security_group.id for security_group in security_groups]
+
+        servers: list[Server] = [
+            Server(
+                openstack_id=str(uuid.uuid4()),
+                project_id=project.id,
+                flavor_openstack_id=str(uuid.uuid4()),
+                name=f"server_{index}",
+                description="",
+                status=ServerStatus.ACTIVE,
+                created_at=now,
+                updated_at=now,
+            )
+            for index in range(num_of_servers)
+        ]
+        session.add_all(servers)
+        await session.flush()
+        seeded.server_ids = [server.id for server in servers]
+
+        for index, server in enumerate(servers):
+            network_interface: NetworkInterface = NetworkInterface(
+                openstack_id=str(uuid.uuid4()),
+                project_id=project.id,
+                server_id=server.id,
+                fixed_ip_address=f"10.0.{index // 256 % 256}.{index % 256}",
+                created_at=now,
+                updated_at=now,
+            )
+            session.add(network_interface)
+            session.add(
+                Volume(
+                    openstack_id=str(uuid.uuid4()),
+                    project_id=project.id,
+                    server_id=server.id,
+                    volume_type_openstack_id=str(uuid.uuid4()),
+                    image_openstack_id=IMAGE_OPENSTACK_ID,
+                    name=f"volume_{index}",
+                    description="",
+                    status=VolumeStatus.IN_USE,
+                    size=10,
+                    is_root_volume=True,
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
+            await session.flush()
+            if security_groups:
+                session.add(
+                    NetworkInterfaceSecurityGroup(
+                        network_interface_id=network_interface.id,
+                        security_group_id=security_groups[index % len(security_groups)].id,
+                        created_at=now,
+                        updated_at=now,
+                    )
+                )
+            if index % 2 == 0:
+                session.add(
+                    FloatingIp(
+                        openstack_id=str(uuid.uuid4()),
+                        project_id=project.id,
+                        network_interface_id=network_interface.id,
+                        status=FloatingIpStatus.ACTIVE,
+                        address=f"172.24.{index // 256 % 256}.{index % 256}",
+                        created_at=now,
+                        updated_at=now,
+                    )
+                )
+
+        await session.commit()
+    return seeded
+
+
+async def login(context: ScenarioContext, account_id: str, record: bool = True) -> BenchmarkResponse:
+    return await context.client.request(
+        endpoint="POST /auth/login",
+        method="POST",
+        path="/auth/login",
+        json_body={"account_id": account_id, "password": BENCHMARK_PASSWORD},
+        record=record,
+    )
+
+
+async def issue_access_token(context: ScenarioContext, account_id: str) -> str:
+    """
+    시나리오 준비 단계에서 access token을 발급받는다. 응답 시간은 기록하지 않는다.
+    """
+    response: BenchmarkResponse = await login(context, account_id, record=False)
+    if response.status_code != 200:
+        raise RuntimeError(f"Login failed while preparing scenario. status={response.status_code}")
+    return response.json()["token"]
+
+
+async def login_storm(context: ScenarioContext) -> None:
+    """
+    출근 시간대처럼 많은 유저가 동시에 로그인하는 상황. (bcrypt + Keystone password 인증)
+    """
+    project: SeededProject = await seed_project(context, num_of_users=context.scaled(200))
+
+    await run_concurrently(
+        jobs=[lambda account_id=account_id: login(context, account_id) for account_id in project.account_ids],
+        concurrency=context.concurrency,
+    )
+
+
+async def dashboard(context: ScenarioContext) -> None:
+    """
+    대시보드를 띄워둔 유저들이 목록 API를 반복해서 호출하는 상황.
+    """
+    project: SeededProject = await seed_project(
+        context,
+        num_of_users=context.scaled(20),
+        num_of_servers=context.scaled(100),
+        num_of_security_groups=5,
+    )
+    tokens: list[str] = [await issue_access_token(context, account_id) for account_id in project.account_ids]
+
+    async def refresh_dashboard(access_token: str) -> None:
+        for path in ["/servers", "/volumes", "/security-groups", "/floating-ips"]:
+            await context.client.request(
+                endpoint=f"GET {path}", method="GET", path=path, access_token=access_token
+            )
+        server_id: int = project.server_ids[0]
+        await context.client.request(
+            endpoint="GET /servers/{server_id}",
+            method="GET",
+            path=f"/servers/{server_id}",
+            access_token=access_token,
+        )
+
+    await run_concurrently(
+        jobs=[lambda token=token: refresh_dashboard(token) for token in tokens for _ in range(10)],
+        concurrency=context.concurrency,
+    )
+
+
+async def server_creation_burst(context: ScenarioContext) -> None:
+    """
+    한 프로젝트에서 서버 생성 요청(기본 1,000개)이 한꺼번에 들어오는 상황.
+
+    서버 생성 후처리(`finalize_server_creation`)도 모두 끝날 때까지 기다린다.
+    """
+    project: SeededProject = await seed_project(context, num_of_users=1, num_of_security_groups=2)
+    access_token: str = await issue_access_token(context, project.account_ids[0])
+
+    async def create_server(index: int) -> None:
+        await context.client.request(
+            endpoint="POST /servers",
+            method="POST",
+            path="/servers",
+            access_token=access_token,
+            json_body={
+                "name": f"burst_{index}",
+                "description": "",
+                "flavor_id": str(uuid.uuid4()),
+                "network_id": str(uuid.uuid4()),
+                "root_volume": {"size": 10, "image_id": IMAGE_OPENSTACK_ID},
+                "security_group_ids": project.security_group_ids,
+            },
+        )
+
+    await run_concurrently(
+        jobs=[lambda index=index: create_server(index) for index in range(context.scaled(1000))],
+        concurrency=context.concurrency,
+    )
+    await context.client.drain()
+
+
+async def security_group_rule_churn(context: ScenarioContext) -> None:
+    """
+    보안 그룹 rule 전체를 번갈아가며 교체(추가 + 삭제)하는 상황.
+
+    Optimistic lock 충돌을 피하기 위해 보안 그룹마다 하나의 작업자만 수정한다.
+    """
+    num_of_workers: int = min(context.concurrency, 10)
+    project: SeededProject = await seed_project(context, num_of_users=1, num_of_security_groups=num_of_workers)
+    access_token: str = await issue_access_token(context, project.account_ids[0])
+    rule_sets: list[list[dict]] = [
+        [
+            {"protocol": "tcp", "ether_type": "IPv4", "direction": "ingress",
+             "port_range_min": port, "port_range_max": port, "remote_ip_prefix": "0.0.0.0/0"}
+            for port in ports
+        ]
+        for ports in [(22, 80, 443), (22, 8080, 8443, 9090)]
+    ]
+
+    async def churn(security_group_id: int) -> None:
+        for iteration in range(context.scaled(20)):
+            await context.client.request(
+                endpoint="PUT /security-groups/{security_group_id}",
+                method="PUT",
+                path=f"/security-groups/{security_group_id}",
+                access_token=access_token,
+                json_body={
+                    "name": f"sg_{security_group_id}_{iteration % 2}",
+                    "description": "",
+                    "rules": rule_sets[iteration % 2],
+                },
+            )
+
+    await run_concurrently(
+        jobs=[lambda security_group_id=sg_id: churn(security_group_id) for sg_id in project.security_group_ids],
+        concurrency=num_of_workers,
+    )
+
+
+SCENARIOS: dict[str, Callable[[ScenarioContext], Awaitable[None]]] = {
+    "login_storm": login_storm,
+    "dashboard": dashboard,
+    "server_creation_burst": server_creation_burst,
+    "security_group_rule_churn": security_group_rule_churn,
+}
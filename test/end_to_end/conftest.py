@@ -1,14 +1,20 @@
+import os
 from unittest.mock import AsyncMock
 
 import pytest
 import pytest_asyncio
-from httpx import AsyncClient, ASGITransport
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from httpx import AsyncClient, ASGITransport, Response, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import sessionmaker
 from testcontainers.mysql import MySqlContainer
 
 from api_server.main import app
 from common.domain.entity import BaseEntity
+from common.infrastructure.database import create_database_engine
+from common.util import membership_cache, circuit_breaker, microversion
+
+# 설정 시 MySQL testcontainer 대신 사용할 DB URL (ex. `sqlite+aiosqlite:///./e2e.db`)
+_TEST_DATABASE_URL: str | None = os.environ.get("TEST_DATABASE_URL")
 
 
 @pytest.fixture(scope="session")
@@ -19,9 +25,13 @@ def mysql_container():
 
 
 @pytest_asyncio.fixture(scope="session")
-async def async_engine(mysql_container):
-    async_db_url: str = mysql_container.get_connection_url().replace("mysql://", "mysql+aiomysql://")
-    engine = create_async_engine(url=async_db_url, echo=True)
+async def async_engine(request):
+    if _TEST_DATABASE_URL:
+        async_db_url: str = _TEST_DATABASE_URL
+    else:
+        mysql_container = request.getfixturevalue("mysql_container")
+        async_db_url: str = mysql_container.get_connection_url().replace("mysql://", "mysql+aiomysql://")
+    engine = create_database_engine(database_url=async_db_url, echo=True)
     async with engine.begin() as conn:
         await conn.run_sync(BaseEntity.metadata.create_all)
     yield engine
@@ -51,12 +61,19 @@ async def clean_data_before_test(db_session):
     for table in reversed(BaseEntity.metadata.sorted_tables):
         await db_session.execute(table.delete())
     await db_session.commit()
+    # 삭제된 row의 id가 다음 테스트에서 재사용될 수 있으므로 membership cache도 함께 비운다.
+    membership_cache.clear_membership_cache()
+    circuit_breaker.clear_circuit_breakers()
+    microversion.clear_microversions()
     yield
 
 
 @pytest_asyncio.fixture(scope="function")
 async def mock_async_client():
-    return AsyncMock(spec=AsyncClient)
+    mock = AsyncMock(spec=AsyncClient)
+    # microversion 조회(version 문서)는 기본적으로 지원하지 않는 것으로 응답한다.
+    mock.get.return_value = Response(404, request=Request("GET", "http://openstack"))
+    return mock
 
 
 async def fake_session_factory():
@@ -64,7 +81,16 @@ async def fake_session_factory():
 
 
 @pytest_asyncio.fixture(scope="function")
-async def app_test(mocker, async_session_maker, mock_async_client):
+async def mock_is_project_member():
+    """
+    대부분의 테스트는 DB에 존재하지 않는 user로 access token을 만들기 때문에 membership 검증을 항상 통과시킨다.
+    실제 검증이 필요한 테스트는 `side_effect`에 `membership_cache.is_project_member`를 지정한다.
+    """
+    return AsyncMock(return_value=True)
+
+
+@pytest_asyncio.fixture(scope="function")
+async def app_test(mocker, async_session_maker, mock_async_client, mock_is_project_member):
     system_keystone_token: str = "keystone-token"
     mocker.patch("common.application.user.service.get_system_keystone_token", return_value=system_keystone_token)
     mocker.patch("common.application.project.service.get_system_keystone_token", return_value=system_keystone_token)
@@ -74,6 +100,9 @@ async def app_test(mocker, async_session_maker, mock_async_client):
     mocker.patch("common.infrastructure.database.session_maker", new_callable=lambda: async_session_maker)
 
     mocker.patch("common.infrastructure.openstack_client.get_async_client", return_value=mock_async_client)
+    mocker.patch("common.util.microversion.get_async_client", return_value=mock_async_client)
+
+    mocker.patch("common.util.auth_token_manager.is_project_member", new=mock_is_project_member)
 
     yield app
 
@@ -7,7 +7,7 @@ from common.domain.project.entity import Project
 from common.domain.user.entity import User
 from test.end_to_end.conftest import mock_async_client
 from test.util.database import add_to_db
-from test.util.factory import create_user, create_domain, create_project, create_project_user
+from test.util.factory import create_user, create_domain, create_project, create_project_user, create_access_token
 from test.util.random import random_string
 
 
@@ -167,3 +167,155 @@ async def test_login_fail_user_has_not_project_access_permission(client, db_sess
     # then
     assert response.status_code == 403
     assert response.json().get("code") == "PROJECT_ACCESS_DENIED"
+
+
+async def test_switch_project_success(client, db_session, mock_async_client):
+    # given
+    subject_token: str = random_string()
+    keystone_token_exp: datetime = datetime.now(timezone.utc) + timedelta(days=1)
+
+    domain: Domain = await add_to_db(db_session, create_domain())
+    project1: Project = await add_to_db(db_session, create_project(domain_id=domain.id))
+    project2: Project = await add_to_db(db_session, create_project(domain_id=domain.id, openstack_id=random_string()))
+    user: User = await add_to_db(db_session, create_user(domain_id=domain.id))
+    await add_to_db(db_session, create_project_user(user_id=user.id, project_id=project1.id))
+    await add_to_db(db_session, create_project_user(user_id=user.id, project_id=project2.id))
+    await db_session.commit()
+
+    mock_async_client.request.return_value = httpx.Response(
+        request=httpx.Request("POST", "https://keystone/v3/auth/tokens"),
+        status_code=201,
+        headers={
+            "x-subject-token": subject_token,
+        },
+        json={
+            "token": {
+                "expires_at": keystone_token_exp.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+            }
+        },
+    )
+    access_token: str = create_access_token(user_id=user.id, project_id=project1.id, keystone_token="keystone-token")
+
+    # when
+    response = await client.post(
+        url="/auth/switch-project",
+        headers={"Authorization": f"Bearer {access_token}"},
+        json={"project_id": project2.id},
+    )
+
+    # then
+    assert response.status_code == 200
+    request_body: dict = mock_async_client.request.call_args.kwargs["json"]
+    assert request_body["auth"]["identity"] == {"methods": ["token"], "token": {"id": "keystone-token"}}
+    assert request_body["auth"]["scope"]["project"]["id"] == project2.openstack_id
+
+    response = await client.get(
+        url=f"/projects/{project2.id}",
+        headers={"Authorization": f"Bearer {response.json()['token']}"},
+    )
+    assert response.status_code == 200
+
+
+async def test_switch_project_fail_user_has_not_project_access_permission(client, db_session, mock_async_client):
+    # given
+    domain: Domain = await add_to_db(db_session, create_domain())
+    project1: Project = await add_to_db(db_session, create_project(domain_id=domain.id))
+    project2: Project = await add_to_db(db_session, create_project(domain_id=domain.id))
+    user: User = await add_to_db(db_session, create_user(domain_id=domain.id))
+    await add_to_db(db_session, create_project_user(user_id=user.id, project_id=project1.id))
+    await db_session.commit()
+
+    access_token: str = create_access_token(user_id=user.id, project_id=project1.id)
+
+    # when
+    response = await client.post(
+        url="/auth/switch-project",
+        headers={"Authorization": f"Bearer {access_token}"},
+        json={"project_id": project2.id},
+    )
+
+    # then
+    assert response.status_code == 403
+    assert response.json().get("code") == "PROJECT_ACCESS_DENIED"
+    mock_async_client.request.assert_not_called()
+
+
+async def _login(client, db_session, mock_async_client) -> dict:
+    plain_password: str = random_string()
+    keystone_token_exp: datetime = datetime.now(timezone.utc) + timedelta(days=1)
+
+    domain: Domain = await add_to_db(db_session, create_domain())
+    project: Project = await add_to_db(db_session, create_project(domain_id=domain.id))
+    user: User = await add_to_db(db_session, create_user(domain_id=domain.id, plain_password=plain_password))
+    await add_to_db(db_session, create_project_user(user_id=user.id, project_id=project.id))
+    await db_session.commit()
+
+    mock_async_client.request.return_value = httpx.Response(
+        request=httpx.Request("POST", "https://keystone/v3/auth/tokens"),
+        status_code=201,
+        headers={
+            "x-subject-token": random_string(),
+        },
+        json={
+            "token": {
+                "expires_at": keystone_token_exp.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+            }
+        },
+    )
+    response = await client.post(
+        url="/auth/login",
+        headers={"Content-Type": "application/json"},
+        json={
+            "account_id": user.account_id,
+            "password": plain_password,
+        }
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+async def test_refresh_success(client, db_session, mock_async_client):
+    # given
+    login_response: dict = await _login(client, db_session, mock_async_client)
+    mock_async_client.request.reset_mock()
+
+    # when
+    response = await client.post(url="/auth/refresh", json={"refresh_token": login_response["refresh_token"]})
+
+    # then
+    assert response.status_code == 200
+    response_body = response.json()
+    assert response_body["token"] is not None
+    assert response_body["refresh_token"] != login_response["refresh_token"]
+    request_body: dict = mock_async_client.request.call_args.kwargs["json"]
+    assert request_body["auth"]["identity"]["methods"] == ["token"]
+
+
+async def test_refresh_fail_reused_refresh_token_revokes_rotated_refresh_token(client, db_session, mock_async_client):
+    # given
+    login_response: dict = await _login(client, db_session, mock_async_client)
+    response = await client.post(url="/auth/refresh", json={"refresh_token": login_response["refresh_token"]})
+    rotated_refresh_token: str = response.json()["refresh_token"]
+
+    # when
+    response = await client.post(url="/auth/refresh", json={"refresh_token": login_response["refresh_token"]})
+
+    # then
+    assert response.status_code == 401
+    assert response.json().get("code") == "INVALID_REFRESH_TOKEN"
+    response = await client.post(url="/auth/refresh", json={"refresh_token": rotated_refresh_token})
+    assert response.status_code == 401
+
+
+async def test_refresh_fail_after_logout(client, db_session, mock_async_client):
+    # given
+    login_response: dict = await _login(client, db_session, mock_async_client)
+
+    # when
+    response = await client.post(url="/auth/logout", json={"refresh_token": login_response["refresh_token"]})
+
+    # then
+    assert response.status_code == 204
+    response = await client.post(url="/auth/refresh", json={"refresh_token": login_response["refresh_token"]})
+    assert response.status_code == 401
+    assert response.json().get("code") == "INVALID_REFRESH_TOKEN"
@@ -0,0 +1,87 @@
+from httpx import Response
+
+from common.util import auth_token_manager
+from test.util.factory import create_access_token
+
+
+async def test_profile_success(client, mocker):
+    # given
+    mocker.patch.object(auth_token_manager.envs, "ADMIN_USER_IDS", [1])
+    access_token: str = create_access_token(user_id=1)
+
+    # when
+    response: Response = await client.get(
+        "/debug/profile",
+        params={"seconds": 1, "format": "speedscope"},
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+
+    # then
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json()["profiles"][0]["type"] == "sampled"
+
+
+async def test_profile_fail_not_admin(client, mocker):
+    # given
+    mocker.patch.object(auth_token_manager.envs, "ADMIN_USER_IDS", [1])
+    access_token: str = create_access_token(user_id=2)
+
+    # when
+    response: Response = await client.get(
+        "/debug/profile",
+        params={"seconds": 1},
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+
+    # then
+    assert response.status_code == 403
+    assert response.json()["code"] == "ADMIN_PERMISSION_REQUIRED"
+
+
+async def test_memory_snapshot_success(client, mocker):
+    # given
+    mocker.patch.object(auth_token_manager.envs, "ADMIN_USER_IDS", [1])
+    headers: dict[str, str] = {"Authorization": f"Bearer {create_access_token(user_id=1)}"}
+    start_response: Response = await client.post("/debug/memory/tracing", headers=headers)
+
+    # when
+    response: Response = await client.post("/debug/memory/snapshots", params={"limit": 5}, headers=headers)
+    await client.delete("/debug/memory/tracing", headers=headers)
+
+    # then
+    assert start_response.status_code == 200
+    assert start_response.json()["tracing"] is True
+    assert response.status_code == 200
+    assert response.json()["memory"]["rss_bytes"] > 0
+    assert len(response.json()["allocations"]) <= 5
+
+
+async def test_memory_snapshot_fail_not_started(client, mocker):
+    # given
+    mocker.patch.object(auth_token_manager.envs, "ADMIN_USER_IDS", [1])
+    access_token: str = create_access_token(user_id=1)
+
+    # when
+    response: Response = await client.post(
+        "/debug/memory/snapshots", headers={"Authorization": f"Bearer {access_token}"}
+    )
+
+    # then
+    assert response.status_code == 409
+    assert response.json()["code"] == "MEMORY_TRACING_NOT_STARTED"
+
+
+async def test_count_objects_success(client, mocker):
+    # given
+    mocker.patch.object(auth_token_manager.envs, "ADMIN_USER_IDS", [1])
+    access_token: str = create_access_token(user_id=1)
+
+    # when
+    response: Response = await client.get(
+        "/debug/memory/objects", params={"limit": 3}, headers={"Authorization": f"Bearer {access_token}"}
+    )
+
+    # then
+    assert response.status_code == 200
+    assert len(response.json()["objects"]) == 3
@@ -0,0 +1,160 @@
+import json
+from unittest.mock import Mock
+
+from httpx import Response
+
+from common.domain.domain.entity import Domain
+from common.domain.project.entity import Project
+from common.domain.security_group.entity import NetworkInterfaceSecurityGroup
+from common.domain.server.entity import Server
+from test.util.database import add_to_db
+from test.util.factory import (
+    create_access_token, create_domain, create_project, create_server, create_volume, create_security_group,
+    create_network_interface, create_floating_ip,
+)
+from test.util.random import random_string
+
+
+def _parse_ndjson(response: Response) -> list[dict]:
+    return [json.loads(line) for line in response.text.splitlines() if line]
+
+
+async def test_export_servers_success(client, db_session):
+    # given
+    domain: Domain = await add_to_db(db_session, create_domain())
+    project: Project = await add_to_db(db_session, create_project(domain_id=domain.id))
+    other_project: Project = await add_to_db(db_session, create_project(domain_id=domain.id))
+    server1: Server = await add_to_db(db_session, create_server(server_id=1, project_id=project.id))
+    server2: Server = await add_to_db(db_session, create_server(server_id=2, project_id=project.id))
+    await add_to_db(db_session, create_server(server_id=3, project_id=other_project.id))
+    await add_to_db(
+        db_session,
+        create_volume(volume_id=1, project_id=project.id, server=server1, is_root_volume=True, image_openstack_id="1")
+    )
+    await db_session.commit()
+
+    # when
+    access_token: str = create_access_token(project_id=project.id)
+    response: Response = await client.get("/export/servers", headers={"Authorization": f"Bearer {access_token}"})
+
+    # then
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    servers: list[dict] = _parse_ndjson(response)
+    assert [server["id"] for server in servers] == [server1.id, server2.id]
+    assert servers[0]["image_id"] == "1"
+    assert len(servers[0]["volumes"]) == 1
+
+
+async def test_export_servers_in_multiple_batches(client, db_session, mocker):
+    # given
+    domain: Domain = await add_to_db(db_session, create_domain())
+    project: Project = await add_to_db(db_session, create_project(domain_id=domain.id))
+    for server_id in range(1, 6):
+        await add_to_db(
+            db_session,
+            create_server(server_id=server_id, openstack_id=random_string(), project_id=project.id)
+        )
+    await db_session.commit()
+    mocker.patch(
+        "common.infrastructure.server.repository.ServerRepository.stream_all_by_project_id.__defaults__", (2,)
+    )
+
+    # when
+    access_token: str = create_access_token(project_id=project.id)
+    response: Response = await client.get("/export/servers", headers={"Authorization": f"Bearer {access_token}"})
+
+    # then
+    assert response.status_code == 200
+    assert [server["id"] for server in _parse_ndjson(response)] == [1, 2, 3, 4, 5]
+
+
+async def test_export_volumes_success(client, db_session):
+    # given
+    domain: Domain = await add_to_db(db_session, create_domain())
+    project: Project = await add_to_db(db_session, create_project(domain_id=domain.id))
+    await add_to_db(db_session, create_volume(volume_id=1, project_id=project.id))
+    await add_to_db(db_session, create_volume(volume_id=2, project_id=project.id))
+    await db_session.commit()
+
+    # when
+    access_token: str = create_access_token(project_id=project.id)
+    response: Response = await client.get("/export/volumes", headers={"Authorization": f"Bearer {access_token}"})
+
+    # then
+    assert response.status_code == 200
+    assert [volume["id"] for volume in _parse_ndjson(response)] == [1, 2]
+
+
+async def test_export_security_groups_success(client, db_session, mock_async_client):
+    # given
+    domain: Domain = await add_to_db(db_session, create_domain())
+    project: Project = await add_to_db(db_session, create_project(domain_id=domain.id))
+    security_group = await add_to_db(
+        db_session, create_security_group(openstack_id="sg-openstack-id", project_id=project.id)
+    )
+    server: Server = await add_to_db(db_session, create_server(project_id=project.id))
+    network_interface = await add_to_db(
+        db_session, create_network_interface(server_id=server.id, project_id=project.id)
+    )
+    await add_to_db(
+        db_session,
+        NetworkInterfaceSecurityGroup(
+            network_interface_id=network_interface.id, security_group_id=security_group.id
+        )
+    )
+    await db_session.commit()
+
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.headers = {}
+    mock_response.json.return_value = {
+        "security_group_rules": [
+            {
+                "id": "rule-id",
+                "security_group_id": "sg-openstack-id",
+                "protocol": "tcp",
+                "direction": "ingress",
+                "port_range_min": 22,
+                "port_range_max": 22,
+                "remote_ip_prefix": "0.0.0.0/0",
+                "ethertype": "IPv4",
+            }
+        ]
+    }
+    mock_response.content = json.dumps(mock_response.json.return_value).encode()
+    mock_async_client.request.return_value = mock_response
+
+    # when
+    access_token: str = create_access_token(project_id=project.id)
+    response: Response = await client.get(
+        "/export/security-groups", headers={"Authorization": f"Bearer {access_token}"}
+    )
+
+    # then
+    assert response.status_code == 200
+    security_groups: list[dict] = _parse_ndjson(response)
+    assert len(security_groups) == 1
+    assert security_groups[0]["id"] == security_group.id
+    assert len(security_groups[0]["rules"]) == 1
+    assert [linked_server["id"] for linked_server in security_groups[0]["servers"]] == [server.id]
+
+
+async def test_export_floating_ips_success(client, db_session):
+    # given
+    domain: Domain = await add_to_db(db_session, create_domain())
+    project: Project = await add_to_db(db_session, create_project(domain_id=domain.id))
+    floating_ip1 = await add_to_db(db_session, create_floating_ip(project_id=project.id))
+    floating_ip2 = await add_to_db(db_session, create_floating_ip(project_id=project.id))
+    await db_session.commit()
+
+    # when
+    access_token: str = create_access_token(project_id=project.id)
+    response: Response = await client.get(
+        "/export/floating-ips", headers={"Authorization": f"Bearer {access_token}"}
+    )
+
+    # then
+    assert response.status_code == 200
+    assert [floating_ip["id"] for floating_ip in _parse_ndjson(response)] == [floating_ip1.id, floating_ip2.id]
+
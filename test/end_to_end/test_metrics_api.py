@@ -0,0 +1,47 @@
+from common.util import auth_token_manager
+from test.util.factory import create_access_token
+
+
+async def test_get_metrics_success(client, mocker):
+    # given
+    mocker.patch.object(auth_token_manager.envs, "ADMIN_USER_IDS", [1])
+    access_token: str = create_access_token(user_id=1)
+
+    # when
+    response = await client.get("/metrics", headers={"Authorization": f"Bearer {access_token}"})
+
+    # then
+    assert response.status_code == 200
+    data = response.json()
+    assert data["loop_lag"]["buckets"][-1]["le_ms"] is None
+    assert "hits" in data["access_token_cache"]
+    assert "hits" in data["membership_cache"]
+    assert "in_flight" in data["password_hasher"]
+    assert data["memory"]["rss_bytes"] > 0
+    assert data["logging"]["dropped"] == 0
+    assert "hedged" in data["hedging"]
+
+
+async def test_get_metrics_fail_not_admin(client, mocker):
+    # given
+    mocker.patch.object(auth_token_manager.envs, "ADMIN_USER_IDS", [1])
+    access_token: str = create_access_token(user_id=2)
+
+    # when
+    anonymous = await client.get("/metrics")
+    not_admin = await client.get("/metrics", headers={"Authorization": f"Bearer {access_token}"})
+
+    # then
+    assert anonymous.status_code in (401, 403)
+    assert not_admin.status_code == 403
+    assert not_admin.json()["code"] == "ADMIN_PERMISSION_REQUIRED"
+
+
+async def test_request_id_is_returned(client):
+    # when
+    generated = await client.get("/metrics")
+    forwarded = await client.get("/metrics", headers={"X-Request-ID": "request-1"})
+
+    # then
+    assert len(generated.headers["X-Request-ID"]) == 32
+    assert forwarded.headers["X-Request-ID"] == "request-1"
@@ -1,6 +1,11 @@
+import json
 from datetime import datetime
 from unittest.mock import Mock
 
+from sqlalchemy import select
+
+from common.domain.project.entity import ProjectUserInvalidation
+from common.util import membership_cache, tracing
 from common.util.envs import Envs, get_envs
 from test.util.database import add_to_db
 from test.util.factory import create_domain, create_user, create_project, create_project_user, create_access_token
@@ -414,3 +419,88 @@ async def test_unassign_user_from_project_fail_user_not_in_project(client, db_se
     assert response.status_code == 409
     data = response.json()
     assert data["code"] == "USER_ROLE_NOT_IN_PROJECT"
+
+
+async def test_access_token_becomes_invalid_after_user_is_unassigned_from_project(
+    client, db_session, mock_async_client, mock_is_project_member
+):
+    # given
+    mock_is_project_member.side_effect = membership_cache.is_project_member
+
+    domain = await add_to_db(db_session, create_domain())
+    project = await add_to_db(db_session, create_project(domain_id=domain.id))
+    user1 = await add_to_db(db_session, create_user(domain_id=domain.id))
+    user2 = await add_to_db(db_session, create_user(domain_id=domain.id))
+    await add_to_db(db_session, create_project_user(user_id=user1.id, project_id=project.id))
+    await add_to_db(db_session, create_project_user(user_id=user2.id, project_id=project.id))
+    await db_session.commit()
+
+    user1_access_token = create_access_token(user_id=user1.id, project_id=project.id)
+    user2_access_token = create_access_token(user_id=user2.id, project_id=project.id)
+
+    mock_response = Mock()
+    mock_response.status_code = 204
+    mock_response.raise_for_status.return_value = None
+    mock_async_client.request.return_value = mock_response
+
+    response = await client.get("/servers", headers={"Authorization": f"Bearer {user2_access_token}"})
+    assert response.status_code == 200
+
+    # when
+    response = await client.delete(
+        f"/projects/{project.id}/users/{user2.id}",
+        headers={"Authorization": f"Bearer {user1_access_token}"}
+    )
+    assert response.status_code == 204
+
+    response = await client.get("/servers", headers={"Authorization": f"Bearer {user2_access_token}"})
+
+    # then
+    assert response.status_code == 401
+    assert response.json()["code"] == "INVALID_ACCESS_TOKEN"
+    invalidation = await db_session.scalar(select(ProjectUserInvalidation))
+    assert invalidation.user_id == user2.id
+    assert invalidation.project_id == project.id
+
+
+async def test_access_token_fail_user_not_in_project(client, db_session, mock_is_project_member):
+    # given
+    mock_is_project_member.side_effect = membership_cache.is_project_member
+
+    domain = await add_to_db(db_session, create_domain())
+    project = await add_to_db(db_session, create_project(domain_id=domain.id))
+    user = await add_to_db(db_session, create_user(domain_id=domain.id))
+    await db_session.commit()
+
+    access_token = create_access_token(user_id=user.id, project_id=project.id)
+
+    # when
+    response = await client.get("/servers", headers={"Authorization": f"Bearer {access_token}"})
+
+    # then
+    assert response.status_code == 401
+    assert response.json()["code"] == "INVALID_ACCESS_TOKEN"
+
+
+async def test_get_project_records_spans(client, db_session, mocker, tmp_path):
+    # given
+    domain = await add_to_db(db_session, create_domain())
+    project = await add_to_db(db_session, create_project(domain_id=domain.id))
+    await db_session.commit()
+    export_path = tmp_path / "spans.jsonl"
+    mocker.patch.object(tracing.envs, "TRACE_EXPORT_PATH", str(export_path))
+    tracing.init_tracing()
+
+    # when
+    try:
+        response = await client.get(f"/projects/{project.id}")
+    finally:
+        tracing.close_tracing()
+
+    # then
+    assert response.status_code == 200
+    spans = {span["name"]: span for span in map(json.loads, export_path.read_text().splitlines())}
+    root = spans["GET /projects/{project_id}"]
+    assert spans["ProjectService.get_project_detail"]["parentSpanId"] == root["spanId"]
+    assert spans["transaction"]["parentSpanId"] == spans["ProjectService.get_project_detail"]["spanId"]
+    assert spans["ProjectRepository.find_by_id"]["traceId"] == root["traceId"]
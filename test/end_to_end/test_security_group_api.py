@@ -1,3 +1,5 @@
+import asyncio
+import json
 from unittest.mock import Mock
 
 from common.domain.security_group.entity import NetworkInterfaceSecurityGroup
@@ -43,6 +45,7 @@ async def test_find_security_groups_success(client, db_session, mock_async_clien
         mock_response.status_code = 200
         mock_response.headers = {}
         mock_response.raise_for_status.return_value = None
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         return mock_response
 
     mock_async_client.request.side_effect = request_side_effect
@@ -60,6 +63,31 @@ async def test_find_security_groups_success(client, db_session, mock_async_clien
     assert len(data["security_groups"]) == 2
 
 
+async def test_find_security_groups_fail_request_timeout(client, db_session, mock_async_client):
+    # given
+    domain = await add_to_db(db_session, create_domain())
+    user = await add_to_db(db_session, create_user(domain_id=domain.id))
+    project = await add_to_db(db_session, create_project(domain_id=domain.id))
+    await add_to_db(db_session, create_security_group(project_id=project.id))
+    await db_session.commit()
+    access_token = create_access_token(user_id=user.id, project_id=project.id)
+
+    async def hanging_request(method, url, *args, **kwargs):
+        await asyncio.sleep(10)
+
+    mock_async_client.request.side_effect = hanging_request
+
+    # when
+    response = await client.get(
+        "/security-groups",
+        headers={"Authorization": f"Bearer {access_token}", "X-Request-Timeout": "0.1"}
+    )
+
+    # then
+    assert response.status_code == 504
+    assert response.json()["code"] == "REQUEST_TIMEOUT"
+
+
 async def test_get_security_group_success(client, db_session, mock_async_client):
     # given
     domain = await add_to_db(db_session, create_domain())
@@ -97,6 +125,7 @@ async def test_get_security_group_success(client, db_session, mock_async_client)
         mock_response.status_code = 200
         mock_response.headers = {}
         mock_response.raise_for_status.return_value = None
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         return mock_response
 
     mock_async_client.request.side_effect = request_side_effect
@@ -189,6 +218,7 @@ async def test_create_security_group_success(client, db_session, mock_async_clie
             raise ValueError(f"Unknown API endpoint")
         mock_response.status_code = 200
         mock_response.raise_for_status.return_value = None
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         return mock_response
 
     mock_async_client.request.side_effect = request_side_effect
@@ -300,6 +330,7 @@ async def test_update_security_group_success(client, db_session, mock_async_clie
 
         mock_response.status_code = 200
         mock_response.raise_for_status.return_value = None
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         return mock_response
 
     mock_async_client.request.side_effect = request_side_effect
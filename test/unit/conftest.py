@@ -29,6 +29,14 @@ def set_fake_system_keystone_token(mocker):
     mocker.patch("common.application.volume.service.get_system_keystone_token", return_value=system_keystone_token)
 
 
+@pytest.fixture(scope="function", autouse=True)
+def mock_invalidate_membership(mocker):
+    mock = AsyncMock()
+    mocker.patch("common.application.user.service.invalidate_membership", new=mock)
+    mocker.patch("common.application.project.service.invalidate_membership", new=mock)
+    return mock
+
+
 @pytest.fixture(scope='function')
 def mock_session():
     mock_session = AsyncMock(spec=AsyncSession)
@@ -56,6 +64,11 @@ def mock_project_user_repository():
     return AsyncMock()
 
 
+@pytest.fixture(scope='function')
+def mock_refresh_token_repository():
+    return AsyncMock()
+
+
 @pytest.fixture(scope="function")
 def mock_volume_repository():
     return AsyncMock()
@@ -122,8 +135,18 @@ def user_service(mock_user_repository, mock_keystone_client):
 
 
 @pytest.fixture(scope='function')
-def auth_service(mock_user_repository, mock_keystone_client):
-    return AuthService(user_repository=mock_user_repository, keystone_client=mock_keystone_client)
+def auth_service(
+    mock_user_repository,
+    mock_project_repository,
+    mock_refresh_token_repository,
+    mock_keystone_client
+):
+    return AuthService(
+        user_repository=mock_user_repository,
+        project_repository=mock_project_repository,
+        refresh_token_repository=mock_refresh_token_repository,
+        keystone_client=mock_keystone_client
+    )
 
 
 @pytest.fixture(scope='function')
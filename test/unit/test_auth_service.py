@@ -1,11 +1,17 @@
+from datetime import datetime, timezone, timedelta
+from unittest.mock import AsyncMock
+
 import pytest
 
-from common.application.auth.response import LoginResponse
+from common.application.auth.response import LoginResponse, TokenResponse
 from common.domain.project.entity import Project
+from common.domain.refresh_token.entity import RefreshToken
 from common.domain.user.entity import User
-from common.exception.auth_exception import InvalidAuthException
+from common.exception.auth_exception import InvalidAuthException, InvalidRefreshTokenException
 from common.exception.project_exception import ProjectAccessDeniedException
 from common.exception.user_exception import UserNotJoinedAnyProjectException
+from common.util.auth_token_manager import hash_refresh_token, encrypt_keystone_token, decrypt_keystone_token
+from common.util.context import CurrentUser
 from test.util.factory import create_project, create_user_stub
 from test.util.random import random_int, random_string
 
@@ -176,3 +182,153 @@ async def test_login_fail_has_not_project_access_permission(
             password=password,
         )
     mock_user_repository.find_by_account_id.assert_called_once()
+
+
+async def test_switch_project_success(
+    mocker,
+    mock_project_repository,
+    mock_keystone_client,
+    auth_service
+):
+    # given
+    mocker.patch("common.application.auth.service.is_project_member", new=AsyncMock(return_value=True))
+    project: Project = create_project(domain_id=random_int(), project_id=random_int(), openstack_id=random_string())
+    current_user: CurrentUser = CurrentUser(
+        user_id=random_int(),
+        user_openstack_id=random_string(),
+        project_id=random_int(),
+        project_openstack_id=random_string(),
+        keystone_token="keystone-token",
+    )
+    mock_project_repository.find_by_id.return_value = project
+    mock_keystone_client.authenticate_with_token.return_value = "rescoped-token", "2099-01-01T00:00:00.000000Z"
+
+    # when
+    result: TokenResponse = await auth_service.switch_project(current_user=current_user, project_id=project.id)
+
+    # then
+    assert result.token is not None
+    mock_project_repository.find_by_id.assert_called_once_with(project_id=project.id)
+    mock_keystone_client.authenticate_with_token.assert_called_once_with(
+        keystone_token="keystone-token",
+        project_openstack_id=project.openstack_id,
+    )
+
+
+async def test_switch_project_fail_not_member_of_project(
+    mocker,
+    mock_project_repository,
+    mock_keystone_client,
+    auth_service
+):
+    # given
+    mocker.patch("common.application.auth.service.is_project_member", new=AsyncMock(return_value=False))
+    current_user: CurrentUser = CurrentUser(
+        user_id=random_int(),
+        user_openstack_id=random_string(),
+        project_id=random_int(),
+        project_openstack_id=random_string(),
+        keystone_token="keystone-token",
+    )
+
+    # when & then
+    with pytest.raises(ProjectAccessDeniedException):
+        await auth_service.switch_project(current_user=current_user, project_id=random_int())
+    mock_project_repository.find_by_id.assert_not_called()
+    mock_keystone_client.authenticate_with_token.assert_not_called()
+
+
+def _create_stored_refresh_token(
+    refresh_token: str,
+    expires_at: datetime = datetime.now(timezone.utc) + timedelta(hours=1),
+    revoked_at: datetime | None = None,
+) -> RefreshToken:
+    return RefreshToken(
+        id=random_int(),
+        user_id=random_int(),
+        project_id=random_int(),
+        family_id="family-id",
+        token_hash=hash_refresh_token(refresh_token),
+        encrypted_keystone_token=encrypt_keystone_token("keystone-token"),
+        expires_at=expires_at,
+        revoked_at=revoked_at,
+    )
+
+
+async def test_refresh_success(
+    mocker,
+    mock_user_repository,
+    mock_project_repository,
+    mock_refresh_token_repository,
+    mock_keystone_client,
+    auth_service
+):
+    # given
+    mocker.patch("common.application.auth.service.is_project_member", new=AsyncMock(return_value=True))
+    refresh_token: str = random_string()
+    stored: RefreshToken = _create_stored_refresh_token(refresh_token=refresh_token)
+    user: User = create_user_stub(user_id=stored.user_id, domain_id=random_int())
+    project: Project = create_project(domain_id=random_int(), project_id=stored.project_id)
+
+    mock_refresh_token_repository.find_by_token_hash.return_value = stored
+    mock_refresh_token_repository.revoke_if_active.return_value = True
+    mock_user_repository.find_by_id.return_value = user
+    mock_project_repository.find_by_id.return_value = project
+    mock_keystone_client.authenticate_with_token.return_value = "rescoped-token", "2099-01-01T00:00:00.000000Z"
+
+    # when
+    result: TokenResponse = await auth_service.refresh(refresh_token=refresh_token)
+
+    # then
+    assert result.refresh_token != refresh_token
+    mock_refresh_token_repository.find_by_token_hash.assert_called_once_with(
+        token_hash=hash_refresh_token(refresh_token)
+    )
+    mock_refresh_token_repository.revoke_if_active.assert_called_once_with(refresh_token_id=stored.id)
+    mock_keystone_client.authenticate_with_token.assert_called_once_with(
+        keystone_token="keystone-token",
+        project_openstack_id=project.openstack_id,
+    )
+    new_refresh_token: RefreshToken = mock_refresh_token_repository.create.call_args.kwargs["refresh_token"]
+    assert new_refresh_token.family_id == stored.family_id
+    assert "rescoped-token" not in new_refresh_token.encrypted_keystone_token
+    assert decrypt_keystone_token(new_refresh_token.encrypted_keystone_token) == "rescoped-token"
+    assert new_refresh_token.token_hash == hash_refresh_token(result.refresh_token)
+
+
+async def test_refresh_fail_reused_refresh_token_revokes_family(
+    mock_refresh_token_repository,
+    mock_keystone_client,
+    auth_service
+):
+    # given
+    refresh_token: str = random_string()
+    mock_refresh_token_repository.find_by_token_hash.return_value = _create_stored_refresh_token(
+        refresh_token=refresh_token,
+        revoked_at=datetime.now(timezone.utc),
+    )
+
+    # when & then
+    with pytest.raises(InvalidRefreshTokenException):
+        await auth_service.refresh(refresh_token=refresh_token)
+    mock_refresh_token_repository.revoke_all_by_family_id.assert_called_once_with(family_id="family-id")
+    mock_keystone_client.authenticate_with_token.assert_not_called()
+
+
+async def test_refresh_fail_expired_refresh_token(
+    mock_refresh_token_repository,
+    mock_keystone_client,
+    auth_service
+):
+    # given
+    refresh_token: str = random_string()
+    mock_refresh_token_repository.find_by_token_hash.return_value = _create_stored_refresh_token(
+        refresh_token=refresh_token,
+        expires_at=datetime.now(timezone.utc) - timedelta(seconds=1),
+    )
+
+    # when & then
+    with pytest.raises(InvalidRefreshTokenException):
+        await auth_service.refresh(refresh_token=refresh_token)
+    mock_refresh_token_repository.revoke_if_active.assert_not_called()
+    mock_keystone_client.authenticate_with_token.assert_not_called()
@@ -0,0 +1,159 @@
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+from cryptography.fernet import Fernet, MultiFernet
+from fastapi.security import HTTPAuthorizationCredentials
+
+from common.exception.auth_exception import InvalidAccessTokenException
+from common.util import auth_token_manager
+from common.util.auth_token_manager import AccessTokenCacheStats, _VerifiedAccessTokenCache
+from common.util.context import CurrentUser
+from common.util.service_catalog import get_current_region, use_region
+from test.util.factory import create_access_token
+
+
+@pytest.fixture(autouse=True)
+def clear_access_token_cache():
+    auth_token_manager.clear_access_token_cache()
+    yield
+    auth_token_manager.clear_access_token_cache()
+
+
+@pytest.fixture(autouse=True)
+def mock_is_project_member(mocker):
+    mock = AsyncMock(return_value=True)
+    mocker.patch("common.util.auth_token_manager.is_project_member", new=mock)
+    return mock
+
+
+def _create_current_user(user_id: int) -> CurrentUser:
+    return CurrentUser(
+        user_id=user_id,
+        user_openstack_id="user-openstack-id",
+        project_id=1,
+        project_openstack_id="project-openstack-id",
+        keystone_token="keystone-token",
+    )
+
+
+async def test_get_current_user_returns_cached_user_for_same_token(mocker):
+    # given
+    token: str = create_access_token(user_id=1, project_id=2)
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    decode_spy = mocker.spy(auth_token_manager, "_decode_access_token")
+
+    # when
+    first: CurrentUser = await auth_token_manager.get_current_user(credentials)
+    second: CurrentUser = await auth_token_manager.get_current_user(credentials)
+
+    # then
+    assert first == second
+    assert first.user_id == 1
+    assert first.project_id == 2
+    assert decode_spy.call_count == 1
+    stats: AccessTokenCacheStats = auth_token_manager.get_access_token_cache_stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.size == 1
+
+
+async def test_get_current_user_does_not_cache_invalid_token():
+    # given
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="invalid-token")
+
+    # when & then
+    for _ in range(2):
+        with pytest.raises(InvalidAccessTokenException):
+            await auth_token_manager.get_current_user(credentials)
+    assert auth_token_manager.get_access_token_cache_stats().size == 0
+
+
+async def test_get_current_user_fail_user_not_in_project(mock_is_project_member):
+    # given
+    token: str = create_access_token(user_id=1, project_id=2)
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    mock_is_project_member.return_value = False
+
+    # when & then
+    with pytest.raises(InvalidAccessTokenException):
+        await auth_token_manager.get_current_user(credentials)
+    mock_is_project_member.assert_awaited_once_with(user_id=1, project_id=2)
+
+
+async def test_get_current_user_sets_project_region():
+    # given
+    token: str = create_access_token(user_id=1, project_id=2, project_region="RegionTwo")
+
+    # when
+    with use_region(None):
+        current_user: CurrentUser = await auth_token_manager.get_current_user(
+            HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        )
+        region: str | None = get_current_region()
+
+    # then
+    assert current_user.project_region == "RegionTwo"
+    assert region == "RegionTwo"
+
+
+def test_verified_access_token_cache_drops_expired_entry():
+    # given
+    cache = _VerifiedAccessTokenCache(max_size=10)
+    cache.put(b"key", current_user=_create_current_user(user_id=1), expires_at=time.time() - 1)
+
+    # when
+    result: CurrentUser | None = cache.get(b"key")
+
+    # then
+    assert result is None
+    assert cache.stats().size == 0
+    assert cache.stats().misses == 1
+
+
+def test_verified_access_token_cache_evicts_least_recently_used_entry():
+    # given
+    cache = _VerifiedAccessTokenCache(max_size=2)
+    expires_at: float = time.time() + 60
+    cache.put(b"first", current_user=_create_current_user(user_id=1), expires_at=expires_at)
+    cache.put(b"second", current_user=_create_current_user(user_id=2), expires_at=expires_at)
+    cache.get(b"first")
+
+    # when
+    cache.put(b"third", current_user=_create_current_user(user_id=3), expires_at=expires_at)
+
+    # then
+    assert cache.get(b"second") is None
+    assert cache.get(b"first").user_id == 1
+    assert cache.get(b"third").user_id == 3
+    assert cache.stats().evictions == 1
+
+
+def test_verified_access_token_cache_disabled_when_max_size_is_zero():
+    # given
+    cache = _VerifiedAccessTokenCache(max_size=0)
+
+    # when
+    cache.put(b"key", current_user=_create_current_user(user_id=1), expires_at=time.time() + 60)
+
+    # then
+    assert cache.get(b"key") is None
+    assert cache.stats().size == 0
+
+
+def test_decrypt_keystone_token_with_previous_key(mocker):
+    # given
+    previous_key: Fernet = Fernet(Fernet.generate_key())
+    encrypted_with_previous_key: str = previous_key.encrypt(b"keystone-token").decode()
+
+    # when
+    not_decryptable: str | None = auth_token_manager.decrypt_keystone_token(encrypted_with_previous_key)
+    mocker.patch.object(
+        auth_token_manager, "_KEYSTONE_TOKEN_CIPHER",
+        MultiFernet([Fernet(auth_token_manager.envs.KEYSTONE_TOKEN_ENCRYPTION_KEY), previous_key]),
+    )
+    decrypted: str | None = auth_token_manager.decrypt_keystone_token(encrypted_with_previous_key)
+
+    # then
+    assert not_decryptable is None
+    assert decrypted == "keystone-token"
@@ -0,0 +1,68 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from httpx import Request, Response
+
+from common.exception.openstack_exception import OpenStackUnavailableException, OpenStackException
+from common.infrastructure.openstack_client import OpenStackClient
+from common.util import circuit_breaker
+from common.util.circuit_breaker import CircuitBreaker, CircuitState
+
+NOVA_URL: str = "http://nova.region-one:8774/v2.1/servers"
+
+
+@pytest.fixture(autouse=True)
+def clear_circuit_breakers():
+    circuit_breaker.clear_circuit_breakers()
+    yield
+    circuit_breaker.clear_circuit_breakers()
+
+
+def test_circuit_breaker_opens_after_consecutive_failures():
+    # given
+    breaker: CircuitBreaker = CircuitBreaker(name="nova", failure_threshold=2, reset_seconds=30)
+
+    # when
+    breaker.record_failure()
+    breaker.record_failure()
+
+    # then
+    assert breaker.allow_request() is False
+    assert breaker.stats().state == CircuitState.OPEN
+
+
+def test_circuit_breaker_closes_after_successful_trial_request(mocker):
+    # given
+    breaker: CircuitBreaker = CircuitBreaker(name="nova", failure_threshold=1, reset_seconds=30)
+    breaker.record_failure()
+    mocker.patch("common.util.circuit_breaker.time.monotonic", return_value=breaker._opened_at + 30)
+
+    # when
+    is_trial_allowed: bool = breaker.allow_request()
+    is_other_allowed: bool = breaker.allow_request()
+    breaker.record_success()
+
+    # then
+    assert is_trial_allowed is True
+    assert is_other_allowed is False
+    assert breaker.stats().state == CircuitState.CLOSED
+
+
+async def test_openstack_client_rejects_request_when_circuit_is_open(mocker):
+    # given
+    mocker.patch.object(circuit_breaker.envs, "OPENSTACK_CIRCUIT_BREAKER_FAILURE_THRESHOLD", 2)
+    mock_client: AsyncMock = AsyncMock()
+    mock_client.request.return_value = Response(503, request=Request("GET", NOVA_URL))
+    mocker.patch("common.infrastructure.openstack_client.get_async_client", return_value=mock_client)
+
+    for _ in range(2):
+        with pytest.raises(OpenStackException):
+            await OpenStackClient().request(method="GET", url=NOVA_URL)
+
+    # when & then
+    with pytest.raises(OpenStackUnavailableException):
+        await OpenStackClient().request(method="GET", url="http://nova.region-one:8774/v2.1/flavors")
+    assert mock_client.request.await_count == 2
+    # 다른 region의 endpoint는 차단되지 않는다.
+    mock_client.request.return_value = Response(200, request=Request("GET", NOVA_URL))
+    await OpenStackClient().request(method="GET", url="http://nova.region-two:8774/v2.1/servers")
@@ -0,0 +1,126 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from httpx import Request, Response
+
+from common.exception.common_exception import DeadlineExceededException
+from common.infrastructure.database import session_factory
+from common.infrastructure.openstack_client import OpenStackClient
+from common.util import circuit_breaker, deadline
+from common.util.compensating_transaction import compensating_transaction
+
+NOVA_URL: str = "http://nova.region-one:8774/v2.1/servers"
+
+
+@pytest.fixture(autouse=True)
+def clear_circuit_breakers():
+    circuit_breaker.clear_circuit_breakers()
+    yield
+    circuit_breaker.clear_circuit_breakers()
+
+
+def test_use_deadline_keeps_earlier_outer_deadline():
+    # when
+    with deadline.use_deadline(1):
+        with deadline.use_deadline(60):
+            inner_remaining_seconds: float = deadline.get_remaining_seconds()
+        with deadline.use_deadline(None):
+            cleared_remaining_seconds: float | None = deadline.get_remaining_seconds()
+
+    # then
+    assert inner_remaining_seconds <= 1
+    assert cleared_remaining_seconds is None
+    assert deadline.get_remaining_seconds() is None
+
+
+async def test_wait_until_deadline_cancels_awaitable():
+    # given
+    cancelled: asyncio.Event = asyncio.Event()
+
+    async def hang() -> None:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    # when & then
+    with deadline.use_deadline(0.01):
+        with pytest.raises(DeadlineExceededException):
+            await deadline.wait_until_deadline(hang())
+    assert cancelled.is_set()
+
+
+async def test_session_factory_fail_deadline_exceeded():
+    # when & then
+    with deadline.use_deadline(0):
+        with pytest.raises(DeadlineExceededException):
+            async with session_factory():
+                pass
+
+
+async def test_openstack_client_fail_deadline_exceeded(mocker):
+    # given
+    async def hang(**kwargs) -> Response:
+        await asyncio.sleep(10)
+        return Response(200, request=Request("GET", NOVA_URL))
+
+    mock_client: AsyncMock = AsyncMock()
+    mock_client.request.side_effect = hang
+    mocker.patch("common.infrastructure.openstack_client.get_async_client", return_value=mock_client)
+
+    # when & then
+    with deadline.use_deadline(0.01):
+        with pytest.raises(DeadlineExceededException):
+            await OpenStackClient().request(method="GET", url=NOVA_URL)
+    # 요청이 취소된 것은 endpoint의 실패로 집계하지 않는다.
+    assert circuit_breaker.get_circuit_breaker_stats()[0].consecutive_failures == 0
+
+
+async def test_openstack_client_waits_for_sent_mutating_request(mocker):
+    # given
+    async def slow_create(**kwargs) -> Response:
+        await asyncio.sleep(0.05)
+        return Response(202, request=Request("POST", NOVA_URL))
+
+    mock_client: AsyncMock = AsyncMock()
+    mock_client.request.side_effect = slow_create
+    mocker.patch("common.infrastructure.openstack_client.get_async_client", return_value=mock_client)
+
+    # when
+    with deadline.use_deadline(0.01):
+        response: Response = await OpenStackClient().request(method="POST", url=NOVA_URL, json={})
+
+    # then
+    assert response.status_code == 202
+
+
+async def test_openstack_client_does_not_send_mutating_request_after_deadline(mocker):
+    # given
+    mock_client: AsyncMock = AsyncMock()
+    mocker.patch("common.infrastructure.openstack_client.get_async_client", return_value=mock_client)
+
+    # when & then
+    with deadline.use_deadline(0):
+        with pytest.raises(DeadlineExceededException):
+            await OpenStackClient().request(method="DELETE", url=NOVA_URL)
+    mock_client.request.assert_not_called()
+
+
+async def test_compensating_transaction_rollback_ignores_deadline():
+    # given
+    remaining_seconds: list[float | None] = []
+
+    async def recover() -> None:
+        remaining_seconds.append(deadline.get_remaining_seconds())
+
+    # when
+    with deadline.use_deadline(0):
+        with pytest.raises(DeadlineExceededException):
+            async with compensating_transaction() as compensating_tx:
+                compensating_tx.add_task(recover)
+                deadline.check_deadline()
+
+    # then
+    assert remaining_seconds == [None]
@@ -0,0 +1,180 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from httpx import Request, Response
+
+from common.infrastructure.openstack_client import OpenStackClient
+from common.util import circuit_breaker, hedging
+from common.util.hedging import HedgingStats
+
+ENDPOINT: str = "nova.region-one:8774 GET /v2.1/servers/{id}"
+SERVER_URL: str = "http://nova.region-one:8774/v2.1/servers/0b2f5c3e-1d1a-4c5b-9a7e-3f3e1c2d4b5a"
+
+
+@pytest.fixture(autouse=True)
+def clear_hedging(mocker):
+    mocker.patch.object(hedging.envs, "OPENSTACK_HEDGE_MIN_SAMPLES", 20)
+    mocker.patch.object(hedging.envs, "OPENSTACK_HEDGE_BUDGET_RATIO", 1.0)
+    hedging.clear_hedging()
+    circuit_breaker.clear_circuit_breakers()
+    yield
+    hedging.clear_hedging()
+    circuit_breaker.clear_circuit_breakers()
+
+
+def record_latencies(endpoint: str, duration_seconds: float, count: int = 20) -> None:
+    for _ in range(count):
+        hedging.record_latency(endpoint, duration_seconds)
+
+
+def test_get_hedge_delay_seconds():
+    # given
+    record_latencies(ENDPOINT, 0.01, count=19)
+
+    # when
+    delay_before_min_samples: float | None = hedging.get_hedge_delay_seconds(ENDPOINT)
+    hedging.record_latency(ENDPOINT, 0.01)
+    delay_seconds: float | None = hedging.get_hedge_delay_seconds(ENDPOINT)
+
+    # then
+    assert delay_before_min_samples is None
+    assert delay_seconds == pytest.approx(0.01)
+
+
+async def test_hedge_uses_first_response_and_cancels_other():
+    # given
+    record_latencies(ENDPOINT, 0.01)
+    calls: list[int] = []
+    cancelled: asyncio.Event = asyncio.Event()
+
+    async def send() -> str:
+        calls.append(len(calls))
+        if len(calls) == 1:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return "slow"
+        return "hedged"
+
+    # when
+    result: str = await hedging.hedge(ENDPOINT, send)
+
+    # then
+    stats: HedgingStats = hedging.get_hedging_stats()
+    assert result == "hedged"
+    assert cancelled.is_set()
+    assert stats.hedged == 1
+    assert stats.hedge_wins == 1
+
+
+async def test_hedge_records_cancelled_request_latency_as_lower_bound():
+    # given
+    record_latencies(ENDPOINT, 0.01)
+    calls: list[int] = []
+
+    async def send() -> str:
+        calls.append(len(calls))
+        if len(calls) == 1:
+            await asyncio.sleep(10)
+            return "slow"
+        hedging.record_latency(ENDPOINT, 0.0)
+        return "hedged"
+
+    # when
+    await hedging.hedge(ENDPOINT, send)
+
+    # then
+    latencies: list[float] = list(hedging._latencies[ENDPOINT])
+    assert len(latencies) == 21
+    assert latencies[-1] >= 0.01
+
+
+async def test_hedge_waits_for_other_request_when_first_fails():
+    # given
+    record_latencies(ENDPOINT, 0.01)
+    calls: list[int] = []
+
+    async def send() -> str:
+        calls.append(len(calls))
+        if len(calls) == 1:
+            await asyncio.sleep(0.05)
+            raise ConnectionError()
+        await asyncio.sleep(0.1)
+        return "hedged"
+
+    # when & then
+    assert await hedging.hedge(ENDPOINT, send) == "hedged"
+
+
+async def test_hedge_does_not_exceed_budget(mocker):
+    # given
+    mocker.patch.object(hedging.envs, "OPENSTACK_HEDGE_BUDGET_RATIO", 0.5)
+    record_latencies(ENDPOINT, 0.001)
+
+    async def slow_send() -> str:
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    send: AsyncMock = AsyncMock(side_effect=slow_send)
+
+    # when
+    for _ in range(4):
+        await hedging.hedge(ENDPOINT, send)
+
+    # then
+    stats: HedgingStats = hedging.get_hedging_stats()
+    assert stats.hedged == 2
+    assert stats.budget_exhausted == 2
+    assert send.await_count == 6
+
+
+async def test_openstack_client_hedges_slow_get(mocker):
+    # given
+    mocker.patch.object(hedging.envs, "OPENSTACK_HEDGING_ENABLED", True)
+    record_latencies("nova.region-one:8774 GET /v2.1/servers/{id}", 0.01)
+
+    async def request(**kwargs) -> Response:
+        if mock_client.request.await_count == 1:
+            await asyncio.sleep(10)
+        return Response(200, request=Request("GET", SERVER_URL))
+
+    mock_client: AsyncMock = AsyncMock()
+    mock_client.request.side_effect = request
+    mocker.patch("common.infrastructure.openstack_client.get_async_client", return_value=mock_client)
+
+    # when
+    response: Response = await OpenStackClient().request(method="GET", url=SERVER_URL, hedge=True)
+
+    # then
+    assert response.status_code == 200
+    assert mock_client.request.await_count == 2
+    assert hedging.get_hedging_stats().hedge_wins == 1
+
+
+async def test_openstack_client_ignores_server_error_of_hedged_request(mocker):
+    # given
+    mocker.patch.object(hedging.envs, "OPENSTACK_HEDGING_ENABLED", True)
+    record_latencies("nova.region-one:8774 GET /v2.1/servers/{id}", 0.01)
+
+    async def request(**kwargs) -> Response:
+        if mock_client.request.await_count == 1:
+            await asyncio.sleep(0.1)
+            return Response(200, request=Request("GET", SERVER_URL))
+        return Response(503, request=Request("GET", SERVER_URL))
+
+    mock_client: AsyncMock = AsyncMock()
+    mock_client.request.side_effect = request
+    mocker.patch("common.infrastructure.openstack_client.get_async_client", return_value=mock_client)
+
+    # when
+    response: Response = await OpenStackClient().request(method="GET", url=SERVER_URL, hedge=True)
+
+    # then
+    stats: HedgingStats = hedging.get_hedging_stats()
+    assert response.status_code == 200
+    assert mock_client.request.await_count == 2
+    assert stats.hedged == 1
+    assert stats.hedge_wins == 0
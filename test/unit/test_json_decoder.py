@@ -0,0 +1,15 @@
+from httpx import Request, Response
+
+from common.util import json_decoder
+
+
+def test_decode_response_json():
+    # given
+    rules: list[dict] = [{"id": f"rule-{i}", "direction": "ingress", "port_range_min": None} for i in range(100)]
+    response: Response = Response(200, json={"security_group_rules": rules}, request=Request("GET", "http://openstack"))
+
+    # when
+    body: dict = json_decoder.decode_response_json(response)
+
+    # then
+    assert body == {"security_group_rules": rules}
@@ -0,0 +1,49 @@
+import asyncio
+import time
+
+import pytest
+
+from common.util import loop_monitor
+from common.util.loop_monitor import LoopLagStats
+
+
+@pytest.fixture(autouse=True)
+async def loop_monitor_started(mocker):
+    mocker.patch.object(loop_monitor.envs, "LOOP_LAG_MONITOR_INTERVAL_SECONDS", 0.01)
+    mocker.patch.object(loop_monitor.envs, "LOOP_SLOW_CALLBACK_THRESHOLD_MS", 30)
+    loop_monitor.clear_loop_lag_stats()
+    loop_monitor.start_loop_monitor()
+    yield
+    await loop_monitor.stop_loop_monitor()
+    loop_monitor.clear_loop_lag_stats()
+
+
+async def _block_event_loop() -> None:
+    await asyncio.sleep(0)
+    time.sleep(0.05)
+
+
+async def test_loop_monitor_records_slow_callback_with_coroutine_name():
+    # when
+    await asyncio.create_task(_block_event_loop())
+
+    # then
+    stats: LoopLagStats = loop_monitor.get_loop_lag_stats()
+    assert stats.slow_callbacks == 1
+    assert stats.recent_slow_callbacks[0].callback.startswith("_block_event_loop")
+    assert stats.recent_slow_callbacks[0].duration_ms >= 50
+
+
+async def test_loop_monitor_records_lag_histogram():
+    # given
+    await asyncio.sleep(0.02)
+
+    # when
+    time.sleep(0.05)
+    await asyncio.sleep(0.02)
+
+    # then
+    stats: LoopLagStats = loop_monitor.get_loop_lag_stats()
+    assert stats.count >= 1
+    assert stats.max_ms >= 25
+    assert stats.buckets[-1][1] == stats.count
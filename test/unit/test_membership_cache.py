@@ -0,0 +1,119 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from common.domain.project.entity import ProjectUserInvalidation
+from common.util import membership_cache
+from common.util.membership_cache import MembershipCacheStats, _MembershipCache
+
+
+@pytest.fixture(autouse=True)
+def clear_membership_cache():
+    membership_cache.clear_membership_cache()
+    yield
+    membership_cache.clear_membership_cache()
+
+
+@pytest.fixture
+def mock_project_user_repository(mocker):
+    mock = AsyncMock()
+    mocker.patch("common.util.membership_cache.ProjectUserRepository", return_value=mock)
+    return mock
+
+
+async def test_is_project_member_queries_database_only_once(mock_project_user_repository):
+    # given
+    mock_project_user_repository.exists_active_membership.return_value = True
+
+    # when
+    first: bool = await membership_cache.is_project_member(user_id=1, project_id=2)
+    second: bool = await membership_cache.is_project_member(user_id=1, project_id=2)
+
+    # then
+    assert first is True
+    assert second is True
+    mock_project_user_repository.exists_active_membership.assert_awaited_once_with(project_id=2, user_id=1)
+    stats: MembershipCacheStats = membership_cache.get_membership_cache_stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+
+
+async def test_is_project_member_caches_invalid_membership(mock_project_user_repository):
+    # given
+    mock_project_user_repository.exists_active_membership.return_value = False
+
+    # when
+    first: bool = await membership_cache.is_project_member(user_id=1, project_id=2)
+    second: bool = await membership_cache.is_project_member(user_id=1, project_id=2)
+
+    # then
+    assert first is False
+    assert second is False
+    mock_project_user_repository.exists_active_membership.assert_awaited_once()
+
+
+async def test_invalidate_membership_removes_cache_and_records_invalidation(mock_project_user_repository):
+    # given
+    mock_project_user_repository.exists_active_membership.return_value = True
+    await membership_cache.is_project_member(user_id=1, project_id=2)
+
+    # when
+    await membership_cache.invalidate_membership(user_id=1, project_id=2)
+    await membership_cache.is_project_member(user_id=1, project_id=2)
+
+    # then
+    assert mock_project_user_repository.exists_active_membership.await_count == 2
+    invalidation: ProjectUserInvalidation = \
+        mock_project_user_repository.create_invalidation.await_args.kwargs["invalidation"]
+    assert invalidation.user_id == 1
+    assert invalidation.project_id == 2
+
+
+async def test_sync_membership_invalidations_applies_invalidations_from_other_workers(
+    mocker,
+    mock_project_user_repository
+):
+    # given
+    mocker.patch("common.util.membership_cache._last_invalidation_id", 10)
+    mock_project_user_repository.exists_active_membership.return_value = True
+    await membership_cache.is_project_member(user_id=1, project_id=2)
+    await membership_cache.is_project_member(user_id=1, project_id=3)
+    await membership_cache.is_project_member(user_id=4, project_id=2)
+    mock_project_user_repository.find_invalidations_after.return_value = [
+        ProjectUserInvalidation(id=11, user_id=1, project_id=None),
+    ]
+
+    # when
+    await membership_cache.sync_membership_invalidations()
+
+    # then
+    mock_project_user_repository.find_invalidations_after.assert_awaited_once_with(invalidation_id=10)
+    assert membership_cache._last_invalidation_id == 11
+    assert membership_cache.get_membership_cache_stats().size == 1
+
+
+def test_membership_cache_drops_expired_entry():
+    # given
+    cache = _MembershipCache(ttl_seconds=0, max_size=10)
+
+    # when
+    cache.put(user_id=1, project_id=2, is_member=True)
+
+    # then
+    assert cache.get(user_id=1, project_id=2) is None
+
+
+def test_membership_cache_evicts_least_recently_used_entry():
+    # given
+    cache = _MembershipCache(ttl_seconds=60, max_size=2)
+    cache.put(user_id=1, project_id=1, is_member=True)
+    cache.put(user_id=2, project_id=1, is_member=True)
+    cache.get(user_id=1, project_id=1)
+
+    # when
+    cache.put(user_id=3, project_id=1, is_member=True)
+
+    # then
+    assert cache.get(user_id=2, project_id=1) is None
+    assert cache.get(user_id=1, project_id=1) is True
+    assert cache.get(user_id=3, project_id=1) is True
@@ -0,0 +1,62 @@
+import pytest
+
+from common.exception.common_exception import MemoryTracingNotStartedException
+from common.util import memory_profiler
+from common.util.memory_profiler import AllocationDiff, MemoryStats
+
+
+class _LeakedObject:
+    pass
+
+
+@pytest.fixture(autouse=True)
+def stop_memory_tracing():
+    yield
+    memory_profiler.stop_memory_tracing()
+
+
+async def test_take_memory_snapshot_diff_reports_growth_since_previous_snapshot():
+    # given
+    memory_profiler.start_memory_tracing(frames=1)
+    leaked: list[bytes] = [bytes(1024) for _ in range(1000)]
+
+    # when
+    allocations: list[AllocationDiff] = await memory_profiler.take_memory_snapshot_diff(limit=5)
+
+    # then
+    assert allocations[0].filename == __file__
+    assert allocations[0].size_diff_bytes >= 1024 * 1000
+    assert allocations[0].count_diff >= 1000
+
+    # when: 다음 snapshot은 직전 snapshot과 비교한다.
+    allocations = await memory_profiler.take_memory_snapshot_diff(limit=5)
+
+    # then
+    assert all(allocation.size_diff_bytes < 1024 * 1000 for allocation in allocations)
+    assert len(leaked) == 1000
+
+
+async def test_take_memory_snapshot_diff_fail_not_started():
+    # when, then
+    with pytest.raises(MemoryTracingNotStartedException):
+        await memory_profiler.take_memory_snapshot_diff(limit=5)
+
+
+def test_count_objects_by_type():
+    # given
+    leaked: list[_LeakedObject] = [_LeakedObject() for _ in range(1000)]
+
+    # when
+    counts: dict[str, int] = dict(memory_profiler.count_objects_by_type(limit=1000))
+
+    # then
+    assert counts[f"{__name__}._LeakedObject"] >= len(leaked)
+
+
+def test_get_memory_stats():
+    # when
+    stats: MemoryStats = memory_profiler.get_memory_stats()
+
+    # then
+    assert 0 < stats.rss_bytes <= stats.peak_rss_bytes * 2
+    assert stats.tracing is False
@@ -0,0 +1,124 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from httpx import Request, Response
+
+from common.domain.keystone.enum import OpenStackServiceType
+from common.exception.openstack_exception import OpenStackException
+from common.infrastructure.nova.client import NovaClient
+from common.util import microversion, circuit_breaker
+from common.util.microversion import MicroversionRange, Microversion
+
+NOVA_URL: str = "http://nova:8774"
+
+
+def _version_response(max_version: str, min_version: str = "2.1") -> Response:
+    return Response(
+        200,
+        json={"version": {"id": "v2.1", "version": max_version, "min_version": min_version}},
+        request=Request("GET", f"{NOVA_URL}/v2.1"),
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_microversions(mocker):
+    mocker.patch("common.util.microversion.get_service_endpoint", return_value=NOVA_URL)
+    mocker.patch("common.infrastructure.nova.client.OpenStackClient._get_endpoint", return_value=NOVA_URL)
+    microversion.clear_microversions()
+    circuit_breaker.clear_circuit_breakers()
+    yield
+    microversion.clear_microversions()
+
+
+@pytest.fixture
+def mock_client(mocker):
+    mock = AsyncMock()
+    mocker.patch("common.util.microversion.get_async_client", return_value=mock)
+    mocker.patch("common.infrastructure.openstack_client.get_async_client", return_value=mock)
+    return mock
+
+
+async def test_negotiate_microversion_selects_highest_supported_candidate(mock_client):
+    # given
+    mock_client.get.return_value = _version_response(max_version="2.60")
+
+    # when
+    selected: str | None = await microversion.negotiate_microversion(OpenStackServiceType.COMPUTE, "2.6", "2.47", "2.96")
+
+    # then
+    assert selected == "2.47"
+
+
+async def test_get_microversion_range_is_cached(mock_client):
+    # given
+    mock_client.get.return_value = _version_response(max_version="2.60")
+
+    # when
+    first: MicroversionRange | None = await microversion.get_microversion_range(OpenStackServiceType.COMPUTE)
+    second: MicroversionRange | None = await microversion.get_microversion_range(OpenStackServiceType.COMPUTE)
+
+    # then
+    assert first == second == MicroversionRange(min_version=Microversion(2, 1), max_version=Microversion(2, 60))
+    mock_client.get.assert_awaited_once()
+
+
+async def test_discover_microversions_skips_services_without_microversion_requests(mock_client):
+    # given
+    mock_client.get.return_value = _version_response(max_version="2.60")
+
+    # when
+    await microversion.discover_microversions()
+    block_storage_range: MicroversionRange | None = await microversion.get_microversion_range(
+        OpenStackServiceType.BLOCK_STORAGE
+    )
+
+    # then
+    assert block_storage_range is None
+    mock_client.get.assert_awaited_once_with(url=f"{NOVA_URL}/v2.1")
+
+
+async def test_negotiate_microversion_returns_none_when_discovery_fails(mock_client):
+    # given
+    mock_client.get.return_value = Response(404, request=Request("GET", f"{NOVA_URL}/v2.1"))
+
+    # when
+    selected: str | None = await microversion.negotiate_microversion(OpenStackServiceType.COMPUTE, "2.6")
+
+    # then
+    assert selected is None
+
+
+async def test_get_vnc_console_uses_remote_console_api_when_supported(mock_client):
+    # given
+    mock_client.get.return_value = _version_response(max_version="2.60")
+    mock_client.request.return_value = Response(
+        200,
+        json={"remote_console": {"url": "vnc-url"}},
+        request=Request("POST", f"{NOVA_URL}/v2.1/servers/server-id/remote-consoles"),
+    )
+
+    # when
+    url: str = await NovaClient().get_vnc_console(keystone_token="token", server_openstack_id="server-id")
+
+    # then
+    assert url == "vnc-url"
+    kwargs: dict = mock_client.request.await_args.kwargs
+    assert kwargs["url"].endswith("/remote-consoles")
+    assert kwargs["headers"]["OpenStack-API-Version"] == "compute 2.6"
+
+
+async def test_rejected_microversion_invalidates_cache(mock_client):
+    # given
+    mock_client.get.return_value = _version_response(max_version="2.60")
+    mock_client.request.return_value = Response(
+        406,
+        request=Request("POST", f"{NOVA_URL}/v2.1/servers/server-id/remote-consoles"),
+    )
+
+    # when
+    with pytest.raises(OpenStackException):
+        await NovaClient().get_vnc_console(keystone_token="token", server_openstack_id="server-id")
+    await microversion.get_microversion_range(OpenStackServiceType.COMPUTE)
+
+    # then
+    assert mock_client.get.await_count == 2
@@ -0,0 +1,89 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from httpx import Request, Response
+
+from common.domain.network_interface.dto import OsNetworkInterfaceDto
+from common.domain.server.dto import OsServerDto
+from common.infrastructure.neutron.client import NeutronClient
+from common.infrastructure.nova.client import NovaClient
+from common.util import circuit_breaker
+
+NOVA_URL: str = "http://nova:8774"
+NEUTRON_URL: str = "http://neutron:9696"
+
+
+def _page(resource_key: str, resources: list[dict], has_next: bool) -> Response:
+    body: dict = {resource_key: resources}
+    if has_next:
+        body[f"{resource_key}_links"] = [{"rel": "next", "href": "https://public.example.com/next"}]
+    return Response(200, json=body, request=Request("GET", "http://openstack"))
+
+
+def _server(openstack_id: str) -> dict:
+    return {"id": openstack_id, "tenant_id": "project", "status": "ACTIVE", "os-extended-volumes:volumes_attached": []}
+
+
+@pytest.fixture(autouse=True)
+def clear_circuit_breakers():
+    circuit_breaker.clear_circuit_breakers()
+    yield
+    circuit_breaker.clear_circuit_breakers()
+
+
+@pytest.fixture
+def mock_client(mocker):
+    mock = AsyncMock()
+    mocker.patch("common.infrastructure.openstack_client.get_async_client", return_value=mock)
+    mocker.patch("common.infrastructure.nova.client.OpenStackClient._get_endpoint", return_value=NOVA_URL)
+    return mock
+
+
+async def test_iterate_servers_follows_marker_until_last_page(mock_client):
+    # given
+    mock_client.request.side_effect = [
+        _page("servers", [_server("server-1"), _server("server-2")], has_next=True),
+        _page("servers", [_server("server-3")], has_next=False),
+    ]
+
+    # when
+    servers: list[OsServerDto] = [
+        server
+        async for server in NovaClient().iterate_servers(
+            keystone_token="token",
+            project_openstack_id="project",
+            page_size=2,
+        )
+    ]
+
+    # then
+    assert [server.openstack_id for server in servers] == ["server-1", "server-2", "server-3"]
+    first_params: dict = mock_client.request.await_args_list[0].kwargs["params"]
+    second_call: dict = mock_client.request.await_args_list[1].kwargs
+    assert first_params == {"all_tenants": "true", "project_id": "project", "limit": 2}
+    assert second_call["params"]["marker"] == "server-2"
+    # next 링크의 public url 대신 현재 endpoint로 요청한다.
+    assert second_call["url"] == f"{NOVA_URL}/v2.1/servers/detail"
+
+
+async def test_iterate_network_interfaces_stops_without_next_link(mocker, mock_client):
+    # given
+    mocker.patch("common.infrastructure.neutron.client.OpenStackClient._get_endpoint", return_value=NEUTRON_URL)
+    port: dict = {
+        "id": "port-1",
+        "name": "port",
+        "network_id": "network",
+        "project_id": "project",
+        "status": "ACTIVE",
+        "fixed_ips": [{"ip_address": "10.0.0.10"}],
+    }
+    mock_client.request.return_value = _page("ports", [port], has_next=False)
+
+    # when
+    ports: list[OsNetworkInterfaceDto] = [
+        port async for port in NeutronClient().iterate_network_interfaces(keystone_token="token", page_size=1)
+    ]
+
+    # then
+    assert [port.fixed_ip_address for port in ports] == ["10.0.0.10"]
+    mock_client.request.assert_awaited_once()
@@ -0,0 +1,47 @@
+import pytest
+
+from common.exception.common_exception import PasswordHashingBusyException
+from common.util import password_hasher
+from common.util.password_hasher import PasswordHasherStats
+
+
+@pytest.fixture(scope="module", autouse=True)
+def close_password_hasher():
+    yield
+    password_hasher.close_password_hasher()
+
+
+async def test_hash_password_and_check_password():
+    # given
+    hashed_password: str = await password_hasher.hash_password("password")
+
+    # when
+    is_valid: bool = await password_hasher.check_password(password="password", hashed_password=hashed_password)
+    is_invalid: bool = await password_hasher.check_password(password="wrong", hashed_password=hashed_password)
+
+    # then
+    assert is_valid is True
+    assert is_invalid is False
+    assert password_hasher.get_password_hasher_stats().in_flight == 0
+
+
+async def test_check_password_fail_when_queue_is_full(mocker):
+    # given
+    stats: PasswordHasherStats = password_hasher.get_password_hasher_stats()
+    mocker.patch("common.util.password_hasher._in_flight", stats.max_workers + stats.max_queue_size)
+
+    # when & then
+    with pytest.raises(PasswordHashingBusyException):
+        await password_hasher.check_password(password="password", hashed_password="hashed-password")
+    assert password_hasher.get_password_hasher_stats().rejected == stats.rejected + 1
+
+
+async def test_check_password_counts_failure_separately():
+    # given
+    stats: PasswordHasherStats = password_hasher.get_password_hasher_stats()
+
+    # when & then
+    with pytest.raises(ValueError):
+        await password_hasher.check_password(password="password", hashed_password="invalid-hash")
+    assert password_hasher.get_password_hasher_stats().failed == stats.failed + 1
+    assert password_hasher.get_password_hasher_stats().completed == stats.completed
@@ -254,6 +254,7 @@ async def test_update_project_fail_access_denied(
 
 
 async def test_assign_user_success(
+    mock_invalidate_membership,
     mock_project_repository,
     mock_user_repository,
     mock_project_user_repository,
@@ -296,6 +297,7 @@ async def test_assign_user_success(
 
     mock_project_user_repository.create.assert_called_once()
     mock_keystone_client.assign_role_to_user_on_project.assert_called_once()
+    mock_invalidate_membership.assert_awaited_once_with(user_id=user2_id, project_id=project_id)
 
 
 async def test_assign_user_fail_project_not_found(
@@ -411,6 +413,7 @@ async def test_assign_user_fail_already_assigned(
 
 
 async def test_unassign_user_success(
+    mock_invalidate_membership,
     mock_project_repository,
     mock_user_repository,
     mock_project_user_repository,
@@ -443,6 +446,7 @@ async def test_unassign_user_success(
     mock_project_user_repository.exists_by_project_and_user.assert_called_once()
     mock_user_repository.find_by_id.assert_called_once()
     mock_project_user_repository.find_by_project_and_user.assert_called_once()
+    mock_invalidate_membership.assert_awaited_once_with(user_id=user_id, project_id=project_id)
 
 
 async def test_unassign_user_fail_project_not_found(
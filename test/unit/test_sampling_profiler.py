@@ -0,0 +1,64 @@
+import asyncio
+import time
+from collections import Counter
+
+import pytest
+
+from common.exception.common_exception import ProfilerBusyException
+from common.util import sampling_profiler
+
+
+def _busy_finalizer(seconds: float) -> None:
+    deadline: float = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        pass
+
+
+async def test_profile_samples_event_loop_and_worker_threads():
+    # when
+    profiling = asyncio.create_task(sampling_profiler.profile(seconds=0.2, interval_seconds=0.005))
+    await asyncio.sleep(0.02)
+    _busy_finalizer(0.05)
+    await asyncio.to_thread(_busy_finalizer, 0.05)
+    samples: Counter[tuple[str, ...]] = await profiling
+
+    # then
+    busy_stacks: list[tuple[str, ...]] = [stack for stack in samples if stack[-1].startswith("_busy_finalizer")]
+    assert any(stack[0] == "MainThread" for stack in busy_stacks)
+    assert any(stack[0] != "MainThread" for stack in busy_stacks)
+    assert all("test/unit/test_sampling_profiler.py" in stack[-1] for stack in busy_stacks)
+
+
+async def test_profile_rejects_concurrent_profiling():
+    # given
+    profiling = asyncio.create_task(sampling_profiler.profile(seconds=0.05, interval_seconds=0.01))
+    await asyncio.sleep(0)
+
+    # when, then
+    with pytest.raises(ProfilerBusyException):
+        await sampling_profiler.profile(seconds=0.05, interval_seconds=0.01)
+    await profiling
+
+
+def test_to_collapsed_orders_stacks_by_sample_count():
+    # given
+    samples: Counter[tuple[str, ...]] = Counter({("MainThread", "a", "b"): 1, ("MainThread", "a", "c"): 3})
+
+    # when
+    collapsed: str = sampling_profiler.to_collapsed(samples)
+
+    # then
+    assert collapsed == "MainThread;a;c 3\nMainThread;a;b 1\n"
+
+
+def test_to_speedscope_shares_frames_between_stacks():
+    # given
+    samples: Counter[tuple[str, ...]] = Counter({("MainThread", "a", "b"): 1, ("MainThread", "a", "c"): 3})
+
+    # when
+    speedscope: dict = sampling_profiler.to_speedscope(samples, interval_seconds=0.005, name="test")
+
+    # then
+    assert [frame["name"] for frame in speedscope["shared"]["frames"]] == ["MainThread", "a", "b", "c"]
+    assert speedscope["profiles"][0]["samples"] == [[0, 1, 2], [0, 1, 3]]
+    assert speedscope["profiles"][0]["weights"] == [5.0, 15.0]
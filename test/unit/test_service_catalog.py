@@ -0,0 +1,108 @@
+import pytest
+
+from common.domain.keystone.enum import OpenStackServiceType
+from common.exception.openstack_exception import OpenStackRegionNotFoundException
+from common.util import service_catalog
+from common.util.envs import get_envs, Envs
+
+envs: Envs = get_envs()
+
+CATALOG: list[dict] = [
+    {
+        "type": "compute",
+        "endpoints": [
+            {"interface": "public", "region_id": "RegionOne", "url": "https://compute.example.com/v2.1"},
+            {"interface": "internal", "region_id": "RegionOne", "url": "http://10.0.0.1:8774/v2.1/"},
+            {"interface": "internal", "region_id": "RegionTwo", "url": "http://10.0.1.1:8774/v2.1"},
+        ],
+    },
+    {
+        "type": "volumev3",
+        "endpoints": [
+            {"interface": "internal", "region_id": "RegionOne", "url": "http://10.0.0.1:8776/v3/project-id"},
+        ],
+    },
+    {
+        "type": "network",
+        "endpoints": [
+            {"interface": "internal", "region_id": "RegionOne", "url": "http://10.0.0.1:9696"},
+        ],
+    },
+    {
+        "type": "placement",
+        "endpoints": [
+            {"interface": "internal", "region_id": "RegionOne", "url": "http://10.0.0.1/placement"},
+        ],
+    },
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_service_catalog():
+    service_catalog.clear_service_catalog()
+    yield
+    service_catalog.clear_service_catalog()
+
+
+def test_get_service_endpoint_uses_configured_region_and_interface(mocker):
+    # given
+    mocker.patch.object(envs, "OPENSTACK_REGION_NAME", "RegionTwo")
+    mocker.patch.object(envs, "OPENSTACK_ENDPOINT_INTERFACE", "internal")
+    service_catalog.update_service_catalog(catalog=CATALOG, keystone_token="token")
+
+    # when
+    endpoint: str = service_catalog.get_service_endpoint(OpenStackServiceType.COMPUTE)
+
+    # then
+    assert endpoint == "http://10.0.1.1:8774"
+
+
+def test_get_service_endpoint_strips_api_version(mocker):
+    # given
+    mocker.patch.object(envs, "OPENSTACK_ENDPOINT_INTERFACE", "internal")
+    service_catalog.update_service_catalog(catalog=CATALOG, keystone_token="token")
+
+    # when & then
+    assert service_catalog.get_service_endpoint(OpenStackServiceType.COMPUTE) == "http://10.0.0.1:8774"
+    assert service_catalog.get_service_endpoint(OpenStackServiceType.BLOCK_STORAGE) == "http://10.0.0.1:8776"
+    assert service_catalog.get_service_endpoint(OpenStackServiceType.NETWORK) == "http://10.0.0.1:9696"
+
+
+def test_get_service_endpoint_falls_back_to_configured_url():
+    # given
+    service_catalog.update_service_catalog(catalog=CATALOG, keystone_token="token")
+
+    # when
+    endpoint: str = service_catalog.get_service_endpoint(OpenStackServiceType.NETWORK)
+
+    # then
+    assert endpoint == f"{envs.OPENSTACK_SERVER_URL}:{envs.NEUTRON_PORT}"
+    assert service_catalog.get_service_catalog_stats().fallbacks == 1
+
+
+def test_get_service_endpoint_uses_region_of_current_request(mocker):
+    # given
+    mocker.patch.object(envs, "OPENSTACK_ENDPOINT_INTERFACE", "internal")
+    service_catalog.update_service_catalog(catalog=CATALOG, keystone_token="token")
+
+    # when
+    with service_catalog.use_region("RegionTwo"):
+        endpoint: str = service_catalog.get_service_endpoint(OpenStackServiceType.COMPUTE)
+
+    # then
+    assert endpoint == "http://10.0.1.1:8774"
+    assert service_catalog.get_service_endpoint(OpenStackServiceType.COMPUTE) == "http://10.0.0.1:8774"
+
+
+def test_get_service_endpoint_fail_requested_region_not_in_catalog(mocker):
+    # given
+    mocker.patch.object(envs, "OPENSTACK_ENDPOINT_INTERFACE", "internal")
+    service_catalog.update_service_catalog(catalog=CATALOG, keystone_token="token")
+
+    # when & then
+    with pytest.raises(OpenStackRegionNotFoundException):
+        service_catalog.get_service_endpoint(OpenStackServiceType.COMPUTE, region="RegionThree")
+    with service_catalog.use_region("RegionThree"):
+        with pytest.raises(OpenStackRegionNotFoundException):
+            service_catalog.get_service_endpoint(OpenStackServiceType.COMPUTE)
+    assert service_catalog.get_service_catalog_stats().fallbacks == 0
@@ -0,0 +1,87 @@
+import logging
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from common.infrastructure import database
+from common.util import slow_log
+from common.util.slow_log import SlowOperationKind, SlowOperationStats
+
+
+@pytest.fixture(autouse=True)
+def clear_slow_logs():
+    slow_log.clear_slow_logs()
+    yield
+    slow_log.clear_slow_logs()
+
+
+def test_normalize_sql():
+    # given
+    statement: str = "SELECT server.id\n  FROM server WHERE server.id IN (?, ?, ?) AND server.name = 'web''s' LIMIT 10"
+
+    # when, then
+    assert slow_log.normalize_sql(statement) == "SELECT server.id FROM server WHERE server.id IN (?) AND server.name = ? LIMIT ?"
+
+
+def test_normalize_openstack_url():
+    # when, then
+    assert slow_log.normalize_openstack_url("POST", "/v2.1/servers/0b2f5c3e-1d1a-4c5b-9a7e-3f3e1c2d4b5a/action") \
+        == "POST /v2.1/servers/{id}/action"
+    assert slow_log.normalize_openstack_url("GET", "/v3/volumes/detail") == "GET /v3/volumes/detail"
+
+
+def test_is_slow(mocker):
+    # given
+    mocker.patch.object(slow_log.envs, "SLOW_QUERY_THRESHOLD_MS", 100)
+    mocker.patch.object(slow_log.envs, "SLOW_OPENSTACK_CALL_THRESHOLD_MS", 0)
+
+    # when, then
+    assert slow_log.is_slow(SlowOperationKind.QUERY, 100) is True
+    assert slow_log.is_slow(SlowOperationKind.QUERY, 99.9) is False
+    assert slow_log.is_slow(SlowOperationKind.OPENSTACK_CALL, 10_000) is False
+
+
+def test_record_slow_operation_deduplicates_by_fingerprint(mocker, caplog):
+    # given
+    mocker.patch.object(slow_log.envs, "SLOW_LOG_WINDOW_SECONDS", 60)
+    caplog.set_level(logging.WARNING, logger=slow_log.__name__)
+
+    # when
+    with slow_log.use_operation("ServerService.find_servers_details"):
+        for duration_ms in (300, 500, 400):
+            slow_log.record_slow_operation(SlowOperationKind.QUERY, "SELECT ?", duration_ms, rows=3)
+
+    # then
+    stats: list[SlowOperationStats] = slow_log.get_slow_log_stats()
+    assert len(caplog.records) == 1
+    assert caplog.records[0].operation == "ServerService.find_servers_details"
+    assert caplog.records[0].rows == 3
+    assert stats[0].count == 3
+    assert stats[0].max_ms == 500
+
+    # when
+    slow_log.flush_slow_logs(force=True)
+
+    # then
+    assert caplog.records[1].count == 3
+    assert caplog.records[1].avg_ms == 400
+    assert slow_log.get_slow_log_stats() == []
+
+
+async def test_slow_query_is_recorded_with_normalized_statement(mocker):
+    # given
+    engine: AsyncEngine = database.create_database_engine("sqlite+aiosqlite://")
+    mocker.patch("common.infrastructure.database.is_slow", return_value=True)
+    record_slow_operation = mocker.patch("common.infrastructure.database.record_slow_operation")
+
+    # when
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT 1 WHERE 'a' = 'a'"))
+    await engine.dispose()
+
+    # then
+    args, kwargs = record_slow_operation.call_args
+    assert args[0] == SlowOperationKind.QUERY
+    assert args[1] == "SELECT ? WHERE ? = ?"
+    assert kwargs == {"rows": None}
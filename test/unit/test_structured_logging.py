@@ -0,0 +1,111 @@
+import json
+import logging
+import queue
+
+import pytest
+
+from common.util import structured_logging
+from common.util.structured_logging import JsonFormatter, LoggingStats
+
+logger: logging.Logger = logging.getLogger("test.structured_logging")
+
+
+@pytest.fixture
+def restore_logging(mocker):
+    mocker.patch.object(structured_logging.envs, "LOG_SAMPLE_RATES", {"test.structured_logging.noisy": 0.0})
+    root_level: int = logging.getLogger().level
+    yield
+    structured_logging.close_logging()
+    logging.getLogger().setLevel(root_level)
+
+
+def _read_logs(capsys) -> list[dict]:
+    structured_logging.close_logging()
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines() if line.startswith("{")]
+
+
+def test_logs_are_written_as_json_with_request_id(restore_logging, capsys):
+    # given
+    structured_logging.init_logging()
+
+    # when
+    with structured_logging.use_request_id("request-1"):
+        logger.info("Server was created. server_id=%d", 1, extra={"project_id": 2})
+    logger.info("Outside of request")
+
+    # then
+    logs: list[dict] = _read_logs(capsys)
+    assert logs[0]["message"] == "Server was created. server_id=1"
+    assert logs[0]["level"] == "INFO"
+    assert logs[0]["logger"] == "test.structured_logging"
+    assert logs[0]["request_id"] == "request-1"
+    assert logs[0]["project_id"] == 2
+    assert "request_id" not in logs[1]
+
+
+def test_exception_traceback_is_logged(restore_logging, capsys):
+    # given
+    structured_logging.init_logging()
+
+    # when
+    try:
+        raise ValueError("invalid")
+    except ValueError as ex:
+        logger.error("Failed", exc_info=ex)
+
+    # then
+    logs: list[dict] = _read_logs(capsys)
+    assert "ValueError: invalid" in logs[0]["exception"]
+
+
+def test_message_is_formatted_when_logged(restore_logging, capsys):
+    # given
+    structured_logging.init_logging()
+    server: dict = {"status": "BUILD"}
+
+    # when
+    logger.info("server=%s", server)
+    server["status"] = "ACTIVE"
+
+    # then
+    assert _read_logs(capsys)[0]["message"] == "server={'status': 'BUILD'}"
+
+
+def test_sampling_drops_only_logs_below_warning(restore_logging, capsys):
+    # given
+    structured_logging.init_logging()
+    noisy_logger: logging.Logger = logging.getLogger("test.structured_logging.noisy.query")
+
+    # when
+    noisy_logger.info("SELECT 1")
+    noisy_logger.warning("Slow query")
+    stats: LoggingStats = structured_logging.get_logging_stats()
+
+    # then
+    assert [log["message"] for log in _read_logs(capsys)] == ["Slow query"]
+    assert stats.sampled_out == 1
+
+
+def test_queue_handler_drops_logs_when_queue_is_full():
+    # given
+    handler = structured_logging._NonBlockingQueueHandler(queue.Queue(maxsize=1))
+    record: logging.LogRecord = logging.LogRecord("test", logging.INFO, __file__, 1, "message", None, None)
+
+    # when
+    handler.handle(record)
+    handler.handle(record)
+
+    # then
+    assert handler.queue.qsize() == 1
+    assert handler.dropped == 1
+
+
+def test_json_formatter_formats_message_lazily():
+    # given
+    record: logging.LogRecord = logging.LogRecord("test", logging.INFO, __file__, 1, "volume=%s", ("vol-1",), None)
+
+    # when
+    log: dict = json.loads(JsonFormatter().format(record))
+
+    # then
+    assert log["message"] == "volume=vol-1"
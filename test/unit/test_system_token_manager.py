@@ -0,0 +1,314 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from httpx import Request, Response
+from sqlalchemy.exc import OperationalError
+
+from common.domain.keystone.entity import SystemKeystoneToken
+from common.domain.keystone.enum import OpenStackServiceType
+from common.domain.keystone.model import KeystoneToken
+from common.exception.openstack_exception import SystemKeystoneTokenUnavailableException
+from common.infrastructure import database
+from common.infrastructure.openstack_client import OpenStackClient
+from common.util import system_token_manager, service_catalog
+from common.util.auth_token_manager import encrypt_keystone_token
+
+KEYSTONE_URL: str = "http://keystone/v3/auth/tokens"
+
+
+CATALOG: list[dict] = [
+    {
+        "type": "compute",
+        "endpoints": [{"interface": "public", "region_id": "RegionOne", "url": "http://nova.example.com/v2.1"}],
+    }
+]
+
+
+def _token_response(token: str, status_code: int = 201, catalog: list[dict] | None = None) -> Response:
+    expires_at: datetime = datetime.now(timezone.utc) + timedelta(hours=1)
+    return Response(
+        status_code=status_code,
+        headers={"x-subject-token": token},
+        json={"token": {"expires_at": expires_at.strftime("%Y-%m-%dT%H:%M:%S.%fZ"), "catalog": catalog or []}},
+        request=Request("POST", KEYSTONE_URL),
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_system_token(mocker):
+    mocker.patch("common.util.system_token_manager._admin_keystone_token", None)
+    mocker.patch("common.util.system_token_manager._admin_keystone_token_issued_at", None)
+    mocker.patch("common.util.system_token_manager._previous_admin_keystone_token", None)
+    mocker.patch("common.util.system_token_manager._refresh_task", None)
+    mocker.patch("asyncio.sleep", new=AsyncMock())
+    service_catalog.clear_service_catalog()
+    yield
+    service_catalog.clear_service_catalog()
+
+
+@pytest.fixture(autouse=True)
+def mock_system_keystone_token_repository(mocker):
+    mock = AsyncMock()
+    mock.find.return_value = None
+    mock.acquire_lease.return_value = True
+    mock.save_token_and_release_lease.return_value = True
+    mocker.patch("common.util.system_token_manager.SystemKeystoneTokenRepository", return_value=mock)
+    return mock
+
+
+def _shared_token(token: str, expires_in: timedelta = timedelta(hours=1)) -> SystemKeystoneToken:
+    now: datetime = datetime.now(timezone.utc)
+    return SystemKeystoneToken(
+        id=SystemKeystoneToken.ID, token=encrypt_keystone_token(token), expires_at=now + expires_in, issued_at=now
+    )
+
+
+@pytest.fixture
+def mock_keystone_client(mocker):
+    mock = AsyncMock()
+    mock.get.return_value = Response(200, json={"catalog": []}, request=Request("GET", KEYSTONE_URL))
+    mocker.patch("common.util.system_token_manager.get_async_client", return_value=mock)
+    return mock
+
+
+def _set_system_token(mocker, expires_in: timedelta, issued_ago: timedelta = timedelta(0)) -> None:
+    now: datetime = datetime.now(timezone.utc)
+    mocker.patch(
+        "common.util.system_token_manager._admin_keystone_token",
+        KeystoneToken(token="old-token", expires_at=now + expires_in)
+    )
+    mocker.patch("common.util.system_token_manager._admin_keystone_token_issued_at", now - issued_ago)
+
+
+def test_get_system_keystone_token_fail_when_token_is_expired(mocker):
+    # given
+    _set_system_token(mocker, expires_in=timedelta(seconds=-1))
+
+    # when & then
+    with pytest.raises(SystemKeystoneTokenUnavailableException):
+        system_token_manager.get_system_keystone_token()
+
+
+async def test_refresh_if_needed_skips_fresh_token(mocker, mock_keystone_client):
+    # given
+    _set_system_token(mocker, expires_in=timedelta(hours=1))
+
+    # when
+    await system_token_manager.refresh_system_keystone_token_if_needed()
+
+    # then
+    mock_keystone_client.post.assert_not_awaited()
+    assert system_token_manager.get_system_keystone_token() == "old-token"
+
+
+async def test_refresh_if_needed_refreshes_token_close_to_expiry(mocker, mock_keystone_client):
+    # given
+    _set_system_token(mocker, expires_in=timedelta(seconds=60))
+    mock_keystone_client.post.return_value = _token_response("new-token")
+
+    # when
+    await system_token_manager.refresh_system_keystone_token_if_needed()
+
+    # then
+    mock_keystone_client.post.assert_awaited_once()
+    assert system_token_manager.get_system_keystone_token() == "new-token"
+
+
+async def test_concurrent_refreshes_issue_token_only_once(mock_keystone_client):
+    # given
+    async def post(**kwargs) -> Response:
+        await asyncio.sleep(0)
+        return _token_response("new-token")
+
+    mock_keystone_client.post.side_effect = post
+
+    # when
+    tokens: list[str] = await asyncio.gather(
+        system_token_manager.refresh_system_keystone_token(),
+        system_token_manager.refresh_system_keystone_token(),
+    )
+
+    # then
+    assert tokens == ["new-token", "new-token"]
+    mock_keystone_client.post.assert_awaited_once()
+
+
+async def test_refresh_does_not_use_session_of_caller(mock_keystone_client, mock_system_keystone_token_repository):
+    # given
+    mock_keystone_client.post.return_value = _token_response("new-token")
+    sessions: list = []
+    mock_system_keystone_token_repository.find.side_effect = lambda: sessions.append(database._async_session.get())
+    token = database._async_session.set(Mock())
+
+    # when
+    try:
+        await system_token_manager.refresh_system_keystone_token()
+    finally:
+        database._async_session.reset(token)
+
+    # then
+    assert sessions and all(session is None for session in sessions)
+
+
+async def test_refresh_retries_server_error(mock_keystone_client):
+    # given
+    mock_keystone_client.post.side_effect = [
+        _token_response("", status_code=503),
+        _token_response("new-token"),
+    ]
+
+    # when
+    token: str = await system_token_manager.refresh_system_keystone_token()
+
+    # then
+    assert token == "new-token"
+    assert mock_keystone_client.post.await_count == 2
+
+
+async def test_openstack_client_retries_with_refreshed_token_on_unauthorized(mocker, mock_keystone_client):
+    # given
+    _set_system_token(mocker, expires_in=timedelta(hours=1))
+    mock_keystone_client.post.return_value = _token_response("new-token")
+    mock_openstack: AsyncMock = AsyncMock()
+    mock_openstack.request.side_effect = [
+        Response(401, request=Request("GET", "http://nova/servers")),
+        Response(200, json={"servers": []}, request=Request("GET", "http://nova/servers")),
+    ]
+    mocker.patch("common.infrastructure.openstack_client.get_async_client", return_value=mock_openstack)
+
+    # when
+    response: Response = await OpenStackClient().request(
+        method="GET",
+        url="http://nova/servers",
+        headers={"X-Auth-Token": "old-token"},
+    )
+
+    # then
+    assert response.status_code == 200
+    assert mock_openstack.request.await_args_list[1].kwargs["headers"]["X-Auth-Token"] == "new-token"
+    mock_keystone_client.post.assert_awaited_once()
+
+
+async def test_refresh_saves_issued_token_to_shared_store(mock_keystone_client, mock_system_keystone_token_repository):
+    # given
+    mock_keystone_client.post.return_value = _token_response("new-token")
+
+    # when
+    token: str = await system_token_manager.refresh_system_keystone_token()
+
+    # then
+    assert token == "new-token"
+    mock_system_keystone_token_repository.save_token_and_release_lease.assert_awaited_once()
+    assert mock_system_keystone_token_repository.save_token_and_release_lease.await_args.kwargs["token"] == "new-token"
+
+
+async def test_refresh_uses_token_refreshed_by_other_worker(
+    mocker,
+    mock_keystone_client,
+    mock_system_keystone_token_repository
+):
+    # given
+    _set_system_token(mocker, expires_in=timedelta(seconds=60))
+    mock_system_keystone_token_repository.find.return_value = _shared_token("shared-token")
+
+    # when
+    await system_token_manager.refresh_system_keystone_token_if_needed()
+
+    # then
+    assert system_token_manager.get_system_keystone_token() == "shared-token"
+    mock_keystone_client.post.assert_not_awaited()
+    mock_system_keystone_token_repository.acquire_lease.assert_not_awaited()
+
+
+async def test_refresh_waits_for_leader_when_lease_is_taken(mock_keystone_client, mock_system_keystone_token_repository):
+    # given
+    mock_system_keystone_token_repository.find.side_effect = [None, _shared_token("shared-token")]
+    mock_system_keystone_token_repository.acquire_lease.return_value = False
+
+    # when
+    token: str = await system_token_manager.refresh_system_keystone_token()
+
+    # then
+    assert token == "shared-token"
+    mock_keystone_client.post.assert_not_awaited()
+
+
+async def test_refresh_ignores_shared_token_rejected_by_openstack(
+    mocker,
+    mock_keystone_client,
+    mock_system_keystone_token_repository
+):
+    # given
+    _set_system_token(mocker, expires_in=timedelta(hours=1))
+    mock_system_keystone_token_repository.find.return_value = _shared_token("old-token")
+    mock_keystone_client.post.return_value = _token_response("new-token")
+
+    # when
+    token: str | None = await system_token_manager.refresh_system_keystone_token_on_unauthorized("old-token")
+
+    # then
+    assert token == "new-token"
+    mock_keystone_client.post.assert_awaited_once()
+
+
+async def test_refresh_ignores_shared_token_that_cannot_be_decrypted(
+    mock_keystone_client,
+    mock_system_keystone_token_repository
+):
+    # given
+    shared_token: SystemKeystoneToken = _shared_token("shared-token")
+    shared_token.token = "plain-shared-token"
+    mock_system_keystone_token_repository.find.return_value = shared_token
+    mock_keystone_client.post.return_value = _token_response("new-token")
+
+    # when
+    token: str = await system_token_manager.refresh_system_keystone_token()
+
+    # then
+    assert token == "new-token"
+    mock_keystone_client.post.assert_awaited_once()
+
+
+async def test_refresh_issues_token_when_shared_store_is_unavailable(
+    mock_keystone_client,
+    mock_system_keystone_token_repository
+):
+    # given
+    mock_system_keystone_token_repository.find.side_effect = OperationalError("SELECT", {}, Exception("down"))
+    mock_keystone_client.post.return_value = _token_response("new-token")
+
+    # when
+    token: str = await system_token_manager.refresh_system_keystone_token()
+
+    # then
+    assert token == "new-token"
+
+
+async def test_refresh_updates_service_catalog_from_token_response(mock_keystone_client):
+    # given
+    mock_keystone_client.post.return_value = _token_response("new-token", catalog=CATALOG)
+
+    # when
+    await system_token_manager.refresh_system_keystone_token()
+
+    # then
+    assert service_catalog.get_service_endpoint(OpenStackServiceType.COMPUTE) == "http://nova.example.com"
+    mock_keystone_client.get.assert_not_awaited()
+
+
+async def test_refresh_loads_service_catalog_for_token_refreshed_by_other_worker(
+    mock_keystone_client,
+    mock_system_keystone_token_repository
+):
+    # given
+    mock_system_keystone_token_repository.find.return_value = _shared_token("shared-token")
+    mock_keystone_client.get.return_value = Response(200, json={"catalog": CATALOG}, request=Request("GET", KEYSTONE_URL))
+
+    # when
+    await system_token_manager.refresh_system_keystone_token()
+
+    # then
+    assert service_catalog.get_service_endpoint(OpenStackServiceType.COMPUTE) == "http://nova.example.com"
+    assert mock_keystone_client.get.await_args.kwargs["headers"] == {"X-Auth-Token": "shared-token"}
@@ -0,0 +1,98 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from common.util import tracing
+from common.util.tracing import Span, SpanKind
+
+
+@pytest.fixture
+def export_path(mocker, tmp_path) -> Path:
+    path: Path = tmp_path / "spans.jsonl"
+    mocker.patch.object(tracing.envs, "TRACE_EXPORT_PATH", str(path))
+    mocker.patch.object(tracing.envs, "TRACE_SAMPLE_RATIO", 1.0)
+    tracing.init_tracing()
+    yield path
+    tracing.close_tracing()
+
+
+def _read_spans(path: Path) -> dict[str, dict]:
+    tracing.close_tracing()
+    spans: list[dict] = [json.loads(line) for line in path.read_text().splitlines()]
+    return {span["name"]: span for span in spans}
+
+
+@tracing.trace_methods
+class _Repository:
+    async def find(self) -> str:
+        return "found"
+
+    async def fail(self) -> None:
+        raise ValueError("not found")
+
+
+async def test_start_span_links_children_across_tasks(export_path):
+    # when
+    with tracing.start_span(name="root", kind=SpanKind.SERVER) as root:
+        root.set_attribute("http.status_code", 200)
+        await _Repository().find()
+        # BackgroundTasks, create_task 등 같은 context에서 실행되는 작업도 root의 자식이 된다.
+        await asyncio.create_task(_Repository().find())
+
+    # then
+    spans: dict[str, dict] = _read_spans(export_path)
+    assert spans["root"]["kind"] == SpanKind.SERVER.value
+    assert "parentSpanId" not in spans["root"]
+    assert spans["root"]["attributes"] == [{"key": "http.status_code", "value": {"intValue": "200"}}]
+    assert spans["_Repository.find"]["traceId"] == spans["root"]["traceId"]
+    assert spans["_Repository.find"]["parentSpanId"] == spans["root"]["spanId"]
+
+
+async def test_traced_records_error_status(export_path):
+    # when
+    with pytest.raises(ValueError):
+        await _Repository().fail()
+
+    # then
+    spans: dict[str, dict] = _read_spans(export_path)
+    assert spans["_Repository.fail"]["status"] == {"code": 2, "message": "ValueError: not found"}
+
+
+async def test_start_span_continues_remote_trace(export_path):
+    # given
+    traceparent: str = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+
+    # when
+    with tracing.start_span(name="root", traceparent=traceparent):
+        pass
+
+    # then
+    spans: dict[str, dict] = _read_spans(export_path)
+    assert spans["root"]["traceId"] == "0af7651916cd43dd8448eb211c80319c"
+    assert spans["root"]["parentSpanId"] == "b7ad6b7169203331"
+
+
+async def test_start_span_does_not_export_unsampled_trace(export_path, mocker):
+    # given
+    mocker.patch.object(tracing.envs, "TRACE_SAMPLE_RATIO", 0.0)
+
+    # when
+    with tracing.start_span(name="root"):
+        await _Repository().find()
+
+    # then
+    assert _read_spans(export_path) == {}
+
+
+async def test_start_span_is_no_op_when_disabled():
+    # when
+    with tracing.start_span(name="root") as span:
+        span.set_attribute("key", "value")
+
+    # then
+    assert isinstance(span, Span)
+    assert span.sampled is False
+    assert span.attributes == {}
+    assert tracing.get_tracing_stats().enabled is False
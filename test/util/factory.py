@@ -408,6 +408,7 @@ def create_access_token(
     project_openstack_id: str = random_string(),
     keystone_token: str = random_string(),
     keystone_token_expires_at: datetime = datetime.now(timezone.utc) + timedelta(minutes=60),
+    project_region: str | None = None,
 ) -> str:
     return auth_token_manager.create_access_token(
         user_id=user_id,
@@ -417,7 +418,8 @@ def create_access_token(
         keystone_token=KeystoneToken(
             token=keystone_token,
             expires_at=keystone_token_expires_at
-        )
+        ),
+        project_region=project_region,
     )
 
 